@@ -2,8 +2,9 @@
 Core agent framework for Chalice
 Supports dynamic loading, communication, and collaboration
 """
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, DefaultDict, Deque, TextIO, Tuple, Union
 from pathlib import Path
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import json
 import re
@@ -56,17 +57,43 @@ class Agent:
         self.conversation_history.clear()
 
 
+# Agent definition source: a Markdown file path, an open text file, or the
+# Markdown itself (any string containing a newline)
+AgentSource = Union[Path, str, TextIO]
+
+
 class AgentLoader:
     """Load agents from Markdown files"""
 
     @staticmethod
-    def parse_markdown_agent(file_path: Path) -> Optional[AgentMetadata]:
-        """Parse agent definition from Markdown file"""
+    def _source_path(source: AgentSource) -> Optional[Path]:
+        """File path of an agent source, or None for in-memory sources"""
+        if hasattr(source, 'read') or (isinstance(source, str) and '\n' in source):
+            return None
+        return Path(source)
+
+    @staticmethod
+    def _read_source(source: AgentSource) -> Tuple[str, str]:
+        """
+        Read an agent definition
+
+        Returns:
+            tuple: (Markdown content, default agent name)
+        """
+        file_path = AgentLoader._source_path(source)
+        if file_path is not None:
+            return file_path.read_text(encoding='utf-8'), file_path.stem
+        if hasattr(source, 'read'):
+            return source.read(), Path(getattr(source, 'name', 'agent')).stem
+        return source, 'agent'
+
+    @staticmethod
+    def parse_markdown_agent(source: AgentSource) -> Optional[AgentMetadata]:
+        """Parse agent definition from a Markdown file, file object or string"""
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content, name = AgentLoader._read_source(source)
 
             # Extract metadata
-            name = file_path.stem
             version = "1.0.0"
             description = ""
             capabilities = []
@@ -137,15 +164,15 @@ class AgentLoader:
             )
 
         except Exception as e:
-            print(f"Error parsing agent file {file_path}: {e}")
+            print(f"Error parsing agent file {source}: {e}")
             return None
 
     @staticmethod
-    def load_agent(file_path: Path) -> Optional[Agent]:
-        """Load an agent from a Markdown file"""
-        metadata = AgentLoader.parse_markdown_agent(file_path)
+    def load_agent(source: AgentSource) -> Optional[Agent]:
+        """Load an agent from a Markdown file, file object or string"""
+        metadata = AgentLoader.parse_markdown_agent(source)
         if metadata:
-            return Agent(metadata, file_path)
+            return Agent(metadata, AgentLoader._source_path(source))
         return None
 
 
@@ -210,7 +237,8 @@ class AgentCommunicator:
 
     def __init__(self, registry: AgentRegistry):
         self.registry = registry
-        self.message_queue: List[Dict[str, Any]] = []
+        # Undelivered messages per recipient, oldest first
+        self.inboxes: DefaultDict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
 
     def send_message(
         self,
@@ -220,7 +248,7 @@ class AgentCommunicator:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """Send a message from one agent to another"""
-        self.message_queue.append({
+        self.inboxes[to_agent].append({
             "from": from_agent,
             "to": to_agent,
             "message": message,
@@ -229,14 +257,13 @@ class AgentCommunicator:
 
     def get_messages_for(self, agent_name: str) -> List[Dict[str, Any]]:
         """Get all messages for a specific agent"""
-        messages = [msg for msg in self.message_queue if msg["to"] == agent_name]
-        # Remove delivered messages
-        self.message_queue = [msg for msg in self.message_queue if msg["to"] != agent_name]
-        return messages
+        # Delivering empties the recipient's inbox
+        inbox = self.inboxes.pop(agent_name, None)
+        return list(inbox) if inbox else []
 
     def broadcast(self, from_agent: str, message: str, metadata: Optional[Dict[str, Any]] = None):
         """Broadcast a message to all agents"""
-        for agent in self.registry.get_all():
+        for agent in self.registry.agents.values():
             if agent.name != from_agent:
                 self.send_message(from_agent, agent.name, message, metadata)
 
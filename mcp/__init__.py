@@ -7,7 +7,9 @@ from .client import (
     MCPServer,
     MCPTool,
     get_mcp_client,
-    call_mcp_tool
+    call_mcp_tool,
+    call_mcp_tools,
+    should_cache
 )
 from .servers import filesystem, git, execution, api, system, multimodal
 
@@ -36,5 +38,7 @@ __all__ = [
     'MCPTool',
     'get_mcp_client',
     'call_mcp_tool',
+    'call_mcp_tools',
+    'should_cache',
     'initialize_mcp_servers'
 ]
@@ -2,11 +2,44 @@
 MCP Client for Chalice
 Provides the core infrastructure for code execution with MCP servers
 """
-from typing import Dict, Any, Optional, List, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from pathlib import Path
+import copy
 import json
 import importlib.util
+import os
 import sys
+import threading
+import time
+
+# Default number of tool results kept for calls made with cache_ttl
+DEFAULT_TOOL_CACHE_SIZE = 256
+
+def should_cache(result: Any) -> bool:
+    """
+    Whether a tool result may be reused for identical calls
+
+    Errors aren't cached, nor are results whose _meta.cache_hint is
+    "no-cache" (tools reporting volatile state, e.g. process lists).
+    """
+    if not isinstance(result, dict) or "error" in result:
+        return False
+    meta = result.get("_meta")
+    return not (isinstance(meta, dict) and meta.get("cache_hint") == "no-cache")
+
+
+# Default number of threads call_tools runs independent calls on
+DEFAULT_BATCH_WORKERS = 8
+
+
+def _result_key(server_name: str, tool_name: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Cache key for a tool call, or None if the arguments aren't JSON"""
+    try:
+        return json.dumps([server_name, tool_name, kwargs], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
 
 
 class MCPClient:
@@ -20,6 +53,11 @@ class MCPClient:
         self.tool_cache: Dict[str, Dict[str, Any]] = {}
         self.execution_context: Dict[str, Any] = {}
 
+        # LRU of (monotonic timestamp, result) for calls made with cache_ttl
+        self.result_cache_size = int(os.getenv("CHALICE_TOOL_CACHE_SIZE", DEFAULT_TOOL_CACHE_SIZE))
+        self._result_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._result_lock = threading.Lock()
+
     def register_server(self, server: 'MCPServer'):
         """Register an MCP server"""
         self.servers[server.name] = server
@@ -32,11 +70,101 @@ class MCPClient:
         """List all registered server names"""
         return list(self.servers.keys())
 
-    def call_tool(self, server_name: str, tool_name: str, **kwargs) -> Dict[str, Any]:
+    def call_tool(
+        self,
+        server_name: str,
+        tool_name: str,
+        cache_ttl: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
         """
         Call a tool on an MCP server
         This is the core callMCPTool function that tools use
+
+        Args:
+            server_name: MCP server name
+            tool_name: Tool name
+            cache_ttl: Seconds an identical earlier result may be reused.
+                Only for deterministic tools; None disables caching.
+            **kwargs: Tool arguments
         """
+        return self.invoke(server_name, tool_name, kwargs, cache_ttl)
+
+    def invoke(
+        self,
+        server_name: str,
+        tool_name: str,
+        kwargs: Dict[str, Any],
+        cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Call a tool with its arguments given as a dict (see call_tool)"""
+        if not cache_ttl:
+            return self._call_tool(server_name, tool_name, kwargs)
+
+        key = _result_key(server_name, tool_name, kwargs)
+        if key is None:
+            return self._call_tool(server_name, tool_name, kwargs)
+
+        with self._result_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if time.monotonic() - stored_at <= cache_ttl:
+                    self._result_cache.move_to_end(key)
+                    return copy.deepcopy(result)
+                del self._result_cache[key]
+
+        result = self._call_tool(server_name, tool_name, kwargs)
+
+        if not should_cache(result):
+            # Drop any entry another thread stored for this call meanwhile
+            with self._result_lock:
+                self._result_cache.pop(key, None)
+        elif self.result_cache_size > 0:
+            with self._result_lock:
+                self._result_cache[key] = (time.monotonic(), copy.deepcopy(result))
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+
+        return result
+
+    def call_tools(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent tool calls concurrently
+
+        Tools spend their time in subprocesses, file and network I/O, so
+        a thread pool overlaps them.
+
+        Args:
+            calls: (server_name, tool_name, arguments) tuples
+            max_workers: Thread count (default: DEFAULT_BATCH_WORKERS)
+
+        Returns:
+            List[Dict[str, Any]]: Results in the order of calls
+        """
+        if len(calls) <= 1:
+            return [self.call_tool(server_name, tool_name, **kwargs) for server_name, tool_name, kwargs in calls]
+
+        workers = min(len(calls), max_workers or DEFAULT_BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.call_tool, server_name, tool_name, **kwargs)
+                for server_name, tool_name, kwargs in calls
+            ]
+            return [future.result() for future in futures]
+
+    def clear_result_cache(self):
+        """Drop all cached tool results"""
+        with self._result_lock:
+            self._result_cache.clear()
+
+    def _call_tool(self, server_name: str, tool_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool without consulting the result cache"""
         server = self.get_server(server_name)
         if not server:
             return {"error": f"Server not found: {server_name}"}
@@ -195,10 +323,42 @@ def get_mcp_client() -> MCPClient:
     return _mcp_client
 
 
-def call_mcp_tool(server_name: str, tool_name: str, **kwargs) -> Dict[str, Any]:
+def call_mcp_tool(
+    server_name: str,
+    tool_name: str,
+    cache_ttl: Optional[float] = None,
+    **kwargs
+) -> Dict[str, Any]:
     """
     Global function for calling MCP tools
     This is what the generated code will use
     """
     client = get_mcp_client()
-    return client.call_tool(server_name, tool_name, **kwargs)
+    return client.call_tool(server_name, tool_name, cache_ttl, **kwargs)
+
+
+def make_dispatcher(server_name: str, tool_name: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Bind a tool to a function taking its arguments as one dict
+
+    Generated wrappers call this instead of call_mcp_tool, so their
+    argument dict reaches the tool without being unpacked and repacked.
+
+    Returns:
+        dispatch(arguments, cache_ttl=None) -> tool result
+    """
+    def dispatch(arguments: Dict[str, Any], cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+        return get_mcp_client().invoke(server_name, tool_name, arguments, cache_ttl)
+
+    return dispatch
+
+
+def call_mcp_tools(
+    calls: List[Tuple[str, str, Dict[str, Any]]],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Global function for running independent MCP tool calls concurrently
+    See MCPClient.call_tools
+    """
+    return get_mcp_client().call_tools(calls, max_workers)
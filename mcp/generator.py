@@ -6,29 +6,19 @@ This creates a servers/ directory that agents can explore to discover tools on-d
 implementing the progressive disclosure pattern from the MCP blog post.
 """
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
 import json
+import keyword
 
 
-def generate_tool_file(server_name: str, tool_name: str, tool_info: Dict[str, Any]) -> str:
+def render_tool_function(server_name: str, tool_name: str, tool_info: Dict[str, Any]) -> str:
     """
-    Generate a Python tool file following TypeScript-style interface pattern
-
-    Example structure from Anthropic blog:
-    ```typescript
-    interface GetDocumentInput {
-      documentId: string;
-    }
-
-    interface GetDocumentResponse {
-      content: string;
-    }
+    Render the source of a tool wrapper function
 
-    /* Read a document from Google Drive */
-    export async function getDocument(input: GetDocumentInput): Promise<GetDocumentResponse> {
-      return callMCPTool<GetDocumentResponse>('google_drive__get_document', input);
-    }
-    ```
+    This is the single template behind both the generated tool files and
+    make_tool(). The wrapper calls `_get_invoke()`, which the surrounding
+    module or namespace must provide as the tool's make_dispatcher()
+    function.
     """
     description = tool_info.get('description', '')
     parameters = tool_info.get('parameters', {})
@@ -39,6 +29,9 @@ def generate_tool_file(server_name: str, tool_name: str, tool_info: Dict[str, An
 
     # Generate type hints for parameters
     param_hints = []
+    param_docs = []
+    always_args = []    # required or non-None default: always forwarded
+    optional_args = []  # default None: forwarded only when given
     for param_name, param_info in props.items():
         param_type = param_info.get('type', 'Any')
         type_map = {
@@ -50,15 +43,110 @@ def generate_tool_file(server_name: str, tool_name: str, tool_info: Dict[str, An
         }
         py_type = type_map.get(param_type, 'Any')
 
+        # Schema names that are Python keywords (e.g. 'global') get a
+        # trailing underscore but are still sent under their schema name
+        py_name = f"{param_name}_" if keyword.iskeyword(param_name) else param_name
+        param_docs.append(f"        {py_name}: {param_info.get('description', '')}")
+
         if param_name not in required:
             default_val = param_info.get('default', 'None')
             if isinstance(default_val, str) and default_val not in ['None', 'True', 'False']:
                 default_val = f'"{default_val}"'
-            param_hints.append(f"    {param_name}: {py_type} = {default_val}")
+            param_hints.append(f"    {py_name}: {py_type} = {default_val}")
+            if default_val == 'None':
+                optional_args.append((param_name, py_name))
+            else:
+                always_args.append((param_name, py_name))
         else:
-            param_hints.append(f"    {param_name}: {py_type}")
+            param_hints.append(f"    {py_name}: {py_type}")
+            always_args.append((param_name, py_name))
+
+    # Opt-in result caching for deterministic tools (see MCPClient.call_tool)
+    param_hints.append("    cache_ttl: float = None")
+    param_docs.append("        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)")
+    if not props:
+        param_hints.append("    **kwargs: Any")
+    param_str = ',\n'.join(param_hints)
+
+    # Build the forwarded arguments explicitly rather than from locals()
+    if props:
+        args_lines = ["    args = {" + ', '.join(f'"{name}": {py_name}' for name, py_name in always_args) + "}"]
+        for name, py_name in optional_args:
+            args_lines.append(f"    if {py_name} is not None:")
+            args_lines.append(f"        args[\"{name}\"] = {py_name}")
+    else:
+        args_lines = ["    args = kwargs"]
+    args_str = '\n'.join(args_lines)
+
+    return f'''def {tool_name}(
+{param_str}
+) -> Dict[str, Any]:
+    """
+    {description}
+
+    Parameters:
+{chr(10).join(param_docs)}
+
+    Returns:
+        Dict[str, Any]: Tool execution result
+    """
+{args_str}
+
+    return _get_invoke()(args, cache_ttl)
+'''
+
+
+def make_tool(server_name: str, tool_name: str, tool_info: Dict[str, Any]) -> Callable[..., Dict[str, Any]]:
+    """
+    Build a tool wrapper function at runtime
+
+    Compiles the same source a generated tool file would contain, for
+    servers registered after servers/ was generated.
+
+    Args:
+        server_name: MCP server name
+        tool_name: Tool name
+        tool_info: Tool definition (as from MCPClient.get_tool_definition)
+
+    Returns:
+        The wrapper function
+    """
+    from .client import make_dispatcher
+
+    invoke = make_dispatcher(server_name, tool_name)
+    namespace = {
+        'Dict': Dict,
+        'Any': Any,
+        'List': List,
+        'Optional': Optional,
+        '_get_invoke': lambda: invoke
+    }
+    source = render_tool_function(server_name, tool_name, tool_info)
+    exec(compile(source, f"<tool:{server_name}.{tool_name}>", "exec"), namespace)
+    return namespace[tool_name]
+
+
+def generate_tool_file(server_name: str, tool_name: str, tool_info: Dict[str, Any]) -> str:
+    """
+    Generate a Python tool file following TypeScript-style interface pattern
+
+    Example structure from Anthropic blog:
+    ```typescript
+    interface GetDocumentInput {
+      documentId: string;
+    }
 
-    param_str = ',\n'.join(param_hints) if param_hints else '    **kwargs: Any'
+    interface GetDocumentResponse {
+      content: string;
+    }
+
+    /* Read a document from Google Drive */
+    export async function getDocument(input: GetDocumentInput): Promise<GetDocumentResponse> {
+      return callMCPTool<GetDocumentResponse>('google_drive__get_document', input);
+    }
+    ```
+    """
+    description = tool_info.get('description', '')
 
     # Generate the file content
     content = f'''"""
@@ -67,45 +155,75 @@ def generate_tool_file(server_name: str, tool_name: str, tool_info: Dict[str, An
 This tool is part of the {server_name} MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
 
+_invoke = None
 
-def {tool_name}(
-{param_str}
-) -> Dict[str, Any]:
-    """
-    {description}
 
-    Parameters:
-{chr(10).join(f"        {name}: {info.get('description', '')}" for name, info in props.items())}
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("{server_name}", "{tool_name}")
+    return _invoke
 
-    Returns:
-        Dict[str, Any]: Tool execution result
-    """
-    params = {{k: v for k, v in locals().items() if v is not None and k != 'kwargs'}}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="{server_name}",
-        tool_name="{tool_name}",
-        **params
-    )
-'''
+
+{render_tool_function(server_name, tool_name, tool_info)}'''
     return content
 
 
 def generate_server_index(server_name: str, tools: List[str]) -> str:
     """Generate the index file for a server"""
-    imports = [f"from .{tool} import {tool}" for tool in tools]
+    imports = [f"    from .{tool} import {tool}" for tool in tools]
+    tool_map = ', '.join([f'"{tool}": "{tool}"' for tool in tools])
     exports = ', '.join([f'"{tool}"' for tool in tools])
 
     content = f'''"""
 {server_name.title()} MCP Server
 Auto-generated index for tool discovery
+
+Tool functions are imported from their modules on first access.
 """
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
 {chr(10).join(imports)}
 
+# Tool name -> submodule defining it
+_TOOLS = {{{tool_map}}}
+
+
+class _ServerModule(types.ModuleType):
+    """Keeps each tool name bound to its function, not its submodule"""
+
+    def __setattr__(self, name, value):
+        # Importing servers.<server>.<tool> binds the submodule on this
+        # package under the tool's name; bind the function instead
+        if name in _TOOLS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServerModule
+
+
+def __getattr__(name):
+    submodule = _TOOLS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    import importlib
+    module = importlib.import_module(f".{{submodule}}", __name__)
+    tool = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
+
+
 __all__ = [{exports}]
 '''
     return content
@@ -164,9 +282,29 @@ def generate_mcp_filesystem_structure(output_dir: Path, client):
     top_content = f'''"""
 Chalice MCP Servers
 Auto-generated for progressive tool discovery
+
+Servers are imported on first attribute access.
 """
-# Import all servers
-{chr(10).join(f"from . import {name}" for name in server_names)}
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+{chr(10).join(f"    from . import {name}" for name in server_names)}
+
+_SERVERS = {{{', '.join(f'"{name}"' for name in server_names)}}}
+
+
+def __getattr__(name):
+    if name in _SERVERS:
+        import importlib
+        module = importlib.import_module(f".{{name}}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SERVERS)
+
 
 __all__ = [{', '.join(f'"{name}"' for name in server_names)}]
 '''
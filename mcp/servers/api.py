@@ -82,15 +82,19 @@ class HTTPRequestTool(MCPTool):
             if body:
                 try:
                     kwargs["json"] = json_module.loads(body)
-                except:
+                except ValueError:
                     kwargs["data"] = body
 
             response = requests.request(method, url, **kwargs)
 
-            try:
-                response_json = response.json()
-            except:
-                response_json = None
+            # Only parse bodies the server labels as JSON
+            response_json = None
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.split(";", 1)[0].strip().lower() == "application/json":
+                try:
+                    response_json = response.json()
+                except ValueError:
+                    pass
 
             return {
                 "status_code": response.status_code,
@@ -0,0 +1,167 @@
+"""
+JSON Lines Logs for Memory System
+Append-only record files read lazily through a memory map
+"""
+import mmap
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from . import serialization
+
+
+class JsonlLog:
+    """
+    Append-only JSON lines file with a uint64 offset index
+
+    Records are appended as single lines to <name>.jsonl while their byte
+    offsets go to <name>.idx, so record i can be read straight out of the
+    memory-mapped file without parsing anything before it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize log
+
+        Args:
+            path: Path of the .jsonl file (the .idx file sits next to it)
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix('.idx')
+
+        self._offsets = array('Q')
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+
+        self._load_offsets()
+
+    def _load_offsets(self):
+        """Load the offset index, rebuilding it if it is missing or stale"""
+        if not self.path.exists():
+            self.path.touch()
+
+        if self.index_path.exists():
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+            self._offsets.frombytes(data[:len(data) - len(data) % self._offsets.itemsize])
+
+        if self._end_of_records() != self.path.stat().st_size:
+            self._rebuild_offsets()
+
+    def _end_of_records(self) -> int:
+        """Byte offset just past the last indexed record"""
+        if not self._offsets:
+            return 0
+
+        view = self._view()
+        if view is None:
+            return -1
+
+        end = view.find(b'\n', self._offsets[-1])
+        return end + 1 if end != -1 else -1
+
+    def _rebuild_offsets(self):
+        """Rescan the log for complete lines and rewrite the index"""
+        self._offsets = array('Q')
+        offset = 0
+
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                self._offsets.append(offset)
+                offset += len(line)
+
+        # Drop a half-written trailing record, if any
+        if offset != self.path.stat().st_size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+            self._mmap = None
+
+        with open(self.index_path, 'wb') as f:
+            f.write(self._offsets.tobytes())
+
+    def _view(self) -> Optional[mmap.mmap]:
+        """Read-only map of the log, remapped when the file has grown"""
+        size = self.path.stat().st_size
+        if self._mmap is None or size != self._mapped_size:
+            if size == 0:
+                return None
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+
+        return self._mmap
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Parse a single record without copying the rest of the file"""
+        if index < 0:
+            index += len(self._offsets)
+
+        start = self._offsets[index]
+        if index == len(self._offsets) - 1:
+            end = self._end_of_records()
+        else:
+            end = self._offsets[index + 1]
+
+        return serialization.loads(memoryview(self._view())[start:end])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self._offsets)):
+            yield self[index]
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """
+        Append a record
+
+        Returns:
+            int: Index of the new record
+        """
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write(serialization.dumps(record) + b'\n')
+
+        with open(self.index_path, 'ab') as f:
+            f.write(array('Q', [offset]).tobytes())
+
+        self._offsets.append(offset)
+        return len(self._offsets) - 1
+
+
+class KeyedJsonlLog(Mapping):
+    """
+    Read-only mapping over a JsonlLog of {'key': ..., 'value': ...} records
+
+    Setting a key appends a new record; the latest record for a key wins.
+    Only the key -> record index table is held in memory.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize mapping
+
+        Args:
+            path: Path of the .jsonl file
+        """
+        self.log = JsonlLog(path)
+        self._latest: Dict[str, int] = {}
+
+        for index, record in enumerate(self.log):
+            self._latest[record['key']] = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self.log[self._latest[key]]['value']
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._latest)
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def set(self, key: str, value: Any):
+        """Store a value under key"""
+        self._latest[key] = self.log.append({'key': key, 'value': value})
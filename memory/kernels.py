@@ -0,0 +1,131 @@
+"""
+Similarity Kernels for Memory System
+Dot product kernels over unit-length rows with optional SimSIMD and Numba acceleration
+"""
+import functools
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+
+NUMBA_AVAILABLE = numba is not None
+SIMSIMD_AVAILABLE = simsimd is not None
+
+# Selectable similarity backends ('auto' picks the fastest installed one)
+BACKENDS = ('auto', 'simsimd', 'numba', 'numpy')
+
+# Below this many rows per-call setup dominates, so 'auto' prefers Numba
+# and the Numba kernel runs single-threaded
+SMALL_MATRIX_ROWS = 64
+
+# Added to norms so zero vectors normalize to zero instead of NaN
+NORM_EPSILON = 1e-12
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale every row of a float32 matrix to unit length in place"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms += NORM_EPSILON
+    np.divide(matrix, norms, out=matrix)
+    return matrix
+
+
+def check_backend(backend: str) -> str:
+    """
+    Validate a backend name
+
+    Raises:
+        ValueError: If the backend is unknown or its package isn't installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown similarity backend: {backend} (expected one of {BACKENDS})")
+
+    if backend == 'simsimd' and not SIMSIMD_AVAILABLE:
+        raise ValueError("Similarity backend 'simsimd' requires the simsimd package")
+
+    if backend == 'numba' and not NUMBA_AVAILABLE:
+        raise ValueError("Similarity backend 'numba' requires the numba package")
+
+    return backend
+
+
+@functools.lru_cache(maxsize=16)
+def make_fixed_dim_dot_kernel(dim: int, parallel: bool):
+    """
+    Compile a Numba query-vs-matrix dot product kernel for one embedding size
+
+    The dimension is baked in as a compile-time constant so LLVM can fully
+    unroll the inner loop, which runs four partial accumulators. With
+    parallel=True rows are split across threads. Requires Numba; compiled
+    kernels are cached per (dimension, parallel).
+    """
+    DIM = dim
+    BLOCK_END = DIM - DIM % 4
+
+    @numba.njit(fastmath=True, parallel=parallel)
+    def kernel(query, matrix):
+        rows = matrix.shape[0]
+        scores = np.empty(rows, dtype=np.float32)
+
+        for i in numba.prange(rows):
+            dot0 = dot1 = dot2 = dot3 = np.float32(0.0)
+            for j in range(0, BLOCK_END, 4):
+                dot0 += matrix[i, j] * query[j]
+                dot1 += matrix[i, j + 1] * query[j + 1]
+                dot2 += matrix[i, j + 2] * query[j + 2]
+                dot3 += matrix[i, j + 3] * query[j + 3]
+            for j in range(BLOCK_END, DIM):
+                dot0 += matrix[i, j] * query[j]
+            scores[i] = (dot0 + dot1) + (dot2 + dot3)
+
+        return scores
+
+    return kernel
+
+
+def cosine_similarities(query: np.ndarray, matrix: np.ndarray, backend: str = 'auto') -> np.ndarray:
+    """
+    Calculate cosine similarity between a query and every unit-length matrix row
+
+    Only the query is normalized; the scores are plain dot products. With
+    backend='auto', SimSIMD handles larger matrices, the Numba kernel
+    handles small ones (or everything if SimSIMD is missing), and NumPy is
+    the fallback when neither is installed.
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32).ravel()
+
+    query_norm = np.linalg.norm(query)
+    if query_norm == 0:
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+    query = query / query_norm
+
+    small = matrix.shape[0] < SMALL_MATRIX_ROWS
+
+    if backend == 'auto':
+        if SIMSIMD_AVAILABLE and (not small or not NUMBA_AVAILABLE):
+            backend = 'simsimd'
+        elif NUMBA_AVAILABLE:
+            backend = 'numba'
+        else:
+            backend = 'numpy'
+
+    if backend == 'simsimd':
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        return np.asarray(simsimd.cdist(query[None, :], matrix, metric='dot'))[0].astype(np.float32)
+
+    if backend == 'numba':
+        return make_fixed_dim_dot_kernel(matrix.shape[1], not small)(
+            query,
+            np.ascontiguousarray(matrix, dtype=np.float32)
+        )
+
+    return matrix @ query
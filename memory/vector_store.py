@@ -3,11 +3,52 @@ Vector Store for Memory System
 Efficient vector storage and similarity search for long-term memory
 """
 import numpy as np
-import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 import hashlib
+import re
+import time
+
+from . import kernels, serialization
+from .jsonl import JsonlLog, KeyedJsonlLog
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# On-disk dtype of the vector matrix
+VECTOR_DTYPE = np.float32
+
+# Fraction of deleted rows that triggers an automatic compact()
+COMPACT_DEAD_RATIO = 0.25
+
+# Metadata fields with an inverted index for filtered search
+INDEXED_FIELDS = ('source', 'tags')
+
+# Tokenizer for the conversation keyword index
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def generate_id(content: str, timestamp_ns: int) -> str:
+    """
+    Generate a 16 hex character ID from content and a timestamp
+
+    Uses xxh3-128 when xxhash is installed, BLAKE2b otherwise. The content
+    is hashed directly rather than concatenated with the timestamp first.
+    """
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    h.update(content.encode())
+    h.update(timestamp_ns.to_bytes(8, 'little'))
+    return h.hexdigest()[:16]
+
+
+def current_timestamp() -> Tuple[int, str]:
+    """Get the current time once, as nanoseconds and as an ISO string"""
+    now_ns = time.time_ns()
+    return now_ns, datetime.fromtimestamp(now_ns / 1e9).isoformat()
 
 
 class VectorStore:
@@ -15,66 +56,266 @@ class VectorStore:
     Vector store for embedding-based memory
 
     Provides efficient storage and retrieval of vector embeddings
-    with metadata for context persistence
+    with metadata for context persistence. Storage is append-only: every
+    vector is one row appended to a memory-mapped matrix file (vectors.bin)
+    and its metadata is one line appended to index.jsonl. Deletes append a
+    tombstone line and mask the row until the next compact(). Rows are
+    stored unit-length, so similarity at query time is a plain dot product.
+    A store saved in the older index.json + vector_*.npy layout is imported
+    on first load.
     """
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(self, storage_path: Optional[Path] = None, backend: str = 'auto'):
         """
         Initialize vector store
 
         Args:
             storage_path: Path to store vectors (default: memory/vectors/)
+            backend: Similarity backend ('auto', 'simsimd', 'numba' or 'numpy')
         """
         if storage_path is None:
             storage_path = Path(__file__).parent / "vectors"
 
+        self.backend = kernels.check_backend(backend)
+
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
-        self.vectors: List[np.ndarray] = []
         self.metadata: List[Dict[str, Any]] = []
-        self.index_file = self.storage_path / "index.json"
+        self.index_file = self.storage_path / "index.jsonl"
+        self.matrix_file = self.storage_path / "vectors.bin"
+        self.legacy_index_file = self.storage_path / "index.json"
+
+        self._matrix: Optional[np.ndarray] = None
+        self._count = 0
+        self._dim = 0
+
+        # Row liveness mask (over-allocated; only [:_count] is meaningful)
+        self._alive = np.ones(0, dtype=bool)
+        self._dead = 0
+
+        self._id_to_idx: Dict[str, int] = {}
+        self._source_index: Dict[str, Set[int]] = {}
+        self._tag_index: Dict[str, Set[int]] = {}
 
         self._load_index()
+        self._rebuild_lookups()
 
     def _load_index(self):
         """Load index from disk"""
+        if not self.index_file.exists() and self.legacy_index_file.exists():
+            self._import_legacy_index()
+
         if not self.index_file.exists():
             return
 
         try:
-            with open(self.index_file, 'r') as f:
-                index_data = json.load(f)
+            with open(self.index_file, 'rb') as f:
+                header = serialization.loads(f.readline() or b'{}')
+                lines = f.readlines()
+
+            # An interrupted append can leave a partial last line; cut it off
+            # so the next append starts on a fresh line
+            if lines and not lines[-1].endswith(b'\n'):
+                with open(self.index_file, 'r+b') as f:
+                    f.truncate(self.index_file.stat().st_size - len(lines.pop()))
+            records = [serialization.loads(line) for line in lines if line.strip()]
+
+            # Entry lines carry an id, tombstone lines only {'deleted': id}
+            self.metadata = [record for record in records if 'id' in record]
+            deleted = {record['deleted'] for record in records if 'id' not in record}
+
+            if not self.metadata or not self.matrix_file.exists():
+                self.metadata = []
+                return
+
+            self._dim = header['dim']
+            row_bytes = self._dim * np.dtype(VECTOR_DTYPE).itemsize
+            rows = self.matrix_file.stat().st_size // row_bytes
+
+            # An interrupted append can leave a row without its metadata line
+            # or the other way round; trim both sides back to what matches
+            trimmed = len(self.metadata) > rows
+            del self.metadata[rows:]
+            self._count = len(self.metadata)
+            if self.matrix_file.stat().st_size != self._count * row_bytes:
+                with open(self.matrix_file, 'r+b') as f:
+                    f.truncate(self._count * row_bytes)
+
+            self._alive = np.array([meta['id'] not in deleted for meta in self.metadata], dtype=bool)
+            self._dead = self._count - int(self._alive.sum())
+
+            if self._count:
+                self._open_matrix()
+
+            # Rewrite index.jsonl so later appends don't follow dropped lines
+            if trimmed:
+                self.compact()
 
-            for entry in index_data:
+        except Exception as e:
+            print(f"Error loading index: {e}")
+            self.metadata = []
+            self._matrix = None
+            self._count = self._dim = self._dead = 0
+            self._alive = np.ones(0, dtype=bool)
+
+    def _import_legacy_index(self):
+        """
+        One-time import of a store saved as index.json plus one .npy file
+        per vector
+
+        Vectors are normalized and written to vectors.bin and index.jsonl;
+        index.json is then renamed to index.json.imported. The .npy files
+        are left in place.
+        """
+        try:
+            with open(self.legacy_index_file, 'rb') as f:
+                entries = serialization.loads(f.read())
+
+            rows = []
+            metadata = []
+            for entry in entries:
                 vector_file = self.storage_path / entry['vector_file']
-                if vector_file.exists():
-                    vector = np.load(vector_file)
-                    self.vectors.append(vector)
-                    self.metadata.append(entry['metadata'])
+                if not vector_file.exists():
+                    continue
+
+                vector = np.asarray(np.load(vector_file), dtype=VECTOR_DTYPE).ravel()
+                if rows and vector.shape[0] != rows[0].shape[0]:
+                    print(f"Skipping vector {entry['metadata']['id']}: dimension {vector.shape[0]} "
+                          f"does not match store dimension {rows[0].shape[0]}")
+                    continue
+
+                rows.append(vector)
+                metadata.append(entry['metadata'])
+
+            if rows:
+                self._dim = rows[0].shape[0]
+                self.metadata = metadata
+                self._write_files(kernels.normalize_rows(np.vstack(rows)))
+                self.metadata = []
+                print(f"Imported {len(rows)} vectors from {self.legacy_index_file.name}")
+
+            self.legacy_index_file.replace(self.legacy_index_file.with_suffix('.json.imported'))
 
         except Exception as e:
-            print(f"Error loading index: {e}")
+            print(f"Error importing {self.legacy_index_file.name}: {e}")
+
+    def _index_header(self) -> bytes:
+        """Serialized first line of index.jsonl"""
+        return serialization.dumps({'dim': self._dim}) + b'\n'
+
+    def _index_entry(self, idx: int, metadata: Dict[str, Any]):
+        """Add one row to the id, source and tag lookups"""
+        self._id_to_idx[metadata['id']] = idx
+        self._source_index.setdefault(metadata.get('source'), set()).add(idx)
+        for tag in metadata.get('tags', []):
+            self._tag_index.setdefault(tag, set()).add(idx)
+
+    def _unindex_entry(self, idx: int, metadata: Dict[str, Any]):
+        """Remove one row from the id, source and tag lookups"""
+        self._id_to_idx.pop(metadata['id'], None)
+        self._source_index.get(metadata.get('source'), set()).discard(idx)
+        for tag in metadata.get('tags', []):
+            self._tag_index.get(tag, set()).discard(idx)
+
+    def _rebuild_lookups(self):
+        """Rebuild the id, source and tag lookups from live rows"""
+        self._id_to_idx = {}
+        self._source_index = {}
+        self._tag_index = {}
+        for idx, meta in enumerate(self.metadata):
+            if self._alive[idx]:
+                self._index_entry(idx, meta)
+
+    def _append_entry(self, metadata: Dict[str, Any], vector: np.ndarray):
+        """
+        Append a single vector row and its metadata line to disk
 
-    def _save_index(self):
-        """Save index to disk"""
+        The first row of an empty store starts both files afresh, so the
+        header carries the current dimension and no leftover lines remain.
+        """
+        mode = 'wb' if self._count == 0 else 'ab'
         try:
-            index_data = []
-            for i, meta in enumerate(self.metadata):
-                vector_file = f"vector_{i}_{meta['id']}.npy"
-                np.save(self.storage_path / vector_file, self.vectors[i])
+            with open(self.matrix_file, mode) as f:
+                f.write(vector.tobytes())
 
-                index_data.append({
-                    'vector_file': vector_file,
-                    'metadata': meta
-                })
+            with open(self.index_file, mode) as f:
+                if mode == 'wb':
+                    f.write(self._index_header())
+                f.write(serialization.dumps(metadata) + b'\n')
 
-            with open(self.index_file, 'w') as f:
-                json.dump(index_data, f, indent=2)
+        except Exception as e:
+            print(f"Error saving index: {e}")
+
+    def _append_tombstone(self, vector_id: str):
+        """Append a deletion marker for a vector to disk"""
+        try:
+            with open(self.index_file, 'ab') as f:
+                f.write(serialization.dumps({'deleted': vector_id}) + b'\n')
 
         except Exception as e:
             print(f"Error saving index: {e}")
 
+    def compact(self):
+        """
+        Drop deleted rows and rewrite vectors.bin and index.jsonl
+
+        Runs automatically once more than COMPACT_DEAD_RATIO of the rows
+        are deleted; appends never need it.
+        """
+        try:
+            alive = self._alive[:self._count]
+            matrix = np.array(self._active_matrix()[alive])
+            self.metadata = [meta for meta, keep in zip(self.metadata, alive) if keep]
+            self._count = len(self.metadata)
+            self._alive = np.ones(self._count, dtype=bool)
+            self._dead = 0
+            self._rebuild_lookups()
+            if self._count == 0:
+                # The next add() picks the dimension again
+                self._dim = 0
+
+            self._matrix = None
+            self._write_files(matrix)
+
+            if self._count:
+                self._open_matrix()
+
+        except Exception as e:
+            print(f"Error saving index: {e}")
+
+    def _write_files(self, matrix: np.ndarray):
+        """Replace vectors.bin and index.jsonl with matrix and self.metadata"""
+        matrix_tmp = self.matrix_file.with_suffix('.bin.tmp')
+        index_tmp = self.index_file.with_suffix('.jsonl.tmp')
+
+        with open(matrix_tmp, 'wb') as f:
+            f.write(matrix.tobytes())
+
+        with open(index_tmp, 'wb') as f:
+            f.write(self._index_header())
+            for meta in self.metadata:
+                f.write(serialization.dumps(meta) + b'\n')
+
+        # index.jsonl goes last: once it exists the store is complete
+        matrix_tmp.replace(self.matrix_file)
+        index_tmp.replace(self.index_file)
+
+    def _open_matrix(self):
+        """Memory-map the rows currently in use"""
+        self._matrix = np.memmap(
+            self.matrix_file,
+            dtype=VECTOR_DTYPE,
+            mode='r',
+            shape=(self._count, self._dim)
+        )
+
+    def _active_matrix(self) -> np.ndarray:
+        """View of the rows currently in use"""
+        if self._matrix is None:
+            return np.empty((0, self._dim), dtype=VECTOR_DTYPE)
+        return self._matrix[:self._count]
+
     def add(
         self,
         vector: np.ndarray,
@@ -96,10 +337,20 @@ class VectorStore:
         Returns:
             str: Vector ID
         """
+        vector = np.asarray(vector, dtype=VECTOR_DTYPE).ravel()
+
+        if self._count == 0:
+            self._dim = vector.shape[0]
+        elif vector.shape[0] != self._dim:
+            raise ValueError(
+                f"Vector dimension {vector.shape[0]} does not match store dimension {self._dim}"
+            )
+
+        vector = kernels.normalize_rows(vector[None, :].copy())[0]
+
         # Generate ID
-        vector_id = hashlib.md5(
-            f"{content}{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:16]
+        now_ns, timestamp = current_timestamp()
+        vector_id = generate_id(content, now_ns)
 
         # Create metadata
         metadata = {
@@ -107,16 +358,19 @@ class VectorStore:
             'content': content,
             'source': source,
             'tags': tags or [],
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             **kwargs
         }
 
-        # Add to store
-        self.vectors.append(vector)
+        # Save, then add to store
+        self._append_entry(metadata, vector)
+        if self._count == len(self._alive):
+            self._alive = np.concatenate([self._alive, np.ones(max(1024, self._count), dtype=bool)])
+        self._alive[self._count] = True
+        self._index_entry(self._count, metadata)
         self.metadata.append(metadata)
-
-        # Save
-        self._save_index()
+        self._count += 1
+        self._open_matrix()
 
         return vector_id
 
@@ -139,45 +393,69 @@ class VectorStore:
         Returns:
             List of matching results with metadata and scores
         """
-        if not self.vectors:
+        if self.count() == 0:
             return []
 
-        # Calculate cosine similarities
-        similarities = []
-        for i, vec in enumerate(self.vectors):
-            # Apply filters
-            if filters:
-                meta = self.metadata[i]
-                if not self._matches_filters(meta, filters):
-                    continue
+        if filters:
+            # Score only the rows the filters let through; these come from
+            # the lookups, which hold live rows only
+            candidates = self._candidates_for_filters(filters)
+            if len(candidates) == 0:
+                return []
+            scores = self._cosine_similarities(query_vector, self._active_matrix()[candidates])
+        else:
+            # Common case: one pass over the whole matrix, no per-row checks
+            candidates = None
+            scores = self._cosine_similarities(query_vector, self._active_matrix())
+            if self._dead:
+                scores[~self._alive[:self._count]] = -np.inf
+
+        # Select the top k above the threshold, then sort only those
+        keep = np.flatnonzero(scores >= min_similarity)
+        if top_k < len(keep):
+            keep = keep[np.argpartition(-scores[keep], top_k)[:top_k]]
+        keep = keep[np.argsort(-scores[keep], kind='stable')]
+
+        rows = keep if candidates is None else candidates[keep]
+        return [
+            {**self.metadata[idx], 'similarity': float(sim)}
+            for idx, sim in zip(rows.tolist(), scores[keep].tolist())
+        ]
+
+    def _cosine_similarities(self, query_vector: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Calculate cosine similarity between a query and every matrix row"""
+        return kernels.cosine_similarities(query_vector, matrix, self.backend)
+
+    def _candidates_for_filters(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Get sorted row indices matching filters
 
-            sim = self._cosine_similarity(query_vector, vec)
-            if sim >= min_similarity:
-                similarities.append((i, sim))
+        Indexed fields (source, tags) are resolved by intersecting posting
+        sets; any other field is checked row by row on what remains.
+        """
+        candidates: Optional[Set[int]] = None
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        for key, index in (('source', self._source_index), ('tags', self._tag_index)):
+            if key not in filters:
+                continue
 
-        # Get top k
-        results = []
-        for idx, sim in similarities[:top_k]:
-            results.append({
-                **self.metadata[idx],
-                'similarity': float(sim)
-            })
+            values = filters[key] if isinstance(filters[key], list) else [filters[key]]
+            postings = set().union(*(index.get(value, set()) for value in values))
+            candidates = postings if candidates is None else candidates & postings
 
-        return results
+        remaining = {k: v for k, v in filters.items() if k not in INDEXED_FIELDS}
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        if candidates is None:
+            rows = np.flatnonzero(self._alive[:self._count])
+        else:
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            rows.sort()
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        if remaining:
+            mask = [self._matches_filters(self.metadata[i], remaining) for i in rows.tolist()]
+            rows = rows[np.array(mask, dtype=bool)]
 
-        return dot_product / (norm1 * norm2)
+        return rows
 
     def _matches_filters(self, metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
         """Check if metadata matches filters"""
@@ -185,7 +463,12 @@ class VectorStore:
             if key not in metadata:
                 return False
 
-            if isinstance(value, list):
+            if isinstance(metadata[key], list):
+                # List fields (e.g. tags) match on any shared value
+                wanted = value if isinstance(value, list) else [value]
+                if not any(v in metadata[key] for v in wanted):
+                    return False
+            elif isinstance(value, list):
                 # Check if any value matches
                 if metadata[key] not in value:
                     return False
@@ -205,39 +488,51 @@ class VectorStore:
         Returns:
             bool: True if deleted
         """
-        for i, meta in enumerate(self.metadata):
-            if meta['id'] == vector_id:
-                del self.vectors[i]
-                del self.metadata[i]
-                self._save_index()
-                return True
+        i = self._id_to_idx.get(vector_id)
+        if i is None:
+            return False
+
+        self._alive[i] = False
+        self._dead += 1
+        self._unindex_entry(i, self.metadata[i])
+        self._append_tombstone(vector_id)
 
-        return False
+        if self._dead > self._count * COMPACT_DEAD_RATIO:
+            self.compact()
+
+        return True
 
     def get_by_id(self, vector_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata by vector ID"""
-        for meta in self.metadata:
-            if meta['id'] == vector_id:
-                return meta
-
-        return None
+        i = self._id_to_idx.get(vector_id)
+        return self.metadata[i] if i is not None else None
 
     def count(self) -> int:
         """Get number of stored vectors"""
-        return len(self.vectors)
+        return self._count - self._dead
 
     def clear(self):
         """Clear all vectors"""
-        self.vectors = []
+        self._matrix = None
+        self._count = self._dim = self._dead = 0
+        self._alive = np.ones(0, dtype=bool)
         self.metadata = []
-        self._save_index()
+        self._rebuild_lookups()
+
+        for path in (self.matrix_file, self.index_file):
+            if path.exists():
+                path.unlink()
 
 
 class MemoryManager:
     """
     Memory Manager with context persistence
 
-    Manages long-term memory using vector stores
+    Manages long-term memory using vector stores. Conversations and
+    knowledge are append-only JSON lines logs that are read lazily, so only
+    their offsets, timestamps and search indexes stay in memory. Data saved
+    as conversations.json / knowledge.json by earlier releases is imported
+    on first load.
     """
 
     def __init__(self, storage_path: Optional[Path] = None):
@@ -247,31 +542,66 @@ class MemoryManager:
 
         self.storage_path = Path(storage_path)
         self.vector_store = VectorStore(storage_path / "vectors")
-        self.conversation_file = storage_path / "conversations.json"
-        self.knowledge_file = storage_path / "knowledge.json"
+        self.conversation_file = storage_path / "conversations.jsonl"
+        self.knowledge_file = storage_path / "knowledge.jsonl"
+
+        self.conversations: JsonlLog = None
+        self.knowledge_base: KeyedJsonlLog = None
+        self._token_index: Dict[str, Set[int]] = {}
+        self._timestamps: List[str] = []
 
-        self.conversations: List[Dict[str, Any]] = []
-        self.knowledge_base: Dict[str, Any] = {}
+        # Lowercased text per conversation (memory only, never saved)
+        self._search_text: List[str] = []
 
         self._load_data()
 
     def _load_data(self):
-        """Load conversation and knowledge data"""
-        if self.conversation_file.exists():
-            with open(self.conversation_file, 'r') as f:
-                self.conversations = json.load(f)
+        """Open conversation and knowledge logs and index conversations"""
+        legacy_conversations = self._read_legacy(self.conversation_file)
+        legacy_knowledge = self._read_legacy(self.knowledge_file)
+
+        self.conversations = JsonlLog(self.conversation_file)
+        self.knowledge_base = KeyedJsonlLog(self.knowledge_file)
+
+        if legacy_conversations is not None:
+            for conversation in legacy_conversations:
+                self.conversations.append(conversation)
+            self._retire_legacy(self.conversation_file)
+
+        if legacy_knowledge is not None:
+            for key, entry in legacy_knowledge.items():
+                self.knowledge_base.set(key, entry)
+            self._retire_legacy(self.knowledge_file)
+
+        for idx, conversation in enumerate(self.conversations):
+            self._index_conversation(idx, conversation)
+
+    @staticmethod
+    def _read_legacy(log_file: Path) -> Optional[Any]:
+        """
+        Read the .json file an earlier release kept instead of log_file
 
-        if self.knowledge_file.exists():
-            with open(self.knowledge_file, 'r') as f:
-                self.knowledge_base = json.load(f)
+        Returns:
+            The parsed data, or None if log_file exists or there is nothing
+            to import
+        """
+        legacy_file = log_file.with_suffix('.json')
+        if log_file.exists() or not legacy_file.exists():
+            return None
 
-    def _save_data(self):
-        """Save conversation and knowledge data"""
-        with open(self.conversation_file, 'w') as f:
-            json.dump(self.conversations, f, indent=2)
+        try:
+            with open(legacy_file, 'rb') as f:
+                return serialization.loads(f.read())
+        except Exception as e:
+            print(f"Error importing {legacy_file.name}: {e}")
+            return None
 
-        with open(self.knowledge_file, 'w') as f:
-            json.dump(self.knowledge_base, f, indent=2)
+    @staticmethod
+    def _retire_legacy(log_file: Path):
+        """Rename an imported .json file so it isn't imported again"""
+        legacy_file = log_file.with_suffix('.json')
+        legacy_file.replace(legacy_file.with_suffix('.json.imported'))
+        print(f"Imported {legacy_file.name} into {log_file.name}")
 
     def add_conversation(
         self,
@@ -280,24 +610,26 @@ class MemoryManager:
         tags: List[str] = None
     ):
         """Add conversation to memory"""
+        now_ns, timestamp = current_timestamp()
         conversation = {
-            'id': hashlib.md5(f"{session_id}{datetime.now().isoformat()}".encode()).hexdigest()[:16],
+            'id': generate_id(session_id, now_ns),
             'session_id': session_id,
             'messages': messages,
             'tags': tags or [],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
 
-        self.conversations.append(conversation)
-        self._save_data()
+        idx = self.conversations.append(conversation)
+        self._index_conversation(idx, conversation)
 
     def get_recent_conversations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversations"""
-        return sorted(
-            self.conversations,
-            key=lambda x: x['timestamp'],
-            reverse=True
-        )[:limit]
+        return self._newest(range(len(self.conversations)), limit)
+
+    def _newest(self, indices, limit: int) -> List[Dict[str, Any]]:
+        """Read the `limit` most recent conversations among indices"""
+        ranked = sorted(indices, key=self._timestamps.__getitem__, reverse=True)
+        return [self.conversations[i] for i in ranked[:limit]]
 
     def search_conversations(
         self,
@@ -305,15 +637,45 @@ class MemoryManager:
         limit: int = 5
     ) -> List[Dict[str, Any]]:
         """Search conversations by keyword"""
-        results = []
-
-        for conv in self.conversations:
-            # Simple keyword search
-            text = ' '.join([msg['content'] for msg in conv['messages']])
-            if query.lower() in text.lower():
-                results.append(conv)
-
-        return sorted(results, key=lambda x: x['timestamp'], reverse=True)[:limit]
+        query = query.lower()
+        tokens = TOKEN_PATTERN.findall(query)
+
+        # Every word in the query must sit inside some word of the text,
+        # so intersecting postings gives a superset of the matches
+        candidates = None
+        for token in tokens:
+            postings = self._token_postings(token)
+            candidates = postings if candidates is None else candidates & postings
+
+        if candidates is None:
+            candidates = range(len(self.conversations))
+
+        if tokens != [query]:
+            # Phrases still need a substring check on the candidates;
+            # single word queries are fully answered by the index
+            candidates = [i for i in candidates if query in self._search_text[i]]
+
+        return self._newest(candidates, limit)
+
+    def _conversation_text(self, conversation: Dict[str, Any]) -> str:
+        """Join all message contents of a conversation"""
+        return ' '.join([msg['content'] for msg in conversation['messages']])
+
+    def _index_conversation(self, idx: int, conversation: Dict[str, Any]):
+        """Add a conversation's words to the keyword index"""
+        text = self._conversation_text(conversation).lower()
+        self._search_text.append(text)
+        self._timestamps.append(conversation['timestamp'])
+        for token in set(TOKEN_PATTERN.findall(text)):
+            self._token_index.setdefault(token, set()).add(idx)
+
+    def _token_postings(self, fragment: str) -> Set[int]:
+        """Get conversations containing a word that contains fragment"""
+        postings: Set[int] = set()
+        for token, indices in self._token_index.items():
+            if fragment in token:
+                postings |= indices
+        return postings
 
     def add_knowledge(
         self,
@@ -323,14 +685,12 @@ class MemoryManager:
         tags: List[str] = None
     ):
         """Add knowledge to base"""
-        self.knowledge_base[key] = {
+        self.knowledge_base.set(key, {
             'value': value,
             'category': category,
             'tags': tags or [],
-            'updated': datetime.now().isoformat()
-        }
-
-        self._save_data()
+            'updated': current_timestamp()[1]
+        })
 
     def get_knowledge(self, key: str) -> Optional[Any]:
         """Get knowledge by key"""
@@ -2,9 +2,25 @@
 LM Studio Provider
 Local model inference using LM Studio
 """
+import asyncio
 import requests
 import json
-from typing import Dict, Any, List, Optional, Iterator
+from typing import Dict, Any, List, Optional, Iterator, AsyncIterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Server-sent event framing used by the streaming endpoints
+SSE_DATA_PREFIX = b'data: '
+SSE_DONE = b'[DONE]'
 
 
 class LMStudioProvider:
@@ -24,12 +40,20 @@ class LMStudioProvider:
         """
         self.base_url = base_url.rstrip('/')
 
+        # Shared session so repeated calls reuse the keep-alive connection
+        self._session = requests.Session()
+
+        # Async client for achat/acompletion, created on first use in each
+        # event loop (its pooled connections are tied to that loop)
+        self._aclient = None
+        self._aclient_loop = None
+
     def is_available(self) -> bool:
         """Check if LM Studio is running"""
         try:
-            response = requests.get(f"{self.base_url}/models", timeout=2)
+            response = self._session.get(f"{self.base_url}/models", timeout=2)
             return response.status_code == 200
-        except:
+        except requests.RequestException:
             return False
 
     def list_models(self) -> List[Dict[str, Any]]:
@@ -40,7 +64,7 @@ class LMStudioProvider:
             List of model information dictionaries
         """
         try:
-            response = requests.get(f"{self.base_url}/models")
+            response = self._session.get(f"{self.base_url}/models")
             response.raise_for_status()
             data = response.json()
 
@@ -83,20 +107,9 @@ class LMStudioProvider:
             Chat result or iterator if streaming
         """
         try:
-            payload = {
-                'model': model,
-                'messages': messages,
-                'temperature': temperature,
-                'stream': stream
-            }
-
-            if max_tokens:
-                payload['max_tokens'] = max_tokens
-
-            # Add additional parameters
-            payload.update(kwargs)
+            payload = self._build_payload('messages', messages, model, temperature, max_tokens, stream, kwargs)
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 json=payload,
                 stream=stream
@@ -106,15 +119,7 @@ class LMStudioProvider:
             if stream:
                 return self._stream_chat(response)
             else:
-                data = response.json()
-                return {
-                    'id': data.get('id', ''),
-                    'object': data.get('object', 'chat.completion'),
-                    'created': data.get('created', 0),
-                    'model': data.get('model', model),
-                    'choices': data.get('choices', []),
-                    'usage': data.get('usage', {})
-                }
+                return self._format_result(response.json(), model, 'chat.completion')
 
         except Exception as e:
             return {
@@ -123,23 +128,63 @@ class LMStudioProvider:
                 'usage': {}
             }
 
-    def _stream_chat(self, response) -> Iterator[Dict[str, Any]]:
-        """Stream chat response"""
-        for line in response.iter_lines():
+    def _build_payload(
+        self,
+        input_key: str,
+        input_value: Any,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        stream: bool,
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build a chat/completion request body"""
+        payload = {
+            'model': model,
+            input_key: input_value,
+            'temperature': temperature,
+            'stream': stream
+        }
+
+        if max_tokens:
+            payload['max_tokens'] = max_tokens
+
+        # Add additional parameters
+        payload.update(kwargs)
+        return payload
+
+    def _format_result(self, data: Dict[str, Any], model: str, default_object: str) -> Dict[str, Any]:
+        """Normalize a non-streaming chat/completion response"""
+        return {
+            'id': data.get('id', ''),
+            'object': data.get('object', default_object),
+            'created': data.get('created', 0),
+            'model': data.get('model', model),
+            'choices': data.get('choices', []),
+            'usage': data.get('usage', {})
+        }
+
+    def _iter_events(self, response) -> Iterator[Dict[str, Any]]:
+        """Decode server-sent event frames without converting them to str"""
+        loads = orjson.loads if orjson is not None else json.loads
+
+        for line in response.iter_lines(chunk_size=8192):
             if line:
-                line_text = line.decode('utf-8')
-                if line_text.startswith('data: '):
-                    line_text = line_text[6:]  # Remove 'data: ' prefix
+                if line.startswith(SSE_DATA_PREFIX):
+                    line = line[len(SSE_DATA_PREFIX):]
 
-                if line_text == '[DONE]':
+                if line == SSE_DONE:
                     break
 
                 try:
-                    data = json.loads(line_text)
-                    yield data
-                except json.JSONDecodeError:
+                    yield loads(line)
+                except ValueError:
                     continue
 
+    def _stream_chat(self, response) -> Iterator[Dict[str, Any]]:
+        """Stream chat response"""
+        yield from self._iter_events(response)
+
     def completion(
         self,
         model: str,
@@ -164,19 +209,9 @@ class LMStudioProvider:
             Completion result or iterator if streaming
         """
         try:
-            payload = {
-                'model': model,
-                'prompt': prompt,
-                'temperature': temperature,
-                'stream': stream
-            }
-
-            if max_tokens:
-                payload['max_tokens'] = max_tokens
-
-            payload.update(kwargs)
+            payload = self._build_payload('prompt', prompt, model, temperature, max_tokens, stream, kwargs)
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/completions",
                 json=payload,
                 stream=stream
@@ -186,15 +221,7 @@ class LMStudioProvider:
             if stream:
                 return self._stream_completion(response)
             else:
-                data = response.json()
-                return {
-                    'id': data.get('id', ''),
-                    'object': data.get('object', 'text_completion'),
-                    'created': data.get('created', 0),
-                    'model': data.get('model', model),
-                    'choices': data.get('choices', []),
-                    'usage': data.get('usage', {})
-                }
+                return self._format_result(response.json(), model, 'text_completion')
 
         except Exception as e:
             return {
@@ -205,20 +232,134 @@ class LMStudioProvider:
 
     def _stream_completion(self, response) -> Iterator[Dict[str, Any]]:
         """Stream completion response"""
-        for line in response.iter_lines():
-            if line:
-                line_text = line.decode('utf-8')
-                if line_text.startswith('data: '):
-                    line_text = line_text[6:]
+        yield from self._iter_events(response)
+
+    def _get_async_client(self):
+        """Get the async client for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            if httpx is None:
+                raise RuntimeError("Async LM Studio calls require the httpx package")
+
+            try:
+                self._aclient = httpx.AsyncClient(base_url=self.base_url, http2=True, timeout=None)
+            except ImportError:
+                # HTTP/2 support needs the optional h2 package
+                self._aclient = httpx.AsyncClient(base_url=self.base_url, timeout=None)
+            self._aclient_loop = loop
+
+        return self._aclient
+
+    async def _aiter_events(self, path: str, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream server-sent event frames from an async request"""
+        loads = orjson.loads if orjson is not None else json.loads
+        client = self._get_async_client()
+
+        async with client.stream('POST', path, json=payload) as response:
+            response.raise_for_status()
 
-                if line_text == '[DONE]':
-                    break
+            async for line in response.aiter_lines():
+                if line:
+                    if line.startswith('data: '):
+                        line = line[6:]
 
-                try:
-                    data = json.loads(line_text)
-                    yield data
-                except json.JSONDecodeError:
-                    continue
+                    if line == '[DONE]':
+                        break
+
+                    try:
+                        yield loads(line)
+                    except ValueError:
+                        continue
+
+    async def achat(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Async chat completion (OpenAI-compatible)
+
+        Concurrent calls share one connection pool (multiplexed over a
+        single HTTP/2 connection when h2 is installed).
+
+        Args:
+            model: Model ID
+            messages: List of message dictionaries
+            temperature: Sampling temperature
+            max_tokens: Max tokens to generate
+            stream: Enable streaming
+            **kwargs: Additional parameters
+
+        Returns:
+            Chat result or async iterator if streaming
+        """
+        payload = self._build_payload('messages', messages, model, temperature, max_tokens, stream, kwargs)
+
+        if stream:
+            return self._aiter_events('/chat/completions', payload)
+
+        try:
+            response = await self._get_async_client().post('/chat/completions', json=payload)
+            response.raise_for_status()
+            return self._format_result(response.json(), model, 'chat.completion')
+
+        except Exception as e:
+            return {
+                'error': str(e),
+                'choices': [{'message': {'role': 'assistant', 'content': ''}}],
+                'usage': {}
+            }
+
+    async def acompletion(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Async text completion (OpenAI-compatible)
+
+        Args:
+            model: Model ID
+            prompt: Text prompt
+            temperature: Sampling temperature
+            max_tokens: Max tokens to generate
+            stream: Enable streaming
+            **kwargs: Additional parameters
+
+        Returns:
+            Completion result or async iterator if streaming
+        """
+        payload = self._build_payload('prompt', prompt, model, temperature, max_tokens, stream, kwargs)
+
+        if stream:
+            return self._aiter_events('/completions', payload)
+
+        try:
+            response = await self._get_async_client().post('/completions', json=payload)
+            response.raise_for_status()
+            return self._format_result(response.json(), model, 'text_completion')
+
+        except Exception as e:
+            return {
+                'error': str(e),
+                'choices': [{'text': ''}],
+                'usage': {}
+            }
+
+    async def aclose(self):
+        """Close the async client"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
 
     def embeddings(
         self,
@@ -236,7 +377,7 @@ class LMStudioProvider:
             Embeddings result
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/embeddings",
                 json={
                     'model': model,
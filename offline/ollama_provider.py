@@ -2,11 +2,150 @@
 Ollama Provider
 Local model inference using Ollama
 """
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+import copy
+import hashlib
 import json
-from typing import Dict, Any, List, Optional, Iterator
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+# NDJSON line decoder; orjson parses the raw bytes without a decode step
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Request body encoder producing bytes
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _cache_key(payload: Dict[str, Any]) -> bytes:
+    """Stable 16-byte digest of a request payload"""
+    if orjson is not None:
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+# simdjson parsers reuse their buffers, so one is shared behind a lock
+_simdjson_parser = simdjson.Parser() if simdjson is not None else None
+_simdjson_lock = threading.Lock()
+
+
+def _parse_embedding(content: bytes) -> List[float]:
+    """Extract the 'embedding' array from an embeddings response body"""
+    if _simdjson_parser is not None:
+        with _simdjson_lock:
+            embedding = _simdjson_parser.parse(content).get('embedding')
+            return embedding.as_list() if embedding is not None else []
+
+    return _loads(content).get('embedding') or []
+
+
+# Default sampling temperature, and the shared options dict sent when a
+# call overrides nothing (never mutated)
+DEFAULT_TEMPERATURE = 0.7
+_FAST_OPTS = {'temperature': DEFAULT_TEMPERATURE}
+
+# (connect, read) timeouts; the read timeout bounds the gap between chunks
+DEFAULT_TIMEOUT = (5, 300)
+
+# Embedding dtypes selectable with CHALICE_EMBED_DTYPE
+EMBED_DTYPES = {'fp32': np.float32, 'fp16': np.float16}
+
+# Response caches: entries per cache (0 disables) and lifetime in seconds.
+# Only deterministic requests are cached (temperature 0, non-streaming).
+DEFAULT_GENERATE_CACHE_SIZE = 256
+DEFAULT_EMBEDDINGS_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 600.0
+
+# Minimum seconds between pull/create progress redraws
+PROGRESS_INTERVAL = 0.05
+
+# Seconds an is_available() probe result is reused
+AVAILABILITY_TTL = 2.0
+
+# Stream batching defaults: the first yield carries at most MIN tokens,
+# each later one up to GROWTH times more, capped at MAX
+DEFAULT_STREAM_MAX_BATCH = 50
+DEFAULT_STREAM_MIN_BATCH = 1
+DEFAULT_STREAM_GROWTH = 3
+
+
+def _iter_ndjson_reads(response) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Parse a streamed NDJSON body, one list of records per network read
+
+    Splits raw bytes in a local buffer instead of going through
+    iter_lines(), so nothing is decoded or re-scanned in Python.
+    """
+    buffer = b''
+
+    for chunk in response.iter_content(chunk_size=None, decode_unicode=False):
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        records = [_loads(line) for line in lines if line.strip()]
+        if records:
+            yield records
+
+    if buffer.strip():
+        yield [_loads(buffer)]
+
+
+def _iter_ndjson(response) -> Iterator[Dict[str, Any]]:
+    """Parse a streamed NDJSON body record by record"""
+    for records in _iter_ndjson_reads(response):
+        yield from records
+
+
+class _ProgressLine:
+    """
+    Single-line progress display redrawn at most every PROGRESS_INTERVAL
+
+    Only the latest status is kept between redraws, since each redraw
+    overwrites the line anyway.
+    """
+
+    def __init__(self):
+        self.pending = ''
+        self.last_flush = time.monotonic()
+
+    def update(self, text: str):
+        self.pending = text
+        now = time.monotonic()
+        if now - self.last_flush > PROGRESS_INTERVAL:
+            self.flush()
+            self.last_flush = now
+
+    def flush(self):
+        if self.pending:
+            sys.stdout.write('\r' + self.pending)
+            sys.stdout.flush()
+            self.pending = ''
+
 
 class OllamaProvider:
     """
@@ -29,13 +168,115 @@ class OllamaProvider:
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/api"
 
+        # Pooled keep-alive session shared by every call
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers['User-Agent'] = 'chalice-cli'
+
+        # (monotonic timestamp, result) of the last availability probe
+        self._avail_cache = (0.0, False)
+
+        # Streamed tokens that arrive together are yielded together
+        self.stream_max_batch = int(os.getenv("CHALICE_STREAM_BATCH", DEFAULT_STREAM_MAX_BATCH))
+        self.stream_min_batch = int(os.getenv("CHALICE_STREAM_MIN_BATCH", DEFAULT_STREAM_MIN_BATCH))
+        self.stream_growth = int(os.getenv("CHALICE_STREAM_GROWTH", DEFAULT_STREAM_GROWTH))
+
+        # Embeddings are returned as arrays of this dtype
+        self.embed_dtype = EMBED_DTYPES.get(os.getenv("CHALICE_EMBED_DTYPE", "fp32"), np.float32)
+
+        # LRU caches of (stored_at, result) keyed by payload digest
+        self.generate_cache_size = int(os.getenv("CHALICE_GENERATE_CACHE_SIZE", DEFAULT_GENERATE_CACHE_SIZE))
+        self.embeddings_cache_size = int(os.getenv("CHALICE_EMBEDDINGS_CACHE_SIZE", DEFAULT_EMBEDDINGS_CACHE_SIZE))
+        self.cache_ttl = float(os.getenv("CHALICE_CACHE_TTL", DEFAULT_CACHE_TTL))
+        self._gen_cache: OrderedDict[bytes, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._embed_cache: OrderedDict[bytes, Tuple[float, np.ndarray]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def close(self):
+        """Close pooled connections"""
+        self._session.close()
+
+    def __del__(self):
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+
+    def _options(
+        self,
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the sampling options for generate/chat"""
+        if not kwargs and not max_tokens and temperature == DEFAULT_TEMPERATURE:
+            return _FAST_OPTS
+
+        options = {'temperature': temperature}
+        if max_tokens:
+            options['num_predict'] = max_tokens
+        if kwargs:
+            options.update(kwargs)
+        return options
+
+    def _cache_get(self, cache: OrderedDict, key: bytes) -> Any:
+        """Return a live cached value (marking it recently used) or None"""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del cache[key]
+                return None
+
+            cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key: bytes, value: Any, max_size: int):
+        """Store a value, evicting the least recently used entries"""
+        if max_size <= 0:
+            return
+
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached generate/embeddings results"""
+        with self._cache_lock:
+            self._gen_cache.clear()
+            self._embed_cache.clear()
+
+    def _post_json(self, endpoint: str, payload: Dict[str, Any], stream: bool = False):
+        """POST a payload pre-encoded with orjson (when installed)"""
+        return self._session.post(
+            f"{self.api_url}/{endpoint}",
+            data=_dumps(payload),
+            headers=JSON_HEADERS,
+            stream=stream,
+            timeout=DEFAULT_TIMEOUT
+        )
+
     def is_available(self) -> bool:
-        """Check if Ollama is running"""
+        """Check if Ollama is running (cached for AVAILABILITY_TTL seconds)"""
+        checked_at, available = self._avail_cache
+        now = time.monotonic()
+        if checked_at and now - checked_at < AVAILABILITY_TTL:
+            return available
+
         try:
-            response = requests.get(f"{self.base_url}/", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
+            response = self._session.head(f"{self.api_url}/version", timeout=0.5)
+            available = response.status_code == 200
+        except requests.RequestException:
+            available = False
+
+        self._avail_cache = (now, available)
+        return available
 
     def list_models(self) -> List[Dict[str, Any]]:
         """
@@ -45,9 +286,9 @@ class OllamaProvider:
             List of model information dictionaries
         """
         try:
-            response = requests.get(f"{self.api_url}/tags")
+            response = self._session.get(f"{self.api_url}/tags", timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             models = []
             for model in data.get('models', []):
@@ -78,25 +319,25 @@ class OllamaProvider:
         try:
             print(f"Pulling model: {model_name}...")
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/pull",
                 json={'name': model_name},
-                stream=True
+                stream=True,
+                timeout=DEFAULT_TIMEOUT
             )
             response.raise_for_status()
 
             # Stream progress
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line)
-                    status = data.get('status', '')
-                    if 'total' in data and 'completed' in data:
-                        total = data['total']
-                        completed = data['completed']
-                        pct = (completed / total * 100) if total > 0 else 0
-                        print(f"\r{status}: {pct:.1f}%", end='')
-                    else:
-                        print(f"\r{status}", end='')
+            progress = _ProgressLine()
+            for data in _iter_ndjson(response):
+                status = data.get('status') or ''
+                total = data.get('total')
+                completed = data.get('completed')
+                if total and completed is not None:
+                    progress.update('%s: %.1f%%' % (status, completed * 100.0 / total))
+                else:
+                    progress.update(status)
+            progress.flush()
 
             print("\n✓ Model pulled successfully")
             return True
@@ -116,9 +357,10 @@ class OllamaProvider:
             bool: True if successful
         """
         try:
-            response = requests.delete(
+            response = self._session.delete(
                 f"{self.api_url}/delete",
-                json={'name': model_name}
+                json={'name': model_name},
+                timeout=DEFAULT_TIMEOUT
             )
             response.raise_for_status()
             print(f"✓ Deleted model: {model_name}")
@@ -133,7 +375,7 @@ class OllamaProvider:
         model: str,
         prompt: str,
         system: Optional[str] = None,
-        temperature: float = 0.7,
+        temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: Optional[int] = None,
         stream: bool = False,
         **kwargs
@@ -158,32 +400,27 @@ class OllamaProvider:
                 'model': model,
                 'prompt': prompt,
                 'stream': stream,
-                'options': {
-                    'temperature': temperature
-                }
+                'options': self._options(temperature, max_tokens, kwargs)
             }
 
             if system:
                 payload['system'] = system
 
-            if max_tokens:
-                payload['options']['num_predict'] = max_tokens
-
-            # Merge additional options
-            payload['options'].update(kwargs)
+            cache_key = None
+            if temperature == 0 and not stream:
+                cache_key = _cache_key(payload)
+                cached = self._cache_get(self._gen_cache, cache_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
 
-            response = requests.post(
-                f"{self.api_url}/generate",
-                json=payload,
-                stream=stream
-            )
+            response = self._post_json('generate', payload, stream)
             response.raise_for_status()
 
             if stream:
                 return self._stream_generate(response)
             else:
                 data = response.json()
-                return {
+                result = {
                     'response': data.get('response', ''),
                     'model': model,
                     'done': data.get('done', False),
@@ -194,6 +431,11 @@ class OllamaProvider:
                     'eval_count': data.get('eval_count', 0)
                 }
 
+                if cache_key is not None:
+                    self._cache_put(self._gen_cache, cache_key, copy.deepcopy(result), self.generate_cache_size)
+
+                return result
+
         except Exception as e:
             return {
                 'error': str(e),
@@ -201,21 +443,35 @@ class OllamaProvider:
                 'done': True
             }
 
+    def _iter_batches(self, response) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Group streamed NDJSON lines that arrived in the same network read
+
+        Nothing waits for more data: a batch is whatever complete lines the
+        last read delivered, capped at a size that starts at
+        stream_min_batch and grows by stream_growth up to stream_max_batch.
+        """
+        limit = max(1, self.stream_min_batch)
+
+        for batch in _iter_ndjson_reads(response):
+            while batch:
+                yield batch[:limit]
+                batch = batch[limit:]
+                limit = min(max(limit * self.stream_growth, limit + 1), max(1, self.stream_max_batch))
+
     def _stream_generate(self, response) -> Iterator[Dict[str, Any]]:
         """Stream generation response"""
-        for line in response.iter_lines():
-            if line:
-                data = json.loads(line)
-                yield {
-                    'response': data.get('response', ''),
-                    'done': data.get('done', False)
-                }
+        for batch in self._iter_batches(response):
+            yield {
+                'response': ''.join(data.get('response', '') for data in batch),
+                'done': batch[-1].get('done', False)
+            }
 
     def chat(
         self,
         model: str,
         messages: List[Dict[str, str]],
-        temperature: float = 0.7,
+        temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: Optional[int] = None,
         stream: bool = False,
         **kwargs
@@ -239,21 +495,10 @@ class OllamaProvider:
                 'model': model,
                 'messages': messages,
                 'stream': stream,
-                'options': {
-                    'temperature': temperature
-                }
+                'options': self._options(temperature, max_tokens, kwargs)
             }
 
-            if max_tokens:
-                payload['options']['num_predict'] = max_tokens
-
-            payload['options'].update(kwargs)
-
-            response = requests.post(
-                f"{self.api_url}/chat",
-                json=payload,
-                stream=stream
-            )
+            response = self._post_json('chat', payload, stream)
             response.raise_for_status()
 
             if stream:
@@ -279,13 +524,30 @@ class OllamaProvider:
 
     def _stream_chat(self, response) -> Iterator[Dict[str, Any]]:
         """Stream chat response"""
-        for line in response.iter_lines():
-            if line:
-                data = json.loads(line)
-                yield {
-                    'message': data.get('message', {}),
-                    'done': data.get('done', False)
-                }
+        for batch in self._iter_batches(response):
+            merged: List[Dict[str, Any]] = []
+
+            for data in batch:
+                message = data.get('message', {})
+                previous = merged[-1]['message'] if merged else None
+
+                # Only plain content deltas are merged; anything carrying
+                # extra fields (e.g. tool calls) is passed through as is
+                if (
+                    previous is not None
+                    and not merged[-1]['done']
+                    and previous.keys() <= {'role', 'content'}
+                    and message.keys() <= {'role', 'content'}
+                ):
+                    previous['content'] = previous.get('content', '') + message.get('content', '')
+                    merged[-1]['done'] = data.get('done', False)
+                else:
+                    merged.append({
+                        'message': dict(message),
+                        'done': data.get('done', False)
+                    })
+
+            yield from merged
 
     def get_model_info(self, model_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -298,12 +560,13 @@ class OllamaProvider:
             Model information dictionary
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/show",
-                json={'name': model_name}
+                json={'name': model_name},
+                timeout=DEFAULT_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             return {
                 'modelfile': data.get('modelfile', ''),
@@ -337,23 +600,23 @@ class OllamaProvider:
         try:
             print(f"Creating model: {name}...")
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_url}/create",
                 json={
                     'name': name,
                     'modelfile': modelfile,
                     'stream': stream
                 },
-                stream=stream
+                stream=stream,
+                timeout=DEFAULT_TIMEOUT
             )
             response.raise_for_status()
 
             if stream:
-                for line in response.iter_lines():
-                    if line:
-                        data = json.loads(line)
-                        status = data.get('status', '')
-                        print(f"\r{status}", end='')
+                progress = _ProgressLine()
+                for data in _iter_ndjson(response):
+                    progress.update(data.get('status') or '')
+                progress.flush()
 
             print("\n✓ Model created successfully")
             return True
@@ -366,7 +629,7 @@ class OllamaProvider:
         self,
         model: str,
         prompt: str
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         """
         Generate embeddings
 
@@ -375,20 +638,25 @@ class OllamaProvider:
             prompt: Text to embed
 
         Returns:
-            List of embedding values
+            Embedding vector (float32, or float16 with CHALICE_EMBED_DTYPE=fp16)
         """
         try:
-            response = requests.post(
-                f"{self.api_url}/embeddings",
-                json={
-                    'model': model,
-                    'prompt': prompt
-                }
-            )
+            payload = {
+                'model': model,
+                'prompt': prompt
+            }
+
+            cache_key = _cache_key(payload)
+            cached = self._cache_get(self._embed_cache, cache_key)
+            if cached is not None:
+                return cached.copy()
+
+            response = self._post_json('embeddings', payload)
             response.raise_for_status()
-            data = response.json()
 
-            return data.get('embedding', [])
+            embedding = np.asarray(_parse_embedding(response.content), dtype=self.embed_dtype)
+            self._cache_put(self._embed_cache, cache_key, embedding.copy(), self.embeddings_cache_size)
+            return embedding
 
         except Exception as e:
             print(f"Error generating embeddings: {e}")
@@ -12,7 +12,9 @@ from .plugin import (
     PluginTool,
     PluginContext,
     AVAILABLE_HOOKS,
-    create_plugin_template
+    AVAILABLE_HOOK_NAMES,
+    create_plugin_template,
+    pure_handler
 )
 from .manager import (
     PluginManager,
@@ -29,7 +31,9 @@ __all__ = [
     'PluginTool',
     'PluginContext',
     'AVAILABLE_HOOKS',
+    'AVAILABLE_HOOK_NAMES',
     'create_plugin_template',
+    'pure_handler',
     'PluginManager',
     'get_plugin_manager'
 ]
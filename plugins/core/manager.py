@@ -2,22 +2,55 @@
 Plugin Manager
 Handles plugin loading, lifecycle, and dependency management
 """
+import graphlib
 import importlib
+import importlib.machinery
 import importlib.util
+import logging
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .plugin import (
     Plugin,
     PluginMetadata,
     PluginLifecycle,
     PluginHook,
     PluginContext,
-    AVAILABLE_HOOKS
+    AVAILABLE_HOOKS,
+    AVAILABLE_HOOK_NAMES
 )
 
 
+def _default_plugin_log_handler():
+    """
+    Print plugin log messages to stdout when logging isn't configured
+
+    PluginContext.log used to print every message as "[LEVEL] message";
+    without a handler INFO and DEBUG messages would be dropped. Records
+    handled here don't also propagate, so configuring logging later doesn't
+    print them twice.
+    """
+    log = logging.getLogger("chalice.plugin")
+    if log.hasHandlers():
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+
+
 class PluginManager:
     """
     Plugin Manager
@@ -39,30 +72,89 @@ class PluginManager:
         self.plugin_dir.mkdir(parents=True, exist_ok=True)
 
         self.plugins: Dict[str, Plugin] = {}
+
+        # Global hooks, created on first registration (see _get_hook)
         self.hooks: Dict[str, PluginHook] = {}
         self.context = PluginContext()
+        _default_plugin_log_handler()
+
+        # Serializes plugin/hook registry updates
+        self._lock = threading.RLock()
+
+        # Plugin IDs found by the last directory scan (None until scanned)
+        self._discovered: Optional[List[str]] = None
+
+        # Module specs with their source loaders, reused across (re)loads
+        self._specs: Dict[str, importlib.machinery.ModuleSpec] = {}
 
-        # Initialize available hooks
-        for hook_name, description in AVAILABLE_HOOKS.items():
-            self.hooks[hook_name] = PluginHook(hook_name, description)
+    def _get_hook(self, hook_name: str) -> Optional[PluginHook]:
+        """
+        Get a global hook, creating it on first use
+
+        Returns:
+            The hook, or None if hook_name is not an available hook
+        """
+        hook = self.hooks.get(hook_name)
+        if hook is None and hook_name in AVAILABLE_HOOK_NAMES:
+            with self._lock:
+                hook = self.hooks.get(hook_name)
+                if hook is None:
+                    hook = self.hooks[hook_name] = PluginHook(hook_name, AVAILABLE_HOOKS[hook_name])
+        return hook
 
     def discover_plugins(self) -> List[str]:
         """
         Discover available plugins
 
+        The plugin directory is scanned once; call rescan() to pick up
+        plugins installed since.
+
         Returns:
             List of plugin IDs
         """
-        discovered = []
-
-        for plugin_path in self.plugin_dir.glob("*/plugin.py"):
+        if self._discovered is None:
             try:
-                plugin_id = plugin_path.parent.name
-                discovered.append(plugin_id)
-            except Exception as e:
-                print(f"Error discovering plugin: {e}")
+                with os.scandir(self.plugin_dir) as entries:
+                    self._discovered = [
+                        entry.name for entry in entries
+                        if entry.is_dir()
+                        and os.path.isfile(os.path.join(entry.path, 'plugin.py'))
+                    ]
+            except OSError as e:
+                print(f"Error discovering plugins: {e}")
+                return []
+
+        return list(self._discovered)
+
+    def rescan(self) -> List[str]:
+        """
+        Rescan the plugin directory
+
+        Returns:
+            List of plugin IDs
+        """
+        self._discovered = None
+        self._specs.clear()
+        return self.discover_plugins()
+
+    def _plugin_spec(self, plugin_id: str, plugin_path: Path) -> Optional[importlib.machinery.ModuleSpec]:
+        """
+        Get the module spec for a plugin, building it on first use
 
-        return discovered
+        The SourceFileLoader checks the source mtime against its cached
+        bytecode on every exec, so reusing the spec still picks up edits.
+        """
+        spec = self._specs.get(plugin_id)
+        if spec is None:
+            module_name = f"plugins.{plugin_id}"
+            spec = importlib.util.spec_from_file_location(
+                module_name,
+                plugin_path,
+                loader=importlib.machinery.SourceFileLoader(module_name, str(plugin_path))
+            )
+            if spec is not None:
+                self._specs[plugin_id] = spec
+        return spec
 
     def load_plugin(self, plugin_id: str) -> bool:
         """
@@ -78,19 +170,35 @@ class PluginManager:
             print(f"Plugin {plugin_id} already loaded")
             return True
 
+        plugin = self._import_plugin(plugin_id)
+        if plugin is None or not self._load_imported(plugin_id, plugin):
+            return False
+
+        return self._register_plugin(plugin_id, plugin)
+
+    def _import_plugin(self, plugin_id: str) -> Optional[Plugin]:
+        """
+        Import a plugin module and instantiate it
+
+        Touches no manager state and runs no lifecycle methods, so several
+        plugins can be imported concurrently.
+
+        Args:
+            plugin_id: Plugin identifier
+
+        Returns:
+            Loaded plugin, or None on failure
+        """
         plugin_path = self.plugin_dir / plugin_id / "plugin.py"
         if not plugin_path.exists():
             print(f"Plugin file not found: {plugin_path}")
-            return False
+            return None
 
         try:
             # Import the plugin module
-            spec = importlib.util.spec_from_file_location(
-                f"plugins.{plugin_id}",
-                plugin_path
-            )
+            spec = self._plugin_spec(plugin_id, plugin_path)
             if spec is None or spec.loader is None:
-                return False
+                return None
 
             module = importlib.util.module_from_spec(spec)
             sys.modules[f"plugins.{plugin_id}"] = module
@@ -103,8 +211,28 @@ class PluginManager:
                 plugin = module.Plugin()
             else:
                 print(f"Plugin {plugin_id} has no entry point")
-                return False
+                return None
+
+            return plugin
+
+        except Exception as e:
+            print(f"Error loading plugin {plugin_id}: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def _load_imported(self, plugin_id: str, plugin: Plugin) -> bool:
+        """
+        Run on_load for an imported plugin
+
+        Args:
+            plugin_id: Plugin identifier
+            plugin: Plugin returned by _import_plugin
 
+        Returns:
+            bool: True if loaded successfully
+        """
+        try:
             # Set plugin state
             plugin.state = PluginLifecycle.LOADING
 
@@ -115,26 +243,46 @@ class PluginManager:
                 return False
 
             plugin.state = PluginLifecycle.LOADED
+            return True
+
+        except Exception as e:
+            print(f"Error loading plugin {plugin_id}: {e}")
+            import traceback
+            traceback.print_exc()
+            plugin.state = PluginLifecycle.ERROR
+            return False
+
+    def _register_plugin(self, plugin_id: str, plugin: Plugin) -> bool:
+        """
+        Register a loaded plugin and its hooks with the manager
+
+        Args:
+            plugin_id: Plugin identifier
+            plugin: Plugin loaded by _load_imported
 
-            # Register plugin hooks with global hooks
-            for hook_name, hook in plugin.hooks.items():
-                if hook_name in self.hooks:
-                    for handler, priority in hook.handlers:
-                        self.hooks[hook_name].register(handler, priority)
+        Returns:
+            bool: True if registered successfully
+        """
+        try:
+            with self._lock:
+                # Register plugin hooks with global hooks
+                for hook_name, hook in plugin.hooks.items():
+                    global_hook = self._get_hook(hook_name)
+                    if global_hook is not None:
+                        for handler, priority in hook.handlers:
+                            global_hook.register(handler, priority)
 
-            # Store plugin
-            self.plugins[plugin_id] = plugin
+                # Store plugin
+                self.plugins[plugin_id] = plugin
 
-            # Trigger plugin loaded hook
-            self.trigger_hook('plugin.loaded', plugin=plugin)
+                # Trigger plugin loaded hook
+                self.trigger_hook('plugin.loaded', plugin=plugin)
 
             print(f"✓ Loaded plugin: {plugin.metadata.name} v{plugin.metadata.version}")
             return True
 
         except Exception as e:
             print(f"Error loading plugin {plugin_id}: {e}")
-            import traceback
-            traceback.print_exc()
             return False
 
     def unload_plugin(self, plugin_id: str) -> bool:
@@ -163,9 +311,10 @@ class PluginManager:
 
             # Unregister hooks
             for hook_name in plugin.hooks:
-                if hook_name in self.hooks:
-                    for handler, _ in plugin.hooks[hook_name].handlers:
-                        self.hooks[hook_name].unregister(handler)
+                global_hook = self.hooks.get(hook_name)
+                if global_hook is not None:
+                    to_remove = {handler for handler, _ in plugin.hooks[hook_name].handlers}
+                    global_hook.unregister_many(to_remove)
 
             # Unload plugin
             plugin.on_unload()
@@ -292,7 +441,8 @@ class PluginManager:
         """
         if state is None:
             return list(self.plugins.values())
-        return [p for p in self.plugins.values() if p.state == state]
+        target = int(state)
+        return [p for p in self.plugins.values() if p.state == target]
 
     def trigger_hook(self, hook_name: str, *args, **kwargs) -> List[Any]:
         """
@@ -306,10 +456,11 @@ class PluginManager:
         Returns:
             List of results from all handlers
         """
-        if hook_name not in self.hooks:
+        hook = self.hooks.get(hook_name)
+        if hook is None:
             return []
 
-        return self.hooks[hook_name].trigger(*args, **kwargs)
+        return hook.trigger(*args, **kwargs)
 
     def trigger_hook_until(
         self,
@@ -330,10 +481,11 @@ class PluginManager:
         Returns:
             First result that meets condition, or None
         """
-        if hook_name not in self.hooks:
+        hook = self.hooks.get(hook_name)
+        if hook is None:
             return None
 
-        return self.hooks[hook_name].trigger_until(condition, *args, **kwargs)
+        return hook.trigger_until(condition, *args, **kwargs)
 
     def get_plugin_info(self, plugin_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -351,7 +503,7 @@ class PluginManager:
 
         return {
             'metadata': plugin.metadata.to_dict(),
-            'state': plugin.state.value,
+            'state': plugin.state.label,
             'config': plugin.config,
             'hooks': list(plugin.hooks.keys())
         }
@@ -388,10 +540,27 @@ class PluginManager:
             Dictionary of plugin_id -> success
         """
         discovered = self.discover_plugins()
+        to_import = [plugin_id for plugin_id in discovered if plugin_id not in self.plugins]
+        imported: Dict[str, Optional[Plugin]] = {}
+
+        # Module imports are I/O bound, so run them side by side; on_load
+        # runs afterwards, here, so dependencies load before dependents
+        if to_import:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                imported = dict(zip(to_import, executor.map(self._import_plugin, to_import)))
+
         results = {}
 
-        for plugin_id in discovered:
-            success = self.load_plugin(plugin_id)
+        for plugin_id in self._topo_sort(discovered, imported):
+            if plugin_id in imported:
+                plugin = imported[plugin_id]
+                success = (
+                    plugin is not None
+                    and self._load_imported(plugin_id, plugin)
+                    and self._register_plugin(plugin_id, plugin)
+                )
+            else:
+                success = self.load_plugin(plugin_id)
             results[plugin_id] = success
 
             if success and auto_enable:
@@ -399,6 +568,38 @@ class PluginManager:
 
         return results
 
+    def _topo_sort(
+        self,
+        plugin_ids: List[str],
+        imported: Dict[str, Optional[Plugin]]
+    ) -> List[str]:
+        """
+        Order plugins so each comes after the plugins it depends on
+
+        Dependencies are read from the metadata of freshly imported or
+        already loaded plugins; dependencies outside plugin_ids are ignored.
+
+        Args:
+            plugin_ids: Plugin identifiers to order
+            imported: Plugins imported but not yet registered
+
+        Returns:
+            Plugin IDs in load order (discovery order if there is a cycle)
+        """
+        known = set(plugin_ids)
+        graph = {}
+
+        for plugin_id in plugin_ids:
+            plugin = imported.get(plugin_id) or self.plugins.get(plugin_id)
+            dependencies = plugin.metadata.dependencies if plugin is not None else []
+            graph[plugin_id] = [dep for dep in dependencies if dep in known]
+
+        try:
+            return list(graphlib.TopologicalSorter(graph).static_order())
+        except graphlib.CycleError as e:
+            print(f"Plugin dependency cycle: {' -> '.join(e.args[1])}")
+            return list(plugin_ids)
+
     def save_plugin_state(self, file_path: Optional[Path] = None):
         """Save plugin states to file"""
         if file_path is None:
@@ -407,15 +608,20 @@ class PluginManager:
         state = {
             'plugins': {
                 plugin_id: {
-                    'state': plugin.state.value,
+                    'state': plugin.state.label,
                     'config': plugin.config
                 }
                 for plugin_id, plugin in self.plugins.items()
             }
         }
 
-        with open(file_path, 'w') as f:
-            json.dump(state, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(state, indent=2).encode('utf-8')
+
+        with open(file_path, 'wb') as f:
+            f.write(data)
 
     def load_plugin_state(self, file_path: Optional[Path] = None):
         """Load plugin states from file"""
@@ -425,13 +631,15 @@ class PluginManager:
         if not file_path.exists():
             return
 
-        with open(file_path, 'r') as f:
-            state = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        state = orjson.loads(data) if orjson is not None else json.loads(data)
 
         for plugin_id, plugin_state in state['plugins'].items():
             if plugin_id in self.plugins:
                 self.plugins[plugin_id].config = plugin_state.get('config', {})
-                target_state = PluginLifecycle(plugin_state['state'])
+                target_state = PluginLifecycle.from_label(plugin_state['state'])
 
                 if target_state == PluginLifecycle.ACTIVE:
                     self.enable_plugin(plugin_id)
@@ -441,11 +649,14 @@ class PluginManager:
 
 # Global plugin manager instance
 _plugin_manager = None
+_pm_lock = threading.Lock()
 
 
 def get_plugin_manager() -> PluginManager:
     """Get the global plugin manager instance"""
     global _plugin_manager
     if _plugin_manager is None:
-        _plugin_manager = PluginManager()
+        with _pm_lock:
+            if _plugin_manager is None:
+                _plugin_manager = PluginManager()
     return _plugin_manager
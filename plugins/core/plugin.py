@@ -4,13 +4,49 @@ Extensible plugin architecture with hot-loading and event hooks
 """
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Callable
-from enum import Enum
+from enum import IntEnum
+import bisect
+import functools
 import importlib
+import importlib.util
+import itertools
+import logging
+import string
+from types import MappingProxyType
 import inspect
+import sys
 from pathlib import Path
 
+_hook_log = logging.getLogger("chalice.plugin.hook")
+_plugin_log = logging.getLogger("chalice.plugin")
 
-class PluginPriority(Enum):
+
+def _lazy_import(name: str):
+    """
+    Import a top-level module whose body runs on first attribute access
+
+    Submodules aren't supported: finding their spec imports the parent.
+
+    Returns:
+        The (possibly not yet executed) module, or None if it isn't found
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class PluginPriority(IntEnum):
     """Plugin execution priority"""
     HIGHEST = 0
     HIGH = 25
@@ -19,47 +55,94 @@ class PluginPriority(Enum):
     LOWEST = 100
 
 
-class PluginLifecycle(Enum):
-    """Plugin lifecycle states"""
-    UNLOADED = "unloaded"
-    LOADING = "loading"
-    LOADED = "loaded"
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    ERROR = "error"
-    UNLOADING = "unloading"
+class PluginLifecycle(IntEnum):
+    """
+    Plugin lifecycle states
+
+    Integer-valued so state comparisons are plain int comparisons;
+    `label` is the lowercase name used in state files and plugin info.
+    """
+    UNLOADED = 0
+    LOADING = 1
+    LOADED = 2
+    ACTIVE = 3
+    INACTIVE = 4
+    ERROR = 5
+    UNLOADING = 6
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> 'PluginLifecycle':
+        return cls[label.upper()]
 
 
 class PluginMetadata:
     """Plugin metadata"""
 
+    __slots__ = (
+        'id', 'name', 'version', 'description', 'author', 'license',
+        'homepage', 'dependencies', 'required_version', 'tags', 'category'
+    )
+
+    # Values for fields missing from the metadata dict
+    _DEFAULTS = {
+        'id': '',
+        'name': '',
+        'version': '1.0.0',
+        'description': '',
+        'author': '',
+        'license': 'MIT',
+        'homepage': '',
+        'dependencies': (),
+        'required_version': '>=3.0.0',
+        'tags': (),
+        'category': 'general'
+    }
+
     def __init__(self, data: Dict[str, Any]):
-        self.id = data.get('id', '')
-        self.name = data.get('name', '')
-        self.version = data.get('version', '1.0.0')
-        self.description = data.get('description', '')
-        self.author = data.get('author', '')
-        self.license = data.get('license', 'MIT')
-        self.homepage = data.get('homepage', '')
-        self.dependencies = data.get('dependencies', [])
-        self.required_version = data.get('required_version', '>=3.0.0')
-        self.tags = data.get('tags', [])
-        self.category = data.get('category', 'general')
+        values = {**self._DEFAULTS, **data}
+        for key in self.__slots__:
+            setattr(self, key, values[key])
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'version': self.version,
-            'description': self.description,
-            'author': self.author,
-            'license': self.license,
-            'homepage': self.homepage,
-            'dependencies': self.dependencies,
-            'required_version': self.required_version,
-            'tags': self.tags,
-            'category': self.category
-        }
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def pure_handler(handler: Callable = None, *, maxsize: int = 256):
+    """
+    Memoize a hook handler whose result depends only on its arguments
+
+    Repeated triggers with equal arguments return the cached result
+    instead of running the handler again. Calls with unhashable arguments
+    run the handler uncached. Use as @pure_handler or
+    @pure_handler(maxsize=...); the wrapper exposes cache_clear().
+
+    Args:
+        handler: Handler to memoize
+        maxsize: Number of distinct argument sets to remember
+
+    Returns:
+        The memoizing handler
+    """
+    if handler is None:
+        return functools.partial(pure_handler, maxsize=maxsize)
+
+    cached = functools.lru_cache(maxsize=maxsize)(handler)
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            hash((args, *kwargs.items()))
+        except TypeError:
+            return handler(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
 
 
 class PluginHook:
@@ -72,38 +155,93 @@ class PluginHook:
     def __init__(self, name: str, description: str = ""):
         self.name = name
         self.description = description
-        self.handlers: List[tuple[Callable, int]] = []  # (handler, priority)
-
-    def register(self, handler: Callable, priority: int = PluginPriority.NORMAL.value):
+        # (priority, seq, handler), kept sorted; seq keeps equal
+        # priorities in registration order. Unregistered handlers stay
+        # here as dead entries until the next sweep.
+        self._entries: List[tuple[int, int, Callable]] = []
+        self._seq = itertools.count()
+
+        # Registration count per live handler; unregistering pops it
+        self._live: Dict[Callable, int] = {}
+        self._stale = False
+
+        # Bare handlers in priority order; None after (un)registration
+        self._cache: Optional[tuple[Callable, ...]] = None
+
+    @property
+    def handlers(self) -> List[tuple[Callable, int]]:
+        """Live (handler, priority) pairs in priority order"""
+        return [(handler, priority) for priority, _, handler in self._live_entries()]
+
+    def _live_entries(self) -> List[tuple[int, int, Callable]]:
+        """Live (priority, seq, handler) entries in priority order"""
+        if self._stale:
+            self._sweep()
+        return self._entries
+
+    def _sweep(self):
+        """Drop entries of unregistered handlers"""
+        live = self._live
+        self._entries = [entry for entry in self._entries if entry[2] in live]
+        self._stale = False
+
+    def register(self, handler: Callable, priority: int = PluginPriority.NORMAL):
         """Register a hook handler"""
-        self.handlers.append((handler, priority))
-        # Sort by priority
-        self.handlers.sort(key=lambda x: x[1])
+        # Sweep first so a re-registered handler doesn't revive dead entries
+        if self._stale:
+            self._sweep()
+        bisect.insort(self._entries, (priority, next(self._seq), handler))
+        self._live[handler] = self._live.get(handler, 0) + 1
+        self._cache = None
 
     def unregister(self, handler: Callable):
-        """Unregister a hook handler"""
-        self.handlers = [(h, p) for h, p in self.handlers if h != handler]
+        """Unregister a hook handler (every registration of it)"""
+        if self._live.pop(handler, None) is not None:
+            self._stale = True
+            self._cache = None
+
+    def unregister_many(self, handlers: set):
+        """Unregister several hook handlers"""
+        for handler in handlers:
+            self.unregister(handler)
+
+    def sorted_handlers(self) -> tuple[Callable, ...]:
+        """Handlers ordered by priority (stable for equal priorities)"""
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = tuple(h for _, _, h in self._live_entries())
+        return cache
 
     def trigger(self, *args, **kwargs) -> List[Any]:
         """Trigger all handlers for this hook"""
+        cache = self._cache
+        if cache is None:
+            cache = self.sorted_handlers()
+
         results = []
-        for handler, _ in self.handlers:
+        for handler in cache:
             try:
                 result = handler(*args, **kwargs)
                 results.append(result)
-            except Exception as e:
-                print(f"Hook handler error: {e}")
+            except Exception:
+                if _hook_log.isEnabledFor(logging.ERROR):
+                    _hook_log.exception("Hook handler error in %s", self.name)
         return results
 
     def trigger_until(self, condition: Callable, *args, **kwargs) -> Any:
         """Trigger handlers until condition is met"""
-        for handler, _ in self.handlers:
+        cache = self._cache
+        if cache is None:
+            cache = self.sorted_handlers()
+
+        for handler in cache:
             try:
                 result = handler(*args, **kwargs)
                 if condition(result):
                     return result
-            except Exception as e:
-                print(f"Hook handler error: {e}")
+            except Exception:
+                if _hook_log.isEnabledFor(logging.ERROR):
+                    _hook_log.exception("Hook handler error in %s", self.name)
         return None
 
 
@@ -163,8 +301,11 @@ class Plugin(ABC):
         """Set configuration value"""
         self.config[key] = value
 
-    def register_hook(self, hook_name: str, handler: Callable, priority: int = PluginPriority.NORMAL.value):
+    def register_hook(self, hook_name: str, handler: Callable, priority: int = PluginPriority.NORMAL):
         """Register a hook handler"""
+        if hook_name not in AVAILABLE_HOOK_NAMES and not hook_name.startswith("plugin."):
+            _plugin_log.warning("%s registered unknown hook %s", self.metadata.id, hook_name)
+
         if hook_name not in self.hooks:
             self.hooks[hook_name] = PluginHook(hook_name)
         self.hooks[hook_name].register(handler, priority)
@@ -211,18 +352,30 @@ class PluginContext:
     Gives plugins access to Chalice internals safely
     """
 
+    # MCP package, executed the first time a plugin asks for the client
+    _mcp = _lazy_import("mcp")
+
+    # Accessors resolved on first use and shared by every context
+    _get_mcp_client = None
+    _get_marketplace = None
+
     def __init__(self, chalice_instance=None):
         self.chalice = chalice_instance
         self.data: Dict[str, Any] = {}
 
     def get_mcp_client(self):
         """Get MCP client instance"""
-        from mcp import get_mcp_client
-        return get_mcp_client()
+        get_client = PluginContext._get_mcp_client
+        if get_client is None:
+            get_client = PluginContext._get_mcp_client = self._mcp.get_mcp_client
+        return get_client()
 
     def get_marketplace(self):
         """Get agent marketplace instance"""
-        from agents.marketplace import get_marketplace
+        get_marketplace = PluginContext._get_marketplace
+        if get_marketplace is None:
+            from agents.marketplace import get_marketplace
+            PluginContext._get_marketplace = get_marketplace
         return get_marketplace()
 
     def get_data(self, key: str, default: Any = None) -> Any:
@@ -234,12 +387,16 @@ class PluginContext:
         self.data[key] = value
 
     def log(self, message: str, level: str = "INFO"):
-        """Log a message"""
-        print(f"[{level}] {message}")
+        """Log a message through the 'chalice.plugin' logger"""
+        levelno = logging.getLevelName(level.upper())
+        if not isinstance(levelno, int):
+            levelno = logging.INFO
+        if _plugin_log.isEnabledFor(levelno):
+            _plugin_log.log(levelno, "%s", message)
 
 
 # Available hooks in Chalice
-AVAILABLE_HOOKS = {
+_AVAILABLE_HOOKS = {
     # Lifecycle hooks
     "chalice.startup": "Called when Chalice starts",
     "chalice.shutdown": "Called when Chalice shuts down",
@@ -276,39 +433,42 @@ AVAILABLE_HOOKS = {
     "plugin.disabled": "Called when a plugin is disabled",
 }
 
+# Read-only view of the hooks, plus their names for membership tests
+AVAILABLE_HOOKS = MappingProxyType(_AVAILABLE_HOOKS)
+AVAILABLE_HOOK_NAMES = frozenset(_AVAILABLE_HOOKS)
 
-def create_plugin_template(plugin_name: str, author: str) -> str:
-    """Generate a plugin template"""
-    template = f'''"""
-{plugin_name} Plugin for Chalice
+
+# Scaffold for new plugins; parsed once, filled in by create_plugin_template
+_PLUGIN_TEMPLATE = string.Template('''"""
+$plugin_name Plugin for Chalice
 """
 from plugins.core.plugin import Plugin, PluginMetadata, PluginPriority
 
 
-class {plugin_name.replace(" ", "")}Plugin(Plugin):
+class ${class_name}Plugin(Plugin):
     """
-    {plugin_name} plugin
+    $plugin_name plugin
 
     Description: What your plugin does
     """
 
     def get_metadata(self) -> PluginMetadata:
-        return PluginMetadata({{
-            'id': '{plugin_name.lower().replace(" ", "_")}',
-            'name': '{plugin_name}',
+        return PluginMetadata({
+            'id': '$plugin_id',
+            'name': '$plugin_name',
             'version': '1.0.0',
             'description': 'Description of your plugin',
-            'author': '{author}',
+            'author': '$author',
             'license': 'MIT',
             'dependencies': [],
             'required_version': '>=3.0.0',
             'tags': ['example'],
             'category': 'general'
-        }})
+        })
 
     def on_load(self) -> bool:
         """Load plugin resources"""
-        print(f"Loading {{self.metadata.name}}...")
+        print(f"Loading {self.metadata.name}...")
 
         # Register hooks
         self.register_hook('chat.message.received', self.on_message_received)
@@ -317,21 +477,21 @@ class {plugin_name.replace(" ", "")}Plugin(Plugin):
 
     def on_enable(self) -> bool:
         """Enable plugin functionality"""
-        print(f"Enabling {{self.metadata.name}}...")
+        print(f"Enabling {self.metadata.name}...")
         return True
 
     def on_disable(self):
         """Disable plugin functionality"""
-        print(f"Disabling {{self.metadata.name}}...")
+        print(f"Disabling {self.metadata.name}...")
 
     def on_unload(self):
         """Cleanup plugin resources"""
-        print(f"Unloading {{self.metadata.name}}...")
+        print(f"Unloading {self.metadata.name}...")
 
     # Hook handlers
     def on_message_received(self, message: str, **kwargs):
         """Handle incoming messages"""
-        print(f"Plugin received message: {{message}}")
+        print(f"Plugin received message: {message}")
         # Process message here
         return message
 
@@ -339,6 +499,15 @@ class {plugin_name.replace(" ", "")}Plugin(Plugin):
 # Plugin entry point
 def create_plugin():
     """Factory function to create plugin instance"""
-    return {plugin_name.replace(" ", "")}Plugin()
-'''
-    return template
+    return ${class_name}Plugin()
+''')
+
+
+def create_plugin_template(plugin_name: str, author: str) -> str:
+    """Generate a plugin template"""
+    return _PLUGIN_TEMPLATE.substitute(
+        plugin_name=plugin_name,
+        class_name=plugin_name.replace(" ", ""),
+        plugin_id=plugin_name.lower().replace(" ", "_"),
+        author=author
+    )
@@ -1,13 +1,33 @@
 """
 Chalice MCP Servers
 Auto-generated for progressive tool discovery
+
+Servers are imported on first attribute access.
 """
-# Import all servers
-from . import filesystem
-from . import git
-from . import execution
-from . import api
-from . import system
-from . import multimodal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import filesystem
+    from . import git
+    from . import execution
+    from . import api
+    from . import system
+    from . import multimodal
+
+_SERVERS = {"filesystem", "git", "execution", "api", "system", "multimodal"}
+
+
+def __getattr__(name):
+    if name in _SERVERS:
+        import importlib
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SERVERS)
+
 
 __all__ = ["filesystem", "git", "execution", "api", "system", "multimodal"]
@@ -4,7 +4,17 @@ Execute GraphQL queries against a GraphQL endpoint
 This tool is part of the api MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("api", "graphql")
+    return _invoke
 
 
 def graphql(
@@ -12,7 +22,8 @@ def graphql(
     query: str,
     variables: Dict[str, Any] = None,
     headers: Dict[str, Any] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Execute GraphQL queries against a GraphQL endpoint
@@ -23,16 +34,15 @@ def graphql(
         variables: Query variables as key-value pairs
         headers: HTTP headers (e.g., for authentication)
         timeout: Request timeout in seconds
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="api",
-        tool_name="graphql",
-        **params
-    )
+    args = {"endpoint": endpoint, "query": query, "timeout": timeout}
+    if variables is not None:
+        args["variables"] = variables
+    if headers is not None:
+        args["headers"] = headers
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,7 +4,17 @@ Make HTTP requests (GET, POST, PUT, DELETE, PATCH) to external APIs
 This tool is part of the api MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("api", "http")
+    return _invoke
 
 
 def http(
@@ -14,7 +24,8 @@ def http(
     body: str = None,
     params: Dict[str, Any] = None,
     timeout: int = 30,
-    follow_redirects: bool = True
+    follow_redirects: bool = True,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Make HTTP requests (GET, POST, PUT, DELETE, PATCH) to external APIs
@@ -27,16 +38,17 @@ def http(
         params: URL query parameters as key-value pairs
         timeout: Request timeout in seconds (default: 30)
         follow_redirects: Follow redirects (default: true)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="api",
-        tool_name="http",
-        **params
-    )
+    args = {"url": url, "method": method, "timeout": timeout, "follow_redirects": follow_redirects}
+    if headers is not None:
+        args["headers"] = headers
+    if body is not None:
+        args["body"] = body
+    if params is not None:
+        args["params"] = params
+
+    return _get_invoke()(args, cache_ttl)
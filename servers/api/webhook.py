@@ -4,14 +4,25 @@ Send webhook notifications to external services
 This tool is part of the api MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("api", "webhook")
+    return _invoke
 
 
 def webhook(
     url: str,
     payload: Dict[str, Any],
     headers: Dict[str, Any] = None,
-    method: str = "POST"
+    method: str = "POST",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Send webhook notifications to external services
@@ -21,16 +32,13 @@ def webhook(
         payload: Webhook payload as key-value pairs
         headers: Additional HTTP headers
         method: HTTP method (default: POST)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="api",
-        tool_name="webhook",
-        **params
-    )
+    args = {"url": url, "payload": payload, "method": method}
+    if headers is not None:
+        args["headers"] = headers
+
+    return _get_invoke()(args, cache_ttl)
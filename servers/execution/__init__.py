@@ -1,9 +1,49 @@
 """
 Execution MCP Server
 Auto-generated index for tool discovery
+
+Tool functions are imported from their modules on first access.
 """
-from .python import python
-from .javascript import javascript
-from .bash import bash
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .python import python
+    from .javascript import javascript
+    from .bash import bash
+
+# Tool name -> submodule defining it
+_TOOLS = {"python": "python", "javascript": "javascript", "bash": "bash"}
+
+
+class _ServerModule(types.ModuleType):
+    """Keeps each tool name bound to its function, not its submodule"""
+
+    def __setattr__(self, name, value):
+        # Importing servers.<server>.<tool> binds the submodule on this
+        # package under the tool's name; bind the function instead
+        if name in _TOOLS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServerModule
+
+
+def __getattr__(name):
+    submodule = _TOOLS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f".{submodule}", __name__)
+    tool = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
+
 
 __all__ = ["python", "javascript", "bash"]
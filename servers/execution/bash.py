@@ -4,13 +4,24 @@ Execute Bash commands with safety controls and timeout
 This tool is part of the execution MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("execution", "bash")
+    return _invoke
 
 
 def bash(
     command: str,
     timeout: int = 30,
-    working_dir: str = "."
+    working_dir: str = ".",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Execute Bash commands with safety controls and timeout
@@ -19,16 +30,11 @@ def bash(
         command: Bash command to execute
         timeout: Timeout in seconds (default: 30, max: 300)
         working_dir: Working directory for command execution
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="execution",
-        tool_name="bash",
-        **params
-    )
+    args = {"command": command, "timeout": timeout, "working_dir": working_dir}
+
+    return _get_invoke()(args, cache_ttl)
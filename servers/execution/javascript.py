@@ -4,12 +4,23 @@ Execute JavaScript code using Node.js with timeout controls
 This tool is part of the execution MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("execution", "javascript")
+    return _invoke
 
 
 def javascript(
     code: str,
-    timeout: int = 30
+    timeout: int = 30,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Execute JavaScript code using Node.js with timeout controls
@@ -17,16 +28,11 @@ def javascript(
     Parameters:
         code: JavaScript code to execute
         timeout: Timeout in seconds (default: 30, max: 300)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="execution",
-        tool_name="javascript",
-        **params
-    )
+    args = {"code": code, "timeout": timeout}
+
+    return _get_invoke()(args, cache_ttl)
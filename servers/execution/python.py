@@ -4,13 +4,24 @@ Execute Python code in a sandboxed environment with timeout and resource control
 This tool is part of the execution MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("execution", "python")
+    return _invoke
 
 
 def python(
     code: str,
     timeout: int = 30,
-    input_data: str = ""
+    input_data: str = "",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Execute Python code in a sandboxed environment with timeout and resource controls
@@ -19,16 +30,11 @@ def python(
         code: Python code to execute
         timeout: Timeout in seconds (default: 30, max: 300)
         input_data: Input data to pass to the code via stdin
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="execution",
-        tool_name="python",
-        **params
-    )
+    args = {"code": code, "timeout": timeout, "input_data": input_data}
+
+    return _get_invoke()(args, cache_ttl)
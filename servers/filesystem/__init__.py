@@ -1,13 +1,53 @@
 """
 Filesystem MCP Server
 Auto-generated index for tool discovery
+
+Tool functions are imported from their modules on first access.
 """
-from .read_file import read_file
-from .write_file import write_file
-from .list_directory import list_directory
-from .create_directory import create_directory
-from .delete_path import delete_path
-from .move_path import move_path
-from .file_exists import file_exists
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .read_file import read_file
+    from .write_file import write_file
+    from .list_directory import list_directory
+    from .create_directory import create_directory
+    from .delete_path import delete_path
+    from .move_path import move_path
+    from .file_exists import file_exists
+
+# Tool name -> submodule defining it
+_TOOLS = {"read_file": "read_file", "write_file": "write_file", "list_directory": "list_directory", "create_directory": "create_directory", "delete_path": "delete_path", "move_path": "move_path", "file_exists": "file_exists"}
+
+
+class _ServerModule(types.ModuleType):
+    """Keeps each tool name bound to its function, not its submodule"""
+
+    def __setattr__(self, name, value):
+        # Importing servers.<server>.<tool> binds the submodule on this
+        # package under the tool's name; bind the function instead
+        if name in _TOOLS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServerModule
+
+
+def __getattr__(name):
+    submodule = _TOOLS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f".{submodule}", __name__)
+    tool = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
+
 
 __all__ = ["read_file", "write_file", "list_directory", "create_directory", "delete_path", "move_path", "file_exists"]
@@ -4,27 +4,33 @@ Delete a file or directory (recursive for directories)
 This tool is part of the filesystem MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("filesystem", "delete_path")
+    return _invoke
 
 
 def delete_path(
-    path: str
+    path: str,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Delete a file or directory (recursive for directories)
 
     Parameters:
         path: Absolute or relative path to delete
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="filesystem",
-        tool_name="delete_path",
-        **params
-    )
+    args = {"path": path}
+
+    return _get_invoke()(args, cache_ttl)
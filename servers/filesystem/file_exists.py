@@ -4,27 +4,33 @@ Check if a path exists and return its type and metadata
 This tool is part of the filesystem MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("filesystem", "file_exists")
+    return _invoke
 
 
 def file_exists(
-    path: str
+    path: str,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Check if a path exists and return its type and metadata
 
     Parameters:
         path: Path to check for existence
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="filesystem",
-        tool_name="file_exists",
-        **params
-    )
+    args = {"path": path}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,12 +4,23 @@ Move or rename a file or directory
 This tool is part of the filesystem MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("filesystem", "move_path")
+    return _invoke
 
 
 def move_path(
     src: str,
-    dst: str
+    dst: str,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Move or rename a file or directory
@@ -17,16 +28,11 @@ def move_path(
     Parameters:
         src: Source path to move
         dst: Destination path
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="filesystem",
-        tool_name="move_path",
-        **params
-    )
+    args = {"src": src, "dst": dst}
+
+    return _get_invoke()(args, cache_ttl)
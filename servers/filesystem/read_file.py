@@ -4,13 +4,24 @@ Read content from a file with optional line range limits
 This tool is part of the filesystem MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("filesystem", "read_file")
+    return _invoke
 
 
 def read_file(
     path: str,
     offset: int = 0,
-    limit: int = 2000
+    limit: int = 2000,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Read content from a file with optional line range limits
@@ -19,16 +30,11 @@ def read_file(
         path: Absolute or relative file path to read
         offset: Starting line number (0-based)
         limit: Maximum number of lines to read
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="filesystem",
-        tool_name="read_file",
-        **params
-    )
+    args = {"path": path, "offset": offset, "limit": limit}
+
+    return _get_invoke()(args, cache_ttl)
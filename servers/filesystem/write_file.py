@@ -4,12 +4,23 @@ Write or overwrite content to a file
 This tool is part of the filesystem MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("filesystem", "write_file")
+    return _invoke
 
 
 def write_file(
     path: str,
-    content: str
+    content: str,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Write or overwrite content to a file
@@ -17,16 +28,11 @@ def write_file(
     Parameters:
         path: Absolute or relative file path to write to
         content: Content to write to the file
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="filesystem",
-        tool_name="write_file",
-        **params
-    )
+    args = {"path": path, "content": content}
+
+    return _get_invoke()(args, cache_ttl)
@@ -1,13 +1,53 @@
 """
 Git MCP Server
 Auto-generated index for tool discovery
+
+Tool functions are imported from their modules on first access.
 """
-from .status import status
-from .diff import diff
-from .commit import commit
-from .branch import branch
-from .push import push
-from .pull import pull
-from .log import log
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .status import status
+    from .diff import diff
+    from .commit import commit
+    from .branch import branch
+    from .push import push
+    from .pull import pull
+    from .log import log
+
+# Tool name -> submodule defining it
+_TOOLS = {"status": "status", "diff": "diff", "commit": "commit", "branch": "branch", "push": "push", "pull": "pull", "log": "log"}
+
+
+class _ServerModule(types.ModuleType):
+    """Keeps each tool name bound to its function, not its submodule"""
+
+    def __setattr__(self, name, value):
+        # Importing servers.<server>.<tool> binds the submodule on this
+        # package under the tool's name; bind the function instead
+        if name in _TOOLS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServerModule
+
+
+def __getattr__(name):
+    submodule = _TOOLS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f".{submodule}", __name__)
+    tool = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
+
 
 __all__ = ["status", "diff", "commit", "branch", "push", "pull", "log"]
@@ -4,13 +4,24 @@ List, create, switch, or delete git branches
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "branch")
+    return _invoke
 
 
 def branch(
     action: str,
     branch_name: str = None,
-    repo_path: str = "."
+    repo_path: str = ".",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     List, create, switch, or delete git branches
@@ -19,16 +30,13 @@ def branch(
         action: Action to perform
         branch_name: Branch name (required for create/switch/delete)
         repo_path: Path to git repository
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="branch",
-        **params
-    )
+    args = {"action": action, "repo_path": repo_path}
+    if branch_name is not None:
+        args["branch_name"] = branch_name
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,13 +4,24 @@ Create a git commit with the specified message
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "commit")
+    return _invoke
 
 
 def commit(
     message: str,
     repo_path: str = ".",
-    add_all: bool = False
+    add_all: bool = False,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Create a git commit with the specified message
@@ -19,16 +30,11 @@ def commit(
         message: Commit message
         repo_path: Path to git repository
         add_all: Add all changes before committing
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="commit",
-        **params
-    )
+    args = {"message": message, "repo_path": repo_path, "add_all": add_all}
+
+    return _get_invoke()(args, cache_ttl)
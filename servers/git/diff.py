@@ -4,13 +4,24 @@ View git diff for staged or unstaged changes
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "diff")
+    return _invoke
 
 
 def diff(
     repo_path: str = ".",
     staged: bool = False,
-    file_path: str = None
+    file_path: str = None,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     View git diff for staged or unstaged changes
@@ -19,16 +30,13 @@ def diff(
         repo_path: Path to git repository
         staged: Show staged changes (default: false shows unstaged)
         file_path: Specific file to diff (optional)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="diff",
-        **params
-    )
+    args = {"repo_path": repo_path, "staged": staged}
+    if file_path is not None:
+        args["file_path"] = file_path
+
+    return _get_invoke()(args, cache_ttl)
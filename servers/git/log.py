@@ -4,13 +4,24 @@ View git commit history
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "log")
+    return _invoke
 
 
 def log(
     repo_path: str = ".",
     limit: int = 10,
-    oneline: bool = True
+    oneline: bool = True,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     View git commit history
@@ -19,16 +30,11 @@ def log(
         repo_path: Path to git repository
         limit: Number of commits to show (default: 10)
         oneline: Show one line per commit
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="log",
-        **params
-    )
+    args = {"repo_path": repo_path, "limit": limit, "oneline": oneline}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,13 +4,24 @@ Pull changes from remote repository
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "pull")
+    return _invoke
 
 
 def pull(
     repo_path: str = ".",
     remote: str = "origin",
-    branch: str = None
+    branch: str = None,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Pull changes from remote repository
@@ -19,16 +30,13 @@ def pull(
         repo_path: Path to git repository
         remote: Remote name (default: origin)
         branch: Branch to pull (optional)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="pull",
-        **params
-    )
+    args = {"repo_path": repo_path, "remote": remote}
+    if branch is not None:
+        args["branch"] = branch
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,14 +4,25 @@ Push commits to remote repository
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "push")
+    return _invoke
 
 
 def push(
     repo_path: str = ".",
     remote: str = "origin",
     branch: str = None,
-    force: bool = False
+    force: bool = False,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Push commits to remote repository
@@ -21,16 +32,13 @@ def push(
         remote: Remote name (default: origin)
         branch: Branch to push (optional, defaults to current)
         force: Force push (use with caution)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="push",
-        **params
-    )
+    args = {"repo_path": repo_path, "remote": remote, "force": force}
+    if branch is not None:
+        args["branch"] = branch
+
+    return _get_invoke()(args, cache_ttl)
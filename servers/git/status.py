@@ -4,27 +4,33 @@ Get the status of the current git repository
 This tool is part of the git MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("git", "status")
+    return _invoke
 
 
 def status(
-    repo_path: str = "."
+    repo_path: str = ".",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Get the status of the current git repository
 
     Parameters:
         repo_path: Path to git repository (default: current directory)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="git",
-        tool_name="status",
-        **params
-    )
+    args = {"repo_path": repo_path}
+
+    return _get_invoke()(args, cache_ttl)
@@ -1,11 +1,51 @@
 """
 Multimodal MCP Server
 Auto-generated index for tool discovery
+
+Tool functions are imported from their modules on first access.
 """
-from .analyze_image import analyze_image
-from .parse_pdf import parse_pdf
-from .summarize_document import summarize_document
-from .interpret_diagram import interpret_diagram
-from .extract_code_from_screenshot import extract_code_from_screenshot
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analyze_image import analyze_image
+    from .parse_pdf import parse_pdf
+    from .summarize_document import summarize_document
+    from .interpret_diagram import interpret_diagram
+    from .extract_code_from_screenshot import extract_code_from_screenshot
+
+# Tool name -> submodule defining it
+_TOOLS = {"analyze_image": "analyze_image", "parse_pdf": "parse_pdf", "summarize_document": "summarize_document", "interpret_diagram": "interpret_diagram", "extract_code_from_screenshot": "extract_code_from_screenshot"}
+
+
+class _ServerModule(types.ModuleType):
+    """Keeps each tool name bound to its function, not its submodule"""
+
+    def __setattr__(self, name, value):
+        # Importing servers.<server>.<tool> binds the submodule on this
+        # package under the tool's name; bind the function instead
+        if name in _TOOLS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServerModule
+
+
+def __getattr__(name):
+    submodule = _TOOLS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f".{submodule}", __name__)
+    tool = getattr(module, name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
+
 
 __all__ = ["analyze_image", "parse_pdf", "summarize_document", "interpret_diagram", "extract_code_from_screenshot"]
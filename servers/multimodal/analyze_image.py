@@ -4,14 +4,25 @@ Analyze images using GPT-4 Vision or Claude 3 Opus with vision capabilities
 This tool is part of the multimodal MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("multimodal", "analyze_image")
+    return _invoke
 
 
 def analyze_image(
     image_path: str,
     prompt: str,
     model: str = "gpt-4-vision",
-    detail_level: str = "high"
+    detail_level: str = "high",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Analyze images using GPT-4 Vision or Claude 3 Opus with vision capabilities
@@ -21,16 +32,11 @@ def analyze_image(
         prompt: Analysis prompt or question about the image
         model: Vision model to use (gpt-4-vision, claude-3-opus, claude-3-sonnet)
         detail_level: Level of detail (low, medium, high)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="multimodal",
-        tool_name="analyze_image",
-        **params
-    )
+    args = {"image_path": image_path, "prompt": prompt, "model": model, "detail_level": detail_level}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,13 +4,24 @@ Extract and format code from screenshot images
 This tool is part of the multimodal MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("multimodal", "extract_code_from_screenshot")
+    return _invoke
 
 
 def extract_code_from_screenshot(
     image_path: str,
     language: str = "auto",
-    clean_format: bool = True
+    clean_format: bool = True,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Extract and format code from screenshot images
@@ -19,16 +30,11 @@ def extract_code_from_screenshot(
         image_path: Path to screenshot containing code
         language: Programming language (auto-detect if not specified)
         clean_format: Clean and format extracted code
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="multimodal",
-        tool_name="extract_code_from_screenshot",
-        **params
-    )
+    args = {"image_path": image_path, "language": language, "clean_format": clean_format}
+
+    return _get_invoke()(args, cache_ttl)
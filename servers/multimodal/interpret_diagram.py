@@ -4,13 +4,24 @@ Analyze and interpret diagrams, charts, flowcharts, and visual data
 This tool is part of the multimodal MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("multimodal", "interpret_diagram")
+    return _invoke
 
 
 def interpret_diagram(
     image_path: str,
     diagram_type: str = "auto",
-    extract_text: bool = True
+    extract_text: bool = True,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Analyze and interpret diagrams, charts, flowcharts, and visual data
@@ -19,16 +30,11 @@ def interpret_diagram(
         image_path: Path to diagram image
         diagram_type: Type of diagram (flowchart, uml, erd, chart, architecture)
         extract_text: Extract text from diagram
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="multimodal",
-        tool_name="interpret_diagram",
-        **params
-    )
+    args = {"image_path": image_path, "diagram_type": diagram_type, "extract_text": extract_text}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,14 +4,25 @@ Extract text, metadata, and structure from PDF files
 This tool is part of the multimodal MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("multimodal", "parse_pdf")
+    return _invoke
 
 
 def parse_pdf(
     pdf_path: str,
     pages: str = "all",
     extract_images: bool = False,
-    extract_tables: bool = False
+    extract_tables: bool = False,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Extract text, metadata, and structure from PDF files
@@ -21,16 +32,11 @@ def parse_pdf(
         pages: Page range (e.g., '1-5', 'all')
         extract_images: Extract embedded images
         extract_tables: Extract tables
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="multimodal",
-        tool_name="parse_pdf",
-        **params
-    )
+    args = {"pdf_path": pdf_path, "pages": pages, "extract_images": extract_images, "extract_tables": extract_tables}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,13 +4,24 @@ Generate intelligent summaries of text documents
 This tool is part of the multimodal MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("multimodal", "summarize_document")
+    return _invoke
 
 
 def summarize_document(
     content: str,
     max_length: int = 200,
-    style: str = "paragraph"
+    style: str = "paragraph",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Generate intelligent summaries of text documents
@@ -19,16 +30,11 @@ def summarize_document(
         content: Document content to summarize
         max_length: Maximum summary length in words
         style: Summary style (bullet_points, paragraph, executive)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="multimodal",
-        tool_name="summarize_document",
-        **params
-    )
+    args = {"content": content, "max_length": max_length, "style": style}
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,14 +4,25 @@ Execute whitelisted system commands safely with output capture
 This tool is part of the system MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("system", "command")
+    return _invoke
 
 
 def command(
     command: str,
     args: List[Any] = None,
     timeout: int = 30,
-    working_dir: str = "."
+    working_dir: str = ".",
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Execute whitelisted system commands safely with output capture
@@ -21,16 +32,13 @@ def command(
         args: Command arguments
         timeout: Timeout in seconds (default: 30)
         working_dir: Working directory
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="system",
-        tool_name="command",
-        **params
-    )
+    args = {"command": command, "timeout": timeout, "working_dir": working_dir}
+    if args is not None:
+        args["args"] = args
+
+    return _get_invoke()(args, cache_ttl)
@@ -4,14 +4,25 @@ Install, update, or list packages using pip, npm, yarn, cargo, or go
 This tool is part of the system MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("system", "packages")
+    return _invoke
 
 
 def packages(
     manager: str,
     action: str,
     package: str = None,
-    global: bool = False
+    global_: bool = False,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     Install, update, or list packages using pip, npm, yarn, cargo, or go
@@ -20,17 +31,14 @@ def packages(
         manager: Package manager to use
         action: Action to perform
         package: Package name (required for install/uninstall/search)
-        global: Install globally (for npm/yarn)
+        global_: Install globally (for npm/yarn)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="system",
-        tool_name="packages",
-        **params
-    )
+    args = {"manager": manager, "action": action, "global": global_}
+    if package is not None:
+        args["package"] = package
+
+    return _get_invoke()(args, cache_ttl)
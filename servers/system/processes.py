@@ -4,12 +4,23 @@ List or find running processes
 This tool is part of the system MCP server.
 """
 from typing import Dict, Any, List, Optional
-from mcp.client import call_mcp_tool
+
+_invoke = None
+
+
+def _get_invoke():
+    """Import the MCP client on first use, bound to this tool"""
+    global _invoke
+    if _invoke is None:
+        from mcp.client import make_dispatcher
+        _invoke = make_dispatcher("system", "processes")
+    return _invoke
 
 
 def processes(
     action: str,
-    pattern: str = None
+    pattern: str = None,
+    cache_ttl: float = None
 ) -> Dict[str, Any]:
     """
     List or find running processes
@@ -17,16 +28,13 @@ def processes(
     Parameters:
         action: Action to perform
         pattern: Process name pattern (for find action)
+        cache_ttl: Seconds to reuse an identical earlier result (default: no caching)
 
     Returns:
         Dict[str, Any]: Tool execution result
     """
-    params = {k: v for k, v in locals().items() if v is not None and k != 'kwargs'}
-    if 'kwargs' in locals():
-        params.update(kwargs)
-
-    return call_mcp_tool(
-        server_name="system",
-        tool_name="processes",
-        **params
-    )
+    args = {"action": action}
+    if pattern is not None:
+        args["pattern"] = pattern
+
+    return _get_invoke()(args, cache_ttl)
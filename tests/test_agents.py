@@ -1,9 +1,9 @@
 """
 Test suite for Chalice agents
 """
+import io
+
 import pytest
-from pathlib import Path
-import tempfile
 from agents.core import Agent, AgentMetadata, AgentLoader, AgentRegistry, AgentCommunicator
 
 
@@ -25,48 +25,36 @@ class TestAgentMetadata:
         assert len(metadata.capabilities) == 2
 
 
+@pytest.fixture
+def basic_agent():
+    """Fresh agent with a name and system prompt"""
+    return Agent(AgentMetadata(name="Test Agent", system_prompt="You are a test agent"))
+
+
 class TestAgent:
     """Test agent functionality"""
 
-    def test_agent_creation(self):
+    def test_agent_creation(self, basic_agent):
         """Test creating an agent"""
-        metadata = AgentMetadata(
-            name="Test Agent",
-            system_prompt="You are a test agent"
-        )
-        agent = Agent(metadata)
+        assert basic_agent.name == "Test Agent"
+        assert basic_agent.system_prompt == "You are a test agent"
 
-        assert agent.name == "Test Agent"
-        assert agent.system_prompt == "You are a test agent"
-
-    def test_agent_messages(self):
+    def test_agent_messages(self, basic_agent):
         """Test agent message generation"""
-        metadata = AgentMetadata(
-            name="Test Agent",
-            system_prompt="You are a test agent"
-        )
-        agent = Agent(metadata)
-
-        messages = agent.get_messages("Hello")
+        messages = basic_agent.get_messages("Hello")
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
         assert messages[1]["role"] == "user"
         assert messages[1]["content"] == "Hello"
 
-    def test_agent_history(self):
+    def test_agent_history(self, basic_agent):
         """Test agent conversation history"""
-        metadata = AgentMetadata(
-            name="Test Agent",
-            system_prompt="You are a test agent"
-        )
-        agent = Agent(metadata)
-
-        agent.add_to_history("user", "Hello")
-        agent.add_to_history("assistant", "Hi there!")
+        basic_agent.add_to_history("user", "Hello")
+        basic_agent.add_to_history("assistant", "Hi there!")
 
-        assert len(agent.conversation_history) == 2
-        agent.clear_history()
-        assert len(agent.conversation_history) == 0
+        assert len(basic_agent.conversation_history) == 2
+        basic_agent.clear_history()
+        assert len(basic_agent.conversation_history) == 0
 
 
 class TestAgentLoader:
@@ -74,9 +62,7 @@ class TestAgentLoader:
 
     def test_parse_markdown_agent(self):
         """Test parsing agent from Markdown"""
-        # Create a temporary Markdown file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-            f.write("""# Agent: Test Agent
+        metadata = AgentLoader.parse_markdown_agent("""# Agent: Test Agent
 
 **Version**: 1.0.0
 **Description**: A test agent for unit testing
@@ -93,36 +79,36 @@ class TestAgentLoader:
 You are a test agent designed for unit testing.
 You help validate the agent system.
 """)
-            temp_path = Path(f.name)
-
-        try:
-            metadata = AgentLoader.parse_markdown_agent(temp_path)
-            assert metadata is not None
-            assert metadata.name == "Test Agent"
-            assert metadata.version == "1.0.0"
-            assert metadata.description == "A test agent for unit testing"
-            assert len(metadata.capabilities) >= 3
-            assert "test agent" in metadata.system_prompt.lower()
-        finally:
-            temp_path.unlink()
+
+        assert metadata is not None
+        assert metadata.name == "Test Agent"
+        assert metadata.version == "1.0.0"
+        assert metadata.description == "A test agent for unit testing"
+        assert len(metadata.capabilities) >= 3
+        assert "test agent" in metadata.system_prompt.lower()
 
     def test_load_agent(self):
         """Test loading complete agent"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-            f.write("""# Agent: Test Agent
+        agent = AgentLoader.load_agent(io.StringIO("""# Agent: Test Agent
 
 ## System Prompt
 
 You are a test agent.
-""")
-            temp_path = Path(f.name)
+"""))
+
+        assert agent is not None
+        assert agent.name == "Test Agent"
+        assert agent.file_path is None
 
-        try:
-            agent = AgentLoader.load_agent(temp_path)
-            assert agent is not None
-            assert agent.name == "Test Agent"
-        finally:
-            temp_path.unlink()
+    def test_load_agent_from_file(self, tmp_path):
+        """Test loading an agent from disk keeps its file path"""
+        agent_file = tmp_path / "reviewer.md"
+        agent_file.write_text("You review code.\n", encoding="utf-8")
+
+        agent = AgentLoader.load_agent(agent_file)
+
+        assert agent.name == "reviewer"
+        assert agent.file_path == agent_file
 
 
 class TestAgentRegistry:
@@ -175,24 +161,23 @@ class TestAgentCommunicator:
         assert messages[0]["from"] == "agent1"
         assert messages[0]["message"] == "Hello"
 
-    def test_broadcast(self):
+    @pytest.mark.parametrize("n_agents", [3, 1000])
+    def test_broadcast(self, n_agents):
         """Test broadcasting messages"""
         registry = AgentRegistry()
 
         # Add some agents
-        for i in range(3):
+        for i in range(n_agents):
             metadata = AgentMetadata(name=f"agent{i}", system_prompt="Test")
             registry.register(Agent(metadata))
 
         communicator = AgentCommunicator(registry)
         communicator.broadcast("agent0", "Broadcast message")
 
-        # Check that other agents received it
-        messages_1 = communicator.get_messages_for("agent1")
-        messages_2 = communicator.get_messages_for("agent2")
-
-        assert len(messages_1) == 1
-        assert len(messages_2) == 1
+        # Check that every other agent received it once
+        assert communicator.get_messages_for("agent0") == []
+        for i in range(1, n_agents):
+            assert len(communicator.get_messages_for(f"agent{i}")) == 1
 
 
 if __name__ == "__main__":
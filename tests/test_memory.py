@@ -0,0 +1,176 @@
+"""
+Test suite for Chalice memory
+"""
+import json
+
+import numpy as np
+import pytest
+from memory import VectorStore, MemoryManager
+from memory.jsonl import JsonlLog
+
+
+def unit(i, dim=4):
+    """Basis vector i"""
+    vector = np.zeros(dim, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+class TestVectorStore:
+    """Test vector storage and search"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Store holding one vector per basis direction"""
+        store = VectorStore(tmp_path, backend='numpy')
+        for i in range(4):
+            store.add(unit(i) * (i + 1), f"doc{i}", source="test")
+        return store
+
+    def test_reopen_keeps_vectors(self, store, tmp_path):
+        """Test a reopened store finds what was added"""
+        reopened = VectorStore(tmp_path, backend='numpy')
+
+        assert reopened.count() == 4
+        result = reopened.search(unit(2), top_k=1)[0]
+        assert result["content"] == "doc2"
+        assert result["similarity"] == pytest.approx(1.0)
+
+    def test_delete_survives_reopen(self, store, tmp_path):
+        """Test a tombstoned vector stays deleted after reopening"""
+        doc_id = store.search(unit(1), top_k=1)[0]["id"]
+        store.add(unit(0), "extra")
+        assert store.delete(doc_id)
+
+        reopened = VectorStore(tmp_path, backend='numpy')
+
+        assert reopened.count() == 4
+        assert reopened.get_by_id(doc_id) is None
+        assert "doc1" not in [r["content"] for r in reopened.search(unit(1), top_k=5)]
+
+    def test_compact_drops_deleted_rows(self, store, tmp_path):
+        """Test compact() rewrites the files without deleted rows"""
+        for result in store.search(unit(0), top_k=2):
+            store.delete(result["id"])
+
+        assert (tmp_path / "vectors.bin").stat().st_size == 2 * 4 * 4
+        reopened = VectorStore(tmp_path, backend='numpy')
+        assert sorted(m["content"] for m in reopened.metadata) == ["doc2", "doc3"]
+
+    def test_torn_row_trimmed(self, store, tmp_path):
+        """Test a partly written vector row is dropped on load"""
+        with open(tmp_path / "vectors.bin", "ab") as f:
+            f.write(b"\0" * 6)
+
+        reopened = VectorStore(tmp_path, backend='numpy')
+        reopened.add(unit(3), "after")
+
+        results = VectorStore(tmp_path, backend='numpy').search(unit(3), top_k=2)
+        assert sorted(r["content"] for r in results) == ["after", "doc3"]
+        assert (tmp_path / "vectors.bin").stat().st_size == 5 * 4 * 4
+
+    def test_torn_line_trimmed(self, store, tmp_path):
+        """Test a partly written index line is dropped and appends still line up"""
+        with open(tmp_path / "vectors.bin", "ab") as f:
+            f.write(unit(0).tobytes())
+        with open(tmp_path / "index.jsonl", "ab") as f:
+            f.write(b'{"id": "torn", "cont')
+
+        reopened = VectorStore(tmp_path, backend='numpy')
+        assert reopened.count() == 4
+
+        reopened.add(unit(1), "after")
+        assert [m["content"] for m in VectorStore(tmp_path, backend='numpy').metadata][-1] == "after"
+
+    def test_legacy_store_imported(self, tmp_path):
+        """Test a store saved as index.json plus .npy files is imported once"""
+        entries = []
+        for i in range(2):
+            vector_file = f"vector_{i}_id{i}.npy"
+            np.save(tmp_path / vector_file, unit(i).astype(np.float64) * 3)
+            entries.append({
+                "vector_file": vector_file,
+                "metadata": {"id": f"id{i}", "content": f"old{i}", "source": "legacy", "tags": []}
+            })
+        (tmp_path / "index.json").write_text(json.dumps(entries))
+
+        store = VectorStore(tmp_path, backend='numpy')
+
+        assert store.count() == 2
+        assert store.search(unit(1), top_k=1, filters={"source": "legacy"})[0]["similarity"] == pytest.approx(1.0)
+        assert not (tmp_path / "index.json").exists()
+        assert VectorStore(tmp_path, backend='numpy').count() == 2
+
+    def test_new_dimension_after_delete_all(self, tmp_path):
+        """Test an emptied store takes vectors of another dimension after reopening"""
+        store = VectorStore(tmp_path, backend='numpy')
+        store.delete(store.add(unit(0), "old"))
+
+        VectorStore(tmp_path, backend='numpy').add(unit(5, dim=6), "new")
+        reopened = VectorStore(tmp_path, backend='numpy')
+
+        assert reopened.count() == 1
+        assert reopened.search(unit(5, dim=6), top_k=1)[0]["similarity"] == pytest.approx(1.0)
+
+
+class TestJsonlLog:
+    """Test the offset-indexed JSON lines log"""
+
+    def test_records_read_by_offset(self, tmp_path):
+        """Test records come back by index after reopening"""
+        log = JsonlLog(tmp_path / "log.jsonl")
+        for i in range(3):
+            assert log.append({"n": i, "text": "é" * i}) == i
+
+        reopened = JsonlLog(tmp_path / "log.jsonl")
+
+        assert len(reopened) == 3
+        assert reopened[1] == {"n": 1, "text": "é"}
+        assert reopened[-1]["n"] == 2
+        assert [r["n"] for r in reopened] == [0, 1, 2]
+
+    def test_stale_index_rebuilt(self, tmp_path):
+        """Test a missing index and a torn record are recovered from"""
+        log = JsonlLog(tmp_path / "log.jsonl")
+        for i in range(3):
+            log.append({"n": i})
+        (tmp_path / "log.idx").unlink()
+        with open(tmp_path / "log.jsonl", "ab") as f:
+            f.write(b'{"n": ')
+
+        reopened = JsonlLog(tmp_path / "log.jsonl")
+        reopened.append({"n": 3})
+
+        assert [r["n"] for r in JsonlLog(tmp_path / "log.jsonl")] == [0, 1, 2, 3]
+
+
+class TestMemoryManager:
+    """Test conversation and knowledge persistence"""
+
+    def test_legacy_json_imported(self, tmp_path):
+        """Test conversations.json and knowledge.json are imported once"""
+        conversation = {
+            "id": "c1",
+            "session_id": "s",
+            "messages": [{"role": "user", "content": "hello world"}],
+            "tags": [],
+            "timestamp": "2026-01-01T00:00:00"
+        }
+        (tmp_path / "conversations.json").write_text(json.dumps([conversation]))
+        (tmp_path / "knowledge.json").write_text(json.dumps({
+            "k": {"value": 42, "category": "general", "tags": [], "updated": "2026-01-01T00:00:00"}
+        }))
+
+        manager = MemoryManager(tmp_path)
+
+        assert manager.search_conversations("world") == [conversation]
+        assert manager.get_knowledge("k") == 42
+        assert not (tmp_path / "conversations.json").exists()
+
+        reopened = MemoryManager(tmp_path)
+        assert len(reopened.conversations) == 1
+        assert reopened.get_knowledge("k") == 42
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
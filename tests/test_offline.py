@@ -0,0 +1,59 @@
+"""
+Test suite for Chalice offline providers
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from offline.lmstudio_provider import LMStudioProvider
+
+
+class ChatHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a fixed chat completion"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({
+            "choices": [{"message": {"role": "assistant", "content": "hi"}}],
+            "usage": {}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestLMStudioProvider:
+    """Test the LM Studio provider against a local server"""
+
+    @pytest.fixture
+    def base_url(self):
+        """URL of a local OpenAI-compatible chat endpoint"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ChatHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_port}/v1"
+        server.shutdown()
+        server.server_close()
+
+    def test_achat_across_event_loops(self, base_url):
+        """Test achat works again after the first event loop has closed"""
+        pytest.importorskip("httpx")
+        provider = LMStudioProvider(base_url)
+        messages = [{"role": "user", "content": "hello"}]
+
+        for _ in range(2):
+            result = asyncio.run(provider.achat("local", messages))
+            assert "error" not in result
+            assert result["choices"][0]["message"]["content"] == "hi"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Test suite for Chalice plugins
+"""
+import logging
+
+import pytest
+from plugins.core import PluginManager, PluginLifecycle, PluginContext, PluginHook
+
+
+PLUGIN_SOURCE = '''
+from plugins.core.plugin import Plugin, PluginMetadata
+
+
+class TestPlugin(Plugin):
+    def get_metadata(self):
+        return PluginMetadata({{'id': {plugin_id!r}, 'name': {plugin_id!r}, 'dependencies': {dependencies!r}}})
+
+    def on_load(self):
+        with open({log!r}, 'a') as f:
+            f.write({plugin_id!r} + '\\n')
+        return True
+
+    def on_enable(self):
+        return True
+
+    def on_disable(self):
+        pass
+
+    def on_unload(self):
+        pass
+
+
+def create_plugin():
+    return TestPlugin()
+'''
+
+
+class TestPluginManager:
+    """Test plugin loading"""
+
+    @pytest.fixture
+    def write_plugin(self, tmp_path):
+        """Write a plugin that logs its on_load call to load.log"""
+        def write(plugin_id, dependencies=()):
+            plugin_dir = tmp_path / "plugins" / plugin_id
+            plugin_dir.mkdir(parents=True)
+            (plugin_dir / "plugin.py").write_text(PLUGIN_SOURCE.format(
+                plugin_id=plugin_id,
+                dependencies=list(dependencies),
+                log=str(tmp_path / "load.log")
+            ))
+        return write
+
+    def test_dependencies_load_first(self, tmp_path, write_plugin):
+        """Test a dependency's on_load runs before its dependents'"""
+        write_plugin("app", dependencies=["core", "extra"])
+        write_plugin("extra", dependencies=["core"])
+        write_plugin("core")
+
+        manager = PluginManager(tmp_path / "plugins")
+        results = manager.load_all_plugins(auto_enable=False)
+
+        assert results == {"core": True, "extra": True, "app": True}
+        assert (tmp_path / "load.log").read_text().split() == ["core", "extra", "app"]
+        assert manager.get_plugin("app").state == PluginLifecycle.LOADED
+
+
+    def test_context_log_printed_by_default(self, tmp_path, monkeypatch, capsys):
+        """Test plugin log messages print when logging isn't configured"""
+        log = logging.getLogger("chalice.plugin")
+        monkeypatch.setattr(logging.getLogger(), "handlers", [])
+        monkeypatch.setattr(log, "handlers", [])
+        monkeypatch.setattr(log, "propagate", True)
+        monkeypatch.setattr(log, "level", logging.NOTSET)
+
+        PluginManager(tmp_path)
+        PluginManager(tmp_path)
+        PluginContext().log("details", "DEBUG")
+
+        assert capsys.readouterr().out == "[DEBUG] details\n"
+
+
+
+class TestPluginHook:
+    """Test hook handler ordering"""
+
+    def test_handlers_in_priority_order(self):
+        """Test handlers lists live (handler, priority) pairs, equal priorities in registration order"""
+        def first():
+            return 1
+
+        def second():
+            return 2
+
+        def urgent():
+            return 0
+
+        hook = PluginHook("test")
+        hook.register(first, 50)
+        hook.register(second, 50)
+        hook.register(urgent, 0)
+        hook.register(print, 75)
+        hook.unregister(print)
+
+        assert hook.handlers == [(urgent, 0), (first, 50), (second, 50)]
+        assert hook.trigger() == [0, 1, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,140 @@
+"""
+Test suite for generated MCP server tool wrappers
+"""
+import importlib
+
+import pytest
+from servers.api import http
+
+# The package binds the name 'http' to the function, so fetch the module itself
+http_module = importlib.import_module("servers.api.http")
+
+
+class TestToolWrappers:
+    """Test argument forwarding in generated tool wrappers"""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Capture calls instead of reaching the MCP client"""
+        recorded = []
+
+        def fake_invoke(arguments, cache_ttl=None):
+            recorded.append(arguments)
+            return {"success": True}
+
+        monkeypatch.setattr(http_module, "_invoke", fake_invoke)
+        return recorded
+
+    def test_http_forwards_query_params(self, calls):
+        """Test caller-supplied params reach the tool unchanged"""
+        http("x", params={"a": 1})
+
+        kwargs = calls[0]
+        assert kwargs["params"] == {"a": 1}
+        assert kwargs["url"] == "x"
+
+    def test_http_dispatches_to_its_tool(self, monkeypatch):
+        """Test the lazily built dispatcher targets this tool"""
+        import mcp.client
+
+        invoked = []
+
+        class FakeClient:
+            def invoke(self, server_name, tool_name, arguments, cache_ttl=None):
+                invoked.append((server_name, tool_name, arguments, cache_ttl))
+                return {"success": True}
+
+        monkeypatch.setattr(mcp.client, "get_mcp_client", FakeClient)
+        monkeypatch.setattr(http_module, "_invoke", None)
+        http("x", cache_ttl=5)
+
+        assert invoked[0][:2] == ("api", "http")
+        assert invoked[0][2]["url"] == "x"
+        assert invoked[0][3] == 5
+
+    def test_http_omits_unset_optional_args(self, calls):
+        """Test None-defaulted arguments are not forwarded"""
+        http("x")
+
+        assert calls[0] == {"url": "x", "method": "GET", "timeout": 30, "follow_redirects": True}
+
+
+class TestMakeTool:
+    """Test runtime generation of tool wrappers"""
+
+    def test_make_tool_matches_generated_signature(self):
+        """Test a runtime wrapper has the generated file's signature"""
+        import inspect
+        from mcp.generator import make_tool
+
+        tool_info = {
+            "description": "Install packages",
+            "parameters": {
+                "properties": {
+                    "manager": {"type": "string"},
+                    "global": {"type": "boolean", "default": False}
+                },
+                "required": ["manager"]
+            }
+        }
+        packages = make_tool("system", "packages", tool_info)
+
+        assert list(inspect.signature(packages).parameters) == ["manager", "global_", "cache_ttl"]
+        assert "Install packages" in packages.__doc__
+
+
+class TestResultCache:
+    """Test opt-in caching of tool results"""
+
+    @pytest.fixture
+    def client(self):
+        """Client with a counting tool registered"""
+        from mcp.client import MCPClient, MCPServer, MCPTool
+
+        class CountingTool(MCPTool):
+            def __init__(self):
+                super().__init__("count", "Count calls")
+                self.calls = 0
+
+            def execute(self, **kwargs):
+                self.calls += 1
+                return {"success": True, "calls": self.calls}
+
+        client = MCPClient()
+        server = MCPServer("test")
+        server.register_tool(CountingTool())
+        client.register_server(server)
+        return client
+
+    def test_cache_ttl_reuses_identical_calls(self, client):
+        """Test repeat calls within the TTL skip the tool"""
+        first = client.call_tool("test", "count", cache_ttl=60, path="a")
+        second = client.call_tool("test", "count", cache_ttl=60, path="a")
+        other = client.call_tool("test", "count", cache_ttl=60, path="b")
+
+        assert first == second == {"success": True, "calls": 1}
+        assert other["calls"] == 2
+
+    def test_uncached_by_default(self, client):
+        """Test calls without cache_ttl always reach the tool"""
+        client.call_tool("test", "count", path="a")
+        assert client.call_tool("test", "count", path="a")["calls"] == 2
+
+    def test_no_cache_hint_skips_cache(self):
+        """Test errors and no-cache results are not reused"""
+        from mcp.client import should_cache
+
+        assert should_cache({"success": True})
+        assert not should_cache({"error": "boom"})
+        assert not should_cache({"success": True, "_meta": {"cache_hint": "no-cache"}})
+
+    def test_call_tools_keeps_call_order(self, client):
+        """Test batched calls return results in call order"""
+        results = client.call_tools([
+            ("test", "count", {"path": "a"}),
+            ("test", "missing", {}),
+            ("test", "count", {"path": "b"}),
+        ])
+
+        assert "error" in results[1]
+        assert sorted(r["calls"] for r in (results[0], results[2])) == [1, 2]
@@ -6,8 +6,8 @@ from pathlib import Path
 from tools.base import Tool, ToolRegistry
 from tools.execution import PythonExecutor, JavaScriptExecutor, BashExecutor
 from tools.git import GitStatus, GitDiff, GitBranch, GitLog
-from tools.api import HTTPRequest, GraphQLQuery
-from tools.system import SystemCommand, PackageManager
+from tools.api import HTTPRequest, GraphQLQuery, _json_headers
+from tools.system import SystemCommand, PackageManager, ProcessManager
 
 
 class TestToolRegistry:
@@ -36,6 +36,28 @@ class TestToolRegistry:
         result = registry.execute("execute_python", code="print('hello')", timeout=5)
         assert "stdout" in result or "success" in result
 
+    def test_execute_many_keeps_call_order(self):
+        """Test batched tool calls return results in call order"""
+        registry = ToolRegistry()
+        registry.register(PythonExecutor())
+
+        results = registry.execute_many([
+            ("execute_python", {"code": "import time; time.sleep(0.2); print(1)"}),
+            ("missing_tool", {}),
+            ("execute_python", {"code": "print(2)"}),
+        ])
+
+        assert results[0]["stdout"] == "1\n"
+        assert "error" in results[1]
+        assert results[2]["stdout"] == "2\n"
+
+    def test_schema_shared_per_class(self):
+        """Test instances of a tool class share one parameter schema"""
+        first, second = PythonExecutor(), PythonExecutor()
+
+        assert first.parameters is second.parameters
+        assert first.to_openai_format()["function"]["name"] == "execute_python"
+
 
 class TestExecutionTools:
     """Test code execution tools"""
@@ -49,6 +71,26 @@ class TestExecutionTools:
         if result.get("success"):
             assert "Hello, World!" in result.get("stdout", "")
 
+    def test_python_traceback_shows_source(self):
+        """Test tracebacks point at the failing line of the submitted code"""
+        executor = PythonExecutor()
+        result = executor.execute(code="x = 'é'\n1 / 0\n", timeout=5)
+
+        assert 'File "<code>", line 2, in <module>' in result["stderr"]
+        assert "1 / 0" in result["stderr"]
+        assert "<string>" not in result["stderr"]
+
+    def test_python_stdin_and_file(self):
+        """Test input_data is fully readable from binary stdin and __file__ is set"""
+        executor = PythonExecutor()
+        result = executor.execute(
+            code="import sys\nprint(sys.stdin.buffer.read(), __file__)",
+            input_data="abc",
+            timeout=5
+        )
+
+        assert result["stdout"] == "b'abc' <code>\n"
+
     def test_python_timeout(self):
         """Test Python execution timeout"""
         executor = PythonExecutor()
@@ -59,6 +101,33 @@ class TestExecutionTools:
 
         assert result.get("timeout") == True
 
+    def test_python_memory_limited(self):
+        """Test executed Python code can't allocate past the memory limit"""
+        from tools.execution import PYTHON_MEMORY_LIMIT
+
+        if not hasattr(pytest.importorskip("resource"), "prlimit"):
+            pytest.skip("needs prlimit")
+
+        executor = PythonExecutor()
+        result = executor.execute(code=f"bytearray({PYTHON_MEMORY_LIMIT})", timeout=5)
+
+        assert "MemoryError" in result["stderr"]
+
+    def test_output_capped(self):
+        """Test output past the cap is dropped and flagged"""
+        import subprocess
+        from tools.execution import _communicate
+
+        process = subprocess.Popen(
+            ['python3', '-c', "print('x' * 100)"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        stdout, stderr, truncated = _communicate(process, timeout=5, limit=10)
+
+        assert stdout == 'x' * 10
+        assert truncated
+
     def test_bash_executor(self):
         """Test Bash command execution"""
         executor = BashExecutor()
@@ -66,6 +135,14 @@ class TestExecutionTools:
 
         assert "success" in result
 
+    @pytest.mark.parametrize("command", [
+        "cd /tmp", "type ls", "read line", "ls *.py", "echo 'a b'", "FOO=1 env", "time ls", "./run.sh"
+    ])
+    def test_bash_shell_syntax_uses_bash(self, command):
+        """Test commands bash would interpret are not run directly"""
+        from tools.execution import _direct_argv
+        assert _direct_argv(command) is None
+
     def test_bash_dangerous_command(self):
         """Test that dangerous commands are blocked"""
         executor = BashExecutor()
@@ -78,6 +155,17 @@ class TestExecutionTools:
 class TestGitTools:
     """Test Git integration tools"""
 
+    @pytest.mark.parametrize("header, branch", [
+        ("## main", "main"),
+        ("## main...origin/main [ahead 1]", "main"),
+        ("## No commits yet on dev", "dev"),
+        ("## HEAD (no branch)", "HEAD"),
+    ])
+    def test_branch_from_status_header(self, header, branch):
+        """Test the current branch is read from the status header"""
+        from tools.git import _branch_from_header
+        assert _branch_from_header(header) == branch
+
     def test_git_status(self):
         """Test git status tool"""
         tool = GitStatus()
@@ -94,6 +182,42 @@ class TestGitTools:
         # Should work in a git repo or return an error
         assert "error" in result or "commits" in result
 
+    def test_git_log_follows_new_commits(self, tmp_path):
+        """Test a cached log is not reused once HEAD moves"""
+        import subprocess
+
+        def commit(message):
+            subprocess.run(
+                ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '--allow-empty', '-qm', message],
+                cwd=tmp_path, check=True
+            )
+
+        subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+        commit("first")
+        tool = GitLog()
+        assert tool.execute(repo_path=str(tmp_path))["count"] == 1
+        assert tool.execute(repo_path=str(tmp_path))["count"] == 1
+
+        commit("second")
+        assert tool.execute(repo_path=str(tmp_path))["count"] == 2
+
+    def test_git_log_matches_git_output(self, tmp_path):
+        """Test the full log renders message bodies the way git log does"""
+        import subprocess
+
+        subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+        for message in ("first", "second\n\nWhy it changed.\n\n- detail"):
+            subprocess.run(
+                ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '--allow-empty', '-qm', message],
+                cwd=tmp_path, check=True
+            )
+
+        result = GitLog().execute(repo_path=str(tmp_path), oneline=False)
+        expected = subprocess.run(['git', 'log'], cwd=tmp_path, capture_output=True, text=True).stdout
+
+        assert result["output"] == expected
+        assert result["commits"][0]["body"] == "Why it changed.\n\n- detail"
+
 
 class TestAPITools:
     """Test API interaction tools"""
@@ -125,6 +249,13 @@ class TestAPITools:
         if "error" not in result:
             assert "data" in result or "errors" in result
 
+    def test_json_headers_respect_caller_content_type(self):
+        """Test a caller's content type wins whatever its case"""
+        assert _json_headers(None)["Content-Type"] == "application/json"
+
+        headers = _json_headers({"content-type": "application/graphql"})
+        assert headers.get_list("Content-Type") == ["application/graphql"]
+
 
 class TestSystemTools:
     """Test system command tools"""
@@ -144,6 +275,22 @@ class TestSystemTools:
         assert "error" in result
         assert "blocked" in result or "blacklist" in str(result).lower()
 
+    def test_process_actions_share_ps_snapshot(self, monkeypatch):
+        """Test back-to-back process actions run ps once"""
+        import subprocess
+        runs = []
+
+        def fake_run(argv, **kwargs):
+            runs.append(argv)
+            return subprocess.CompletedProcess(argv, 0, stdout=b"USER PID\nroot 1 init\n")
+
+        monkeypatch.setattr("tools.system.subprocess.run", fake_run)
+        tool = ProcessManager()
+
+        assert tool.execute(action="find", pattern="init")["matches"] == ["root 1 init"]
+        assert "init" in tool.execute(action="list")["processes"]
+        assert runs == [["ps", "aux"]]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+"""
+Test suite for Chalice workflows
+"""
+import threading
+from datetime import datetime
+
+import pytest
+from workflows import WorkflowEngine, WorkflowAction, WorkflowTrigger, ActionType, TriggerType
+from workflows.engine import _next_run
+
+
+def saved_workflows(path):
+    """Workflows as a freshly opened engine loads them from path"""
+    engine = WorkflowEngine(path)
+    engine.close()
+    return engine.workflows
+
+
+class TestSchedule:
+    """Test schedule trigger timing"""
+
+    # A Friday
+    NOW = datetime(2026, 10, 16, 12, 0)
+
+    @pytest.mark.parametrize("config, expected", [
+        ({"interval": "daily", "time": "13:30"}, datetime(2026, 10, 16, 13, 30)),
+        ({"interval": "daily", "time": "09:00"}, datetime(2026, 10, 17, 9, 0)),
+        ({"interval": "hourly"}, datetime(2026, 10, 16, 13, 0)),
+        ({"interval": "weekly", "day": "monday", "time": "08:15:30"}, datetime(2026, 10, 19, 8, 15, 30)),
+        ({"interval": "weekly", "day": "friday", "time": "12:00"}, datetime(2026, 10, 23, 12, 0)),
+    ])
+    def test_next_run(self, config, expected):
+        """Test the next fire time for each interval"""
+        assert _next_run(config, self.NOW) == expected
+
+    def test_unknown_interval(self):
+        """Test unknown intervals are not scheduled"""
+        assert _next_run({"interval": "monthly"}, self.NOW) is None
+
+
+class TestWorkflowEngine:
+    """Test workflow execution"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Engine storing workflows in a temporary directory"""
+        engine = WorkflowEngine(tmp_path)
+        yield engine
+        engine.close()
+
+    def test_execution_history_newest_first(self, engine):
+        """Test history returns the latest runs of a workflow"""
+        workflow = engine.create_workflow(
+            "w", actions=[WorkflowAction(ActionType.SCRIPT, {"script": "result = 1"})]
+        )
+        runs = [engine.execute_workflow(workflow.id) for _ in range(3)]
+
+        history = engine.get_execution_history(workflow.id, limit=2)
+
+        assert [e.started_at for e in history] == sorted((e.started_at for e in runs), reverse=True)[:2]
+        assert history[0].results[0]["result"] == {"success": True, "result": 1}
+
+    def test_parallel_group_keeps_order_and_stops_after_failure(self, engine):
+        """Test grouped actions all run, report in order, then stop on failure"""
+        def script(source, **config):
+            return WorkflowAction(ActionType.SCRIPT, {"script": source, **config})
+
+        workflow = engine.create_workflow("w", actions=[
+            script("import time; time.sleep(0.1); result = 1", parallel_group="a"),
+            script("raise RuntimeError('boom')", parallel_group="a"),
+            script("result = 3"),
+        ])
+
+        results = engine.execute_workflow(workflow.id).results
+
+        assert [r["result"].get("result") for r in results] == [1, None]
+        assert results[1]["result"]["error"] == "boom"
+
+    def test_workflow_ids_unique(self, engine):
+        """Test workflows created in the same instant get distinct ids"""
+        workflows = [engine.create_workflow(f"w{i}") for i in range(20)]
+
+        assert len({w.id for w in workflows}) == len(engine.workflows) == 20
+
+    def test_scheduled_run_does_not_block_scheduler(self, engine):
+        """Test a due workflow runs on the pool while the next run is planned"""
+        started, release = threading.Event(), threading.Event()
+
+        def block(action, context):
+            started.set()
+            release.wait(5)
+            return {"success": True}
+
+        engine.register_action_handler(ActionType.NOTIFICATION, block)
+        workflow = engine.create_workflow(
+            "w",
+            triggers=[WorkflowTrigger(TriggerType.SCHEDULE, {"interval": "hourly"})],
+            actions=[WorkflowAction(ActionType.NOTIFICATION, {})]
+        )
+
+        engine._run_scheduled(workflow.id, 0)
+
+        assert started.wait(5)
+        assert engine._timers[0][1:] == (workflow.id, 0)
+        release.set()
+        engine._pool.shutdown(wait=True)
+        assert workflow.run_count == 1
+
+    def test_changes_batched_until_flush(self, engine, tmp_path):
+        """Test flush() persists pending changes without waiting for the flusher"""
+        workflow = engine.create_workflow(
+            "w", actions=[WorkflowAction(ActionType.SCRIPT, {"script": "result = 1"})]
+        )
+        for _ in range(3):
+            engine.execute_workflow(workflow.id)
+        engine.flush()
+
+        assert saved_workflows(tmp_path)[workflow.id].run_count == 3
+
+    def test_close_stops_flusher_and_saves(self, engine, tmp_path):
+        """Test close() saves pending changes and later changes save directly"""
+        first = engine.create_workflow("first")
+        engine.close()
+
+        assert not engine._flusher.is_alive()
+        assert first.id in saved_workflows(tmp_path)
+
+        second = engine.create_workflow("second")
+        assert second.id in saved_workflows(tmp_path)
+
+    def test_to_dict_follows_changes(self, engine):
+        """Test to_dict reflects run state and edited action lists"""
+        workflow = engine.create_workflow(
+            "w", actions=[WorkflowAction(ActionType.SCRIPT, {"script": "result = 1"})]
+        )
+        before = workflow.to_dict()
+
+        engine.execute_workflow(workflow.id)
+        workflow.actions.append(WorkflowAction(ActionType.NOTIFICATION, {}, "notify"))
+        after = workflow.to_dict()
+
+        assert before["run_count"] == 0 and after["run_count"] == 1
+        assert [a["name"] for a in after["actions"]] == ["script_action", "notify"]
+        assert list(after) == list(before)
+
+        workflow.actions[0].name = "renamed"
+        workflow.actions[1].config = {"message": "hi"}
+        edited = workflow.to_dict()["actions"]
+        assert [a["name"] for a in edited] == ["renamed", "notify"]
+        assert edited[1]["config"] == {"message": "hi"}
+
+    @pytest.mark.parametrize("config", [{"interval": "monthly"}, {"interval": "daily", "time": "25:99"}])
+    def test_edited_trigger_unscheduled(self, engine, config):
+        """Test a trigger edited into an invalid schedule is dropped, not fatal"""
+        trigger = WorkflowTrigger(TriggerType.SCHEDULE, {"interval": "hourly"})
+        workflow = engine.create_workflow("w", triggers=[trigger])
+        engine._plan_schedule()
+        trigger.config = config
+
+        engine._run_scheduled(workflow.id, 0)
+        engine._pool.shutdown(wait=True)
+
+        assert (workflow.id, 0) not in engine._next_runs
+        assert workflow.run_count == 1
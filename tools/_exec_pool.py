@@ -0,0 +1,12 @@
+"""
+Shared thread pool for running tools concurrently
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Tools mostly wait on subprocesses and I/O, so run more threads than cores.
+# Threads are only started as work is submitted.
+EXEC_POOL = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2,
+    thread_name_prefix="chalice-tool"
+)
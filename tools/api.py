@@ -1,11 +1,85 @@
 """
 API interaction tools for external service communication
 """
-import requests
+import atexit
+import httpx
 import json
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Any, Optional
 from .base import Tool
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+
+# JSON decoder accepting str or bytes; orjson skips the decode step
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Request body encoder producing bytes
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+def _json_headers(headers: Optional[Dict[str, str]]) -> httpx.Headers:
+    """Caller headers plus a JSON content type unless they set one (in any case)"""
+    merged = httpx.Headers(headers or {})
+    merged.setdefault('Content-Type', 'application/json')
+    return merged
+
+
+# Shared keep-alive connection pool for all API tools. With h2 installed,
+# concurrent calls to one HTTPS host share a single HTTP/2 connection.
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=h2 is not None,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        retries=2
+    ),
+    timeout=30
+)
+# Calls are independent: don't carry cookies from one request to the next
+_CLIENT.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+atexit.register(_CLIENT.close)
+
+# Response bodies beyond this many bytes are cut off (and not parsed as JSON)
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Upper bound on caller-supplied request timeouts, in seconds
+MAX_TIMEOUT = 120
+
+
+def _is_json(content_type: str) -> bool:
+    """Whether a Content-Type header names a JSON media type"""
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type == 'application/json' or media_type.endswith('+json')
+
+
+def _read_body(response: httpx.Response, limit: int) -> tuple[bytes, bool]:
+    """
+    Read a streamed response body, stopping after limit bytes
+
+    Returns:
+        tuple: (body bytes, whether the body was truncated)
+    """
+    chunks = []
+    size = 0
+    for chunk in response.iter_bytes(chunk_size=65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return b''.join(chunks)[:limit], True
+    return b''.join(chunks), False
+
 
 class HTTPRequest(Tool):
     """Make HTTP requests to APIs"""
@@ -70,8 +144,8 @@ class HTTPRequest(Tool):
         try:
             # Prepare request
             kwargs = {
-                "timeout": min(timeout, 120),  # Max 2 minutes
-                "allow_redirects": follow_redirects
+                "timeout": timeout if timeout < MAX_TIMEOUT else MAX_TIMEOUT,
+                "follow_redirects": follow_redirects
             }
 
             if headers:
@@ -81,34 +155,46 @@ class HTTPRequest(Tool):
                 kwargs["params"] = params
 
             if body:
-                # Try to parse as JSON, otherwise send as text
+                # Send valid JSON as-is with a JSON content type, otherwise as text
                 try:
-                    kwargs["json"] = json.loads(body)
-                except:
-                    kwargs["data"] = body
+                    _loads(body)
+                    kwargs["headers"] = _json_headers(headers)
+                except ValueError:
+                    pass
+                kwargs["content"] = body.encode("utf-8")
 
             # Make request
-            response = requests.request(method, url, **kwargs)
+            with _CLIENT.stream(method, url, **kwargs) as response:
+                content, truncated = _read_body(response, MAX_BODY_BYTES)
+
+            # Parse JSON bodies only; everything else is returned as text
+            response_json = None
+            if not truncated and _is_json(response.headers.get("Content-Type", "")):
+                try:
+                    response_json = _loads(content)
+                except ValueError:
+                    pass
 
-            # Parse response
-            try:
-                response_json = response.json()
-            except:
-                response_json = None
+            body = None
+            if response_json is None:
+                body = content.decode(response.encoding or "utf-8", errors="replace")
 
-            return {
+            result = {
                 "status_code": response.status_code,
                 "headers": dict(response.headers),
-                "body": response.text,
+                "body": body,
                 "json": response_json,
                 "success": 200 <= response.status_code < 300,
-                "url": response.url,
+                "url": str(response.url),
                 "elapsed_ms": response.elapsed.total_seconds() * 1000
             }
+            if truncated:
+                result["truncated"] = True
+            return result
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             return {"error": f"Request timed out after {timeout} seconds"}
-        except requests.ConnectionError as e:
+        except httpx.NetworkError as e:
             return {"error": f"Connection error: {str(e)}"}
         except Exception as e:
             return {"error": str(e)}
@@ -166,14 +252,14 @@ class GraphQLQuery(Tool):
             if variables:
                 payload["variables"] = variables
 
-            response = requests.post(
+            response = _CLIENT.post(
                 endpoint,
-                json=payload,
-                headers=headers or {},
-                timeout=min(timeout, 120)
+                content=_dumps(payload),
+                headers=_json_headers(headers),
+                timeout=timeout if timeout < MAX_TIMEOUT else MAX_TIMEOUT
             )
 
-            result = response.json()
+            result = _loads(response.content)
 
             return {
                 "data": result.get("data"),
@@ -230,11 +316,11 @@ class WebhookSender(Tool):
     ) -> Dict[str, Any]:
         """Send webhook"""
         try:
-            response = requests.request(
+            response = _CLIENT.request(
                 method,
                 url,
-                json=payload,
-                headers=headers or {},
+                content=_dumps(payload),
+                headers=_json_headers(headers),
                 timeout=30
             )
 
@@ -1,17 +1,50 @@
 """
 Base tool class for Chalice tool system
 """
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Callable, Tuple, ValuesView
 from abc import ABC, abstractmethod
 
+from ._exec_pool import EXEC_POOL
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Compile a parameter schema, or None if fastjsonschema isn't usable"""
+    if fastjsonschema is None:
+        return None
+    try:
+        # Don't fill in defaults: execute() has its own
+        return fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
 
 class Tool(ABC):
-    """Base class for all Chalice tools"""
+    """
+    Base class for all Chalice tools
+
+    Name, description, parameter schema and its compiled validator are
+    built once per class and shared by its instances. Subclasses whose
+    schema depends on instance state set cache_schema = False.
+    """
+
+    cache_schema = True
 
     def __init__(self):
-        self.name = self.get_name()
-        self.description = self.get_description()
-        self.parameters = self.get_parameters()
+        cls = type(self)
+        spec = cls.__dict__.get('_spec') if cls.cache_schema else None
+        if spec is None:
+            parameters = self.get_parameters()
+            spec = (self.get_name(), self.get_description(), parameters, _compile_validator(parameters))
+            if cls.cache_schema:
+                cls._spec = spec
+        self.name, self.description, self.parameters, self.validator = spec
+        self._openai_format: Optional[Dict[str, Any]] = None
 
     @abstractmethod
     def get_name(self) -> str:
@@ -33,19 +66,37 @@ class Tool(ABC):
         """Execute the tool with given parameters"""
         pass
 
+    def execute_async(self, **kwargs) -> Future:
+        """Run execute() on the shared tool thread pool"""
+        return EXEC_POOL.submit(self.execute, **kwargs)
+
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert tool to OpenAI function calling format"""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters
+        if self._openai_format is None:
+            self._openai_format = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters
+                }
             }
-        }
+        return self._openai_format
 
     def validate_parameters(self, **kwargs) -> bool:
-        """Validate parameters against schema"""
+        """
+        Validate parameters against schema
+
+        Checks the full schema when fastjsonschema is installed, otherwise
+        only that required parameters are present.
+
+        Raises:
+            ValueError: If the parameters don't match the schema
+        """
+        if self.validator is not None:
+            self.validator(kwargs)
+            return True
+
         required = self.parameters.get("required", [])
         for param in required:
             if param not in kwargs:
@@ -58,36 +109,81 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools: Dict[str, Tool] = {}
+        # OpenAI-format tool list; None after (un)registration
+        self._openai_tools: Optional[List[Dict[str, Any]]] = None
+
+        # Per tool name: bound execute method, required parameters, validator
+        self._dispatch: Dict[str, tuple[Callable[..., Dict[str, Any]], tuple[str, ...], Optional[Callable]]] = {}
 
     def register(self, tool: Tool):
         """Register a tool"""
         self.tools[tool.name] = tool
+        self._dispatch[tool.name] = (
+            tool.execute,
+            tuple(tool.parameters.get("required", ())),
+            tool.validator
+        )
+        self._openai_tools = None
 
     def unregister(self, tool_name: str):
         """Unregister a tool"""
         if tool_name in self.tools:
             del self.tools[tool_name]
+            del self._dispatch[tool_name]
+            self._openai_tools = None
 
     def get(self, tool_name: str) -> Optional[Tool]:
         """Get a tool by name"""
         return self.tools.get(tool_name)
 
-    def get_all(self) -> List[Tool]:
-        """Get all registered tools"""
-        return list(self.tools.values())
+    def get_all(self) -> ValuesView[Tool]:
+        """Get all registered tools (live read-only view; list() it to snapshot)"""
+        return self.tools.values()
 
     def get_openai_tools(self) -> List[Dict[str, Any]]:
-        """Get all tools in OpenAI format"""
-        return [tool.to_openai_format() for tool in self.tools.values()]
+        """Get all tools in OpenAI format (shared list; don't modify it)"""
+        if self._openai_tools is None:
+            self._openai_tools = [tool.to_openai_format() for tool in self.tools.values()]
+        return self._openai_tools
 
     def execute(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Execute a tool by name"""
-        tool = self.get(tool_name)
-        if not tool:
+        entry = self._dispatch.get(tool_name)
+        if entry is None:
             return {"error": f"Tool not found: {tool_name}"}
 
+        execute, required, validator = entry
+        if validator is not None:
+            try:
+                validator(kwargs)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {"error": f"Invalid parameters: {e.message}", "path": e.path}
+        else:
+            for param in required:
+                if param not in kwargs:
+                    return {"error": f"Tool execution failed: Missing required parameter: {param}"}
+
         try:
-            tool.validate_parameters(**kwargs)
-            return tool.execute(**kwargs)
+            return execute(**kwargs)
         except Exception as e:
             return {"error": f"Tool execution failed: {str(e)}"}
+
+    def execute_async(self, tool_name: str, **kwargs) -> Future:
+        """Run execute() for a tool on the shared tool thread pool"""
+        return EXEC_POOL.submit(self.execute, tool_name, **kwargs)
+
+    def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Run independent tool calls concurrently
+
+        Args:
+            calls: (tool_name, arguments) tuples
+
+        Returns:
+            List[Dict[str, Any]]: Results in the order of calls
+        """
+        if len(calls) <= 1:
+            return [self.execute(tool_name, **kwargs) for tool_name, kwargs in calls]
+
+        futures = [self.execute_async(tool_name, **kwargs) for tool_name, kwargs in calls]
+        return [future.result() for future in futures]
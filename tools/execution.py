@@ -1,14 +1,277 @@
 """
 Code execution tools with sandboxing and safety controls
 """
+import atexit
 import subprocess
-import tempfile
 import os
+import re
+import selectors
+import shutil
 import signal
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base import Tool
 
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Kernel limits applied to executed Python code (Linux only)
+PYTHON_MEMORY_LIMIT = int(os.getenv("CHALICE_EXEC_MEMORY_MB", 1024)) * 1024 * 1024
+PYTHON_FILE_SIZE_LIMIT = 64 * 1024 * 1024
+PYTHON_OPEN_FILES_LIMIT = 256
+
+# Modules a warm Python process imports while it waits for code, so user
+# imports of them are dictionary lookups
+PYTHON_PRELOAD = ('json', 're', 'math', 'collections', 'itertools', 'datetime')
+
+# Run by `python3 -c`: reads a byte count line and that much code from the
+# binary stdin, so the rest of stdin is left unbuffered for the code, then
+# runs it as __main__. The source goes into linecache so tracebacks show the
+# failing lines, and the shim's own frame is left out of them.
+_PYTHON_STDIN_SHIM = f"""\
+import sys, linecache, {', '.join(PYTHON_PRELOAD)}
+n = int(sys.stdin.buffer.readline())
+src = sys.stdin.buffer.read(n).decode()
+linecache.cache['<code>'] = (len(src), None, src.splitlines(True), '<code>')
+try:
+    exec(compile(src, '<code>', 'exec'), {{'__name__': '__main__', '__file__': '<code>', '__builtins__': __builtins__}})
+except SystemExit:
+    raise
+except BaseException as e:
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+# Commands BashExecutor refuses to run, matched anywhere in the command
+DANGEROUS_COMMANDS = ('rm -rf /', 'mkfs', 'dd if=', ':(){:|:&};:', 'chmod -R 777 /')
+_DANGER_RE = re.compile('|'.join(re.escape(pattern) for pattern in DANGEROUS_COMMANDS))
+
+# A command containing none of these is plain words, which bash would only split
+_SHELL_CHARS = frozenset('|&;<>()$`\\"\'*?[]{}~#!=%\n')
+_BASH_RESERVED_WORDS = frozenset((
+    'if', 'then', 'else', 'elif', 'fi', 'case', 'esac', 'for', 'select', 'while',
+    'until', 'do', 'done', 'in', 'function', 'time', 'coproc'
+))
+# Run inside bash itself; a same-named file on PATH (/usr/bin/cd, type,
+# read on some systems) can't change the shell's state the same way
+_BASH_BUILTINS = frozenset((
+    '.', ':', '[', 'alias', 'bg', 'bind', 'break', 'builtin', 'caller', 'cd',
+    'command', 'compgen', 'complete', 'compopt', 'continue', 'declare', 'dirs',
+    'disown', 'echo', 'enable', 'eval', 'exec', 'exit', 'export', 'false', 'fc',
+    'fg', 'getopts', 'hash', 'help', 'history', 'jobs', 'kill', 'let', 'local',
+    'logout', 'mapfile', 'popd', 'printf', 'pushd', 'pwd', 'read', 'readarray',
+    'readonly', 'return', 'set', 'shift', 'shopt', 'source', 'suspend', 'test',
+    'times', 'trap', 'true', 'type', 'typeset', 'ulimit', 'umask', 'unalias',
+    'unset', 'wait'
+))
+
+# Output kept per stream; anything past it is read and dropped
+MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+def _decode(data: bytes) -> str:
+    """Decode child output the way text=True would, tolerating a cut character"""
+    return data.decode(errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _communicate(process: subprocess.Popen, input_data: str = None, timeout: float = None,
+                 limit: int = MAX_OUTPUT_BYTES) -> tuple:
+    """
+    Feed stdin and collect stdout/stderr, keeping at most limit bytes of each
+
+    Output past the limit is still drained so the child isn't blocked on a
+    full pipe.
+
+    Returns:
+        tuple: (stdout, stderr, whether either stream was truncated)
+
+    Raises:
+        subprocess.TimeoutExpired: If the streams are still open after timeout
+    """
+    data = input_data.encode() if input_data is not None else None
+
+    if os.name == 'nt':
+        stdout, stderr = process.communicate(input=data, timeout=timeout)
+        truncated = len(stdout) > limit or len(stderr) > limit
+        return _decode(stdout[:limit]), _decode(stderr[:limit]), truncated
+
+    deadline = time.monotonic() + timeout
+    output = {process.stdout: bytearray(), process.stderr: bytearray()}
+    truncated = False
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            for stream in output:
+                selector.register(stream, selectors.EVENT_READ)
+
+            pending = memoryview(data or b'')
+            if process.stdin is not None:
+                if pending:
+                    os.set_blocking(process.stdin.fileno(), False)
+                    selector.register(process.stdin, selectors.EVENT_WRITE)
+                else:
+                    process.stdin.close()
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+
+                for key, _ in selector.select(remaining):
+                    stream = key.fileobj
+
+                    if stream is process.stdin:
+                        try:
+                            pending = pending[os.write(key.fd, pending[:_CHUNK_SIZE]):]
+                        except BrokenPipeError:
+                            # The child stopped reading; the rest of stdin is moot
+                            pending = pending[:0]
+                        if not pending:
+                            selector.unregister(stream)
+                            stream.close()
+                        continue
+
+                    chunk = os.read(key.fd, _CHUNK_SIZE)
+                    if not chunk:
+                        selector.unregister(stream)
+                        stream.close()
+                        continue
+
+                    buffer = output[stream]
+                    room = limit - len(buffer)
+                    if len(chunk) > room:
+                        truncated = True
+                        chunk = chunk[:max(room, 0)]
+                    buffer += chunk
+
+        process.wait(timeout=deadline - time.monotonic())
+    finally:
+        for stream in (process.stdin, process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    return _decode(output[process.stdout]), _decode(output[process.stderr]), truncated
+
+
+def _limit_process(process: subprocess.Popen, cpu_seconds: int, **limits: int):
+    """
+    Apply kernel resource limits to a started child
+
+    Limits are set from outside with prlimit, so processes still start
+    without a preexec_fn and warm processes get limits matching the call.
+    CPU time is capped at cpu_seconds (SIGXCPU, then SIGKILL a second
+    later); other limits are given as RLIMIT_* names without the prefix,
+    e.g. AS=... Does nothing where prlimit isn't available.
+    """
+    if resource is None or not hasattr(resource, 'prlimit'):
+        return
+
+    limits = {'CPU': (cpu_seconds, cpu_seconds + 1), **{name: (value, value) for name, value in limits.items()}}
+    for name, (soft, hard) in limits.items():
+        kind = getattr(resource, f'RLIMIT_{name}')
+        try:
+            current_hard = resource.prlimit(process.pid, kind)[1]
+            if current_hard != resource.RLIM_INFINITY:
+                soft, hard = min(soft, current_hard), min(hard, current_hard)
+            resource.prlimit(process.pid, kind, (soft, hard))
+        except (ProcessLookupError, PermissionError, ValueError):
+            # Already exited, or not ours to restrict
+            pass
+
+
+def _direct_argv(command: str) -> Optional[list]:
+    """
+    Argument list for running a command without bash, or None if it needs bash
+
+    Only commands made of plain words whose first word is an executable on
+    PATH qualify; builtins, relative paths and anything bash would expand
+    or redirect go through bash.
+    """
+    if not _SHELL_CHARS.isdisjoint(command):
+        return None
+
+    # Without quotes or escapes, bash word splitting is whitespace splitting
+    argv = command.split()
+    if not argv or '/' in argv[0] or argv[0] in _BASH_RESERVED_WORDS or argv[0] in _BASH_BUILTINS:
+        return None
+
+    executable = shutil.which(argv[0])
+    if executable is None:
+        return None
+    return [executable] + argv[1:]
+
+
+class _WarmSpawner:
+    """
+    Keeps one interpreter process started ahead of time
+
+    The spare has already paid interpreter start-up and is blocked reading
+    its program from stdin, so take() hands out a fresh, isolated process
+    without waiting for start-up. A replacement is started on every take.
+    """
+
+    def __init__(self, argv: list):
+        self.argv = argv
+        self._spare = None  # (process, cwd it was started in)
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+
+    @staticmethod
+    def _discard(process: subprocess.Popen):
+        process.kill()
+        process.wait()
+        for stream in (process.stdin, process.stdout, process.stderr):
+            stream.close()
+
+    def take(self) -> subprocess.Popen:
+        """Return a started process waiting for its program on stdin"""
+        cwd = os.getcwd()
+        with self._lock:
+            spare, self._spare = self._spare, None
+
+        if spare is not None and spare[1] == cwd and spare[0].poll() is None:
+            process = spare[0]
+        else:
+            if spare is not None:
+                self._discard(spare[0])
+            process = self._spawn()
+
+        replacement = (self._spawn(), cwd)
+        with self._lock:
+            spare, self._spare = self._spare, replacement
+        if spare is not None:
+            self._discard(spare[0])
+        return process
+
+    def close(self):
+        """Stop the spare process, if any"""
+        with self._lock:
+            spare, self._spare = self._spare, None
+        if spare is not None:
+            self._discard(spare[0])
+
+
+_PYTHON_SPAWNER = _WarmSpawner(['python3', '-c', _PYTHON_STDIN_SHIM])
+# Resolved once; None if Node.js isn't installed
+_NODE_PATH = shutil.which('node')
+_NODE_SPAWNER = _WarmSpawner([_NODE_PATH, '-'])
+atexit.register(_PYTHON_SPAWNER.close)
+atexit.register(_NODE_SPAWNER.close)
+
 
 class PythonExecutor(Tool):
     """Execute Python code in a controlled environment"""
@@ -47,54 +310,49 @@ class PythonExecutor(Tool):
             # Limit timeout
             timeout = min(max(timeout, 1), 300)
 
-            # Create temporary file for code
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
+            # Execute with timeout; the code goes ahead of input_data on stdin
+            process = _PYTHON_SPAWNER.take()
+            _limit_process(
+                process,
+                timeout,
+                AS=PYTHON_MEMORY_LIMIT,
+                FSIZE=PYTHON_FILE_SIZE_LIMIT,
+                NOFILE=PYTHON_OPEN_FILES_LIMIT
+            )
 
             try:
-                # Execute with timeout
-                process = subprocess.Popen(
-                    ['python3', temp_file],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    preexec_fn=os.setsid if os.name != 'nt' else None
+                stdout, stderr, truncated = _communicate(
+                    process,
+                    input_data=f"{len(code.encode())}\n{code}{input_data}",
+                    timeout=timeout
                 )
+                return_code = process.returncode
+
+                result = {
+                    "success": return_code == 0,
+                    "stdout": stdout,
+                    "stderr": stderr,
+                    "return_code": return_code,
+                    "timeout": False
+                }
+                if truncated:
+                    result["truncated"] = True
+                return result
+            except subprocess.TimeoutExpired:
+                # Kill the process group
+                if os.name != 'nt':
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                else:
+                    process.terminate()
+                process.wait()
 
-                try:
-                    stdout, stderr = process.communicate(input=input_data, timeout=timeout)
-                    return_code = process.returncode
-
-                    return {
-                        "success": return_code == 0,
-                        "stdout": stdout,
-                        "stderr": stderr,
-                        "return_code": return_code,
-                        "timeout": False
-                    }
-                except subprocess.TimeoutExpired:
-                    # Kill the process group
-                    if os.name != 'nt':
-                        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                    else:
-                        process.terminate()
-                    process.wait()
-
-                    return {
-                        "success": False,
-                        "stdout": "",
-                        "stderr": f"Execution timed out after {timeout} seconds",
-                        "return_code": -1,
-                        "timeout": True
-                    }
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
+                return {
+                    "success": False,
+                    "stdout": "",
+                    "stderr": f"Execution timed out after {timeout} seconds",
+                    "return_code": -1,
+                    "timeout": True
+                }
 
         except Exception as e:
             return {"error": str(e)}
@@ -129,57 +387,43 @@ class JavaScriptExecutor(Tool):
     def execute(self, code: str, timeout: int = 30) -> Dict[str, Any]:
         """Execute JavaScript code"""
         try:
-            # Check if Node.js is available
-            check = subprocess.run(['which', 'node'], capture_output=True)
-            if check.returncode != 0:
+            if _NODE_PATH is None:
                 return {"error": "Node.js is not installed"}
 
             timeout = min(max(timeout, 1), 300)
 
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
+            # Node reads the script from stdin when given '-'
+            process = _NODE_SPAWNER.take()
+            _limit_process(process, timeout)
 
             try:
-                process = subprocess.Popen(
-                    ['node', temp_file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    preexec_fn=os.setsid if os.name != 'nt' else None
-                )
+                stdout, stderr, truncated = _communicate(process, input_data=code, timeout=timeout)
+                return_code = process.returncode
+
+                result = {
+                    "success": return_code == 0,
+                    "stdout": stdout,
+                    "stderr": stderr,
+                    "return_code": return_code,
+                    "timeout": False
+                }
+                if truncated:
+                    result["truncated"] = True
+                return result
+            except subprocess.TimeoutExpired:
+                if os.name != 'nt':
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                else:
+                    process.terminate()
+                process.wait()
 
-                try:
-                    stdout, stderr = process.communicate(timeout=timeout)
-                    return_code = process.returncode
-
-                    return {
-                        "success": return_code == 0,
-                        "stdout": stdout,
-                        "stderr": stderr,
-                        "return_code": return_code,
-                        "timeout": False
-                    }
-                except subprocess.TimeoutExpired:
-                    if os.name != 'nt':
-                        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                    else:
-                        process.terminate()
-                    process.wait()
-
-                    return {
-                        "success": False,
-                        "stdout": "",
-                        "stderr": f"Execution timed out after {timeout} seconds",
-                        "return_code": -1,
-                        "timeout": True
-                    }
-            finally:
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
+                return {
+                    "success": False,
+                    "stdout": "",
+                    "stderr": f"Execution timed out after {timeout} seconds",
+                    "return_code": -1,
+                    "timeout": True
+                }
 
         except Exception as e:
             return {"error": str(e)}
@@ -219,34 +463,35 @@ class BashExecutor(Tool):
     def execute(self, command: str, timeout: int = 30, working_dir: str = ".") -> Dict[str, Any]:
         """Execute bash command"""
         try:
-            # Dangerous commands blacklist
-            dangerous = ['rm -rf /', 'mkfs', 'dd if=', ':(){:|:&};:', 'chmod -R 777 /']
-            if any(danger in command for danger in dangerous):
+            if _DANGER_RE.search(command):
                 return {"error": "Dangerous command blocked for safety"}
 
             timeout = min(max(timeout, 1), 300)
 
+            # Simple commands skip the bash process altogether
             process = subprocess.Popen(
-                command,
-                shell=True,
+                _direct_argv(command) or ['bash', '-c', command],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 cwd=working_dir,
-                preexec_fn=os.setsid if os.name != 'nt' else None
+                start_new_session=True
             )
+            _limit_process(process, timeout)
 
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
+                stdout, stderr, truncated = _communicate(process, timeout=timeout)
                 return_code = process.returncode
 
-                return {
+                result = {
                     "success": return_code == 0,
                     "stdout": stdout,
                     "stderr": stderr,
                     "return_code": return_code,
                     "timeout": False
                 }
+                if truncated:
+                    result["truncated"] = True
+                return result
             except subprocess.TimeoutExpired:
                 if os.name != 'nt':
                     os.killpg(os.getpgid(process.pid), signal.SIGTERM)
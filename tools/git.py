@@ -2,10 +2,188 @@
 Git integration tools for repository management
 """
 import subprocess
+import copy
 import os
-from typing import Dict, Any
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .base import Tool
+from .execution import _communicate
+
+# Absolute path, so subprocess can start git with posix_spawn
+_GIT_PATH = shutil.which('git') or 'git'
+
+# Diff text kept by GitDiff; the rest is dropped and flagged as truncated
+MAX_DIFF_BYTES = 2 * 1024 * 1024
+
+# GitLog results by (repo, HEAD commit, arguments); history under a commit never changes
+LOG_CACHE_SIZE = 32
+_log_cache: OrderedDict = OrderedDict()
+_log_lock = threading.Lock()
+
+# GitLog's full format: unit-separated fields, record-separated commits
+_LOG_FIELDS = ('hash', 'author', 'date', 'subject', 'body')
+_LOG_FORMAT = '--format=%H%x1f%an <%ae>%x1f%ad%x1f%s%x1f%b%x1e'
+
+# A diffstat line: ' <path> | <count> +++--' or ' <path> | Bin <old> -> <new> bytes'
+_DIFFSTAT_RE = re.compile(r'^ (.+?)\s+\|\s+(?:\d+|Bin)', re.MULTILINE)
+
+
+def _render_commit(commit: Dict[str, str]) -> str:
+    """A parsed GitLog commit as `git log` prints it by default"""
+    message = commit['subject']
+    if commit['body']:
+        message += '\n\n' + commit['body']
+    indented = ''.join(f"    {line}\n" for line in message.split('\n'))
+    return f"commit {commit['hash']}\nAuthor: {commit['author']}\nDate:   {commit['date']}\n\n{indented}"
+
+
+def _git_argv(repo_path: str, *args: str) -> List[str]:
+    """
+    Command line running git in repo_path
+
+    CPython starts a child with posix_spawn instead of fork/exec only for
+    an absolute executable, no cwd and close_fds=False, so the repository
+    is passed with -C. Python opens descriptors non-inheritable, so
+    close_fds=False doesn't hand git anything extra.
+    """
+    return [_GIT_PATH, '-C', repo_path, *args]
+
+
+def _read_only_env() -> Dict[str, str]:
+    """
+    Environment for git queries that shouldn't write the repository
+
+    Without optional locks, status and diff skip taking index.lock to
+    write back refreshed stat data, so they neither pay for that write
+    nor collide with a commit running concurrently.
+    """
+    return {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+
+def _branch_from_header(header: str) -> str:
+    """
+    Current branch from a 'git status -b --porcelain' header line
+
+    Matches 'git rev-parse --abbrev-ref HEAD': a detached HEAD gives 'HEAD'.
+    """
+    branch = header[3:]
+    for prefix in ('No commits yet on ', 'Initial commit on '):
+        if branch.startswith(prefix):
+            return branch[len(prefix):]
+    if branch.startswith('HEAD (no branch)'):
+        return 'HEAD'
+    # '<branch>...<upstream> [ahead N]' or '<branch>'
+    return branch.split('...', 1)[0].split(' ', 1)[0]
+
+
+def _read_head(repo_path: str) -> Optional[str]:
+    """
+    Resolve HEAD to a commit id by reading .git directly
+
+    Returns None when that isn't straightforward (worktrees, submodules,
+    subdirectories of a repository, unborn branches); callers then fall
+    back to running git.
+    """
+    git_dir = Path(repo_path, '.git')
+    try:
+        head = (git_dir / 'HEAD').read_text().strip()
+        if not head.startswith('ref: '):
+            return head
+
+        ref = head[5:]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip()
+
+        with open(git_dir / 'packed-refs') as f:
+            for line in f:
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
+def _scan_refs(directory: str, prefix: str, refs: Dict[str, str]):
+    """Add loose refs under directory to refs as {refname: contents}"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = prefix + entry.name
+            if entry.is_dir():
+                _scan_refs(entry.path, name + '/', refs)
+            elif not entry.name.endswith('.lock'):
+                with open(entry.path) as f:
+                    refs[name] = f.read().strip()
+
+
+def _list_branches(repo_path: str) -> Optional[List[str]]:
+    """
+    'git branch -a' lines built from .git/refs and packed-refs
+
+    Returns None when HEAD is detached or the repository isn't a plain
+    .git directory, so the caller can fall back to git.
+    """
+    git_dir = os.path.join(repo_path, '.git')
+    try:
+        with open(os.path.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+        if not head.startswith('ref: '):
+            return None
+        current = head[5:]
+
+        refs: Dict[str, str] = {}
+        try:
+            with open(os.path.join(git_dir, 'packed-refs')) as f:
+                for line in f:
+                    sha, _, name = line.rstrip('\n').partition(' ')
+                    if name.startswith(('refs/heads/', 'refs/remotes/')):
+                        refs[name] = sha
+        except FileNotFoundError:
+            pass
+
+        # Loose refs override packed ones
+        for kind in ('heads', 'remotes'):
+            directory = os.path.join(git_dir, 'refs', kind)
+            if os.path.isdir(directory):
+                _scan_refs(directory, f'refs/{kind}/', refs)
+    except OSError:
+        return None
+
+    lines = []
+    for name in sorted(refs):
+        if name.startswith('refs/heads/'):
+            marker = '* ' if name == current else '  '
+            lines.append(marker + name[len('refs/heads/'):])
+            continue
+
+        line = '  ' + name[len('refs/'):]
+        target = refs[name]
+        if target.startswith('ref: refs/remotes/'):
+            line += ' -> ' + target[len('ref: refs/remotes/'):]
+        lines.append(line)
+    return lines
+
+
+def _parse_numstat(output: str) -> List[Dict[str, Any]]:
+    """Parse 'git diff --numstat' lines; binary files get None counts"""
+    files = []
+    for line in output.splitlines():
+        fields = line.split('\t', 2)
+        if len(fields) != 3:
+            # A line cut short by the output cap
+            continue
+        added, deleted, path = fields
+        files.append({
+            "path": path,
+            "added": int(added) if added != '-' else None,
+            "deleted": int(deleted) if deleted != '-' else None
+        })
+    return files
 
 
 class GitStatus(Tool):
@@ -33,35 +211,26 @@ class GitStatus(Tool):
         """Get git status"""
         try:
             result = subprocess.run(
-                ['git', 'status', '--porcelain', '-b'],
-                cwd=repo_path,
+                _git_argv(repo_path, 'status', '--porcelain', '-b'),
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=10,
+                close_fds=False,
+                env=_read_only_env()
             )
 
             if result.returncode != 0:
                 return {"error": result.stderr or "Not a git repository"}
 
-            # Parse status
-            lines = result.stdout.strip().split('\n')
-            branch_info = lines[0] if lines else ""
-            files = lines[1:] if len(lines) > 1 else []
-
-            # Get current branch
-            branch_result = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True
-            )
-            current_branch = branch_result.stdout.strip()
+            # Parse status; the branch comes from the '## ' header line
+            branch_info, _, entries = result.stdout.partition('\n')
+            files = entries.splitlines()
 
             return {
-                "branch": current_branch,
+                "branch": _branch_from_header(branch_info),
                 "branch_info": branch_info,
                 "files": files,
-                "clean": len(files) == 0 or (len(files) == 1 and not files[0]),
+                "clean": not files,
                 "raw_output": result.stdout
             }
 
@@ -95,31 +264,50 @@ class GitDiff(Tool):
                 "file_path": {
                     "type": "string",
                     "description": "Specific file to diff (optional)"
+                },
+                "stat": {
+                    "type": "boolean",
+                    "description": "Only list changed files with added/deleted line counts",
+                    "default": False
                 }
             }
         }
 
-    def execute(self, repo_path: str = ".", staged: bool = False, file_path: str = None) -> Dict[str, Any]:
+    def execute(self, repo_path: str = ".", staged: bool = False, file_path: str = None,
+                stat: bool = False) -> Dict[str, Any]:
         """Get git diff"""
         try:
-            cmd = ['git', 'diff']
+            cmd = _git_argv(repo_path, 'diff')
             if staged:
                 cmd.append('--cached')
+            if stat:
+                cmd.append('--numstat')
             if file_path:
                 cmd.append(file_path)
 
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=False,
+                env=_read_only_env()
             )
-
-            return {
-                "diff": result.stdout,
-                "has_changes": bool(result.stdout.strip())
+            try:
+                diff, _, truncated = _communicate(process, timeout=30, limit=MAX_DIFF_BYTES)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+
+            result = {
+                "diff": diff,
+                "has_changes": bool(diff.strip())
             }
+            if stat:
+                result["files"] = _parse_numstat(diff)
+            if truncated:
+                result["truncated"] = True
+            return result
 
         except Exception as e:
             return {"error": str(e)}
@@ -227,14 +415,18 @@ class GitBranch(Tool):
         """Manage branches"""
         try:
             if action == "list":
-                result = subprocess.run(
-                    ['git', 'branch', '-a'],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                branches = [line.strip().replace('* ', '') for line in result.stdout.split('\n') if line.strip()]
-                return {"branches": branches, "output": result.stdout}
+                lines = _list_branches(repo_path)
+                if lines is not None:
+                    output = ''.join(line + '\n' for line in lines)
+                else:
+                    output = subprocess.run(
+                        ['git', 'branch', '-a'],
+                        cwd=repo_path,
+                        capture_output=True,
+                        text=True
+                    ).stdout
+                branches = [line.strip().replace('* ', '') for line in output.split('\n') if line.strip()]
+                return {"branches": branches, "output": output}
 
             elif action == "create":
                 if not branch_name:
@@ -379,7 +571,9 @@ class GitPull(Tool):
     def execute(self, repo_path: str = ".", remote: str = "origin", branch: str = None) -> Dict[str, Any]:
         """Pull from remote"""
         try:
-            cmd = ['git', 'pull', remote]
+            # The diffstat lists what the pull changed, so callers needn't
+            # run git status afterwards
+            cmd = ['git', 'pull', '--stat', '--no-edit', remote]
             if branch:
                 cmd.append(branch)
 
@@ -388,7 +582,9 @@ class GitPull(Tool):
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60,
+                # Wide enough that git doesn't abbreviate long paths to '.../'
+                env={**os.environ, 'COLUMNS': '1000'}
             )
 
             if result.returncode != 0:
@@ -396,7 +592,8 @@ class GitPull(Tool):
 
             return {
                 "success": True,
-                "output": result.stdout
+                "output": result.stdout,
+                "changed_files": _DIFFSTAT_RE.findall(result.stdout)
             }
 
         except Exception as e:
@@ -435,30 +632,50 @@ class GitLog(Tool):
         }
 
     def execute(self, repo_path: str = ".", limit: int = 10, oneline: bool = True) -> Dict[str, Any]:
-        """Get commit history"""
+        """Get commit history, reusing the last result while HEAD is unchanged"""
         try:
-            cmd = ['git', 'log', f'-{limit}']
-            if oneline:
-                cmd.append('--oneline')
+            head = _read_head(repo_path)
+            key = (os.path.abspath(repo_path), head, limit, oneline)
+            if head is not None:
+                with _log_lock:
+                    cached = _log_cache.get(key)
+                    if cached is not None:
+                        _log_cache.move_to_end(key)
+                        return copy.deepcopy(cached)
 
             result = subprocess.run(
-                cmd,
-                cwd=repo_path,
+                _git_argv(repo_path, 'log', f'-{limit}', '--oneline' if oneline else _LOG_FORMAT),
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=30,
+                close_fds=False
             )
 
             if result.returncode != 0:
                 return {"error": result.stderr}
 
-            commits = [line.strip() for line in result.stdout.split('\n') if line.strip()]
-
-            return {
+            if oneline:
+                commits = result.stdout.splitlines()
+                output = result.stdout
+            else:
+                commits = []
+                for record in result.stdout.split('\x1e')[:-1]:
+                    commit = dict(zip(_LOG_FIELDS, record.lstrip('\n').split('\x1f')))
+                    commit['body'] = commit.get('body', '').strip('\n')
+                    commits.append(commit)
+                output = '\n'.join(map(_render_commit, commits))
+
+            log = {
                 "commits": commits,
                 "count": len(commits),
-                "output": result.stdout
+                "output": output
             }
+            if head is not None:
+                with _log_lock:
+                    _log_cache[key] = copy.deepcopy(log)
+                    if len(_log_cache) > LOG_CACHE_SIZE:
+                        _log_cache.popitem(last=False)
+            return log
 
         except Exception as e:
             return {"error": str(e)}
@@ -3,15 +3,37 @@ System command execution tools with safety controls
 """
 import subprocess
 import shutil
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Tool
+from .execution import _decode
+
+# Upper bound on caller-supplied command timeouts, in seconds
+MAX_TIMEOUT = 300
+
+# Seconds a `ps aux` listing is reused across process_manager calls
+PS_TTL = 0.5
+
+# Command name -> executable path, for lookups that succeeded. Misses are
+# looked up again, since the command may be installed later.
+_resolved: Dict[str, str] = {}
+
+
+def _which(name: str) -> Optional[str]:
+    """shutil.which, remembering hits"""
+    path = _resolved.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _resolved[name] = path
+    return path
 
 
 class SystemCommand(Tool):
     """Execute system commands with safety controls"""
 
     # Whitelist of safe commands
-    SAFE_COMMANDS = {
+    SAFE_COMMANDS = frozenset({
         'ls', 'pwd', 'whoami', 'date', 'echo', 'cat', 'head', 'tail',
         'grep', 'find', 'wc', 'sort', 'uniq', 'diff', 'which',
         'pip', 'npm', 'node', 'python', 'python3', 'git',
@@ -19,14 +41,14 @@ class SystemCommand(Tool):
         'java', 'javac', 'gcc', 'g++', 'clang',
         'curl', 'wget', 'ping', 'traceroute', 'netstat',
         'ps', 'top', 'df', 'du', 'free', 'uptime'
-    }
+    })
 
     # Blacklist of dangerous commands
-    DANGEROUS_COMMANDS = {
+    DANGEROUS_COMMANDS = frozenset({
         'rm', 'rmdir', 'del', 'format', 'mkfs', 'dd',
         'chmod', 'chown', 'kill', 'killall', 'shutdown',
         'reboot', 'init', 'systemctl', 'service'
-    }
+    })
 
     def get_name(self) -> str:
         return "system_command"
@@ -71,7 +93,7 @@ class SystemCommand(Tool):
         """Execute system command"""
         try:
             # Security check
-            cmd_name = command.split()[0] if ' ' in command else command
+            cmd_name = command.split(maxsplit=1)[0] if ' ' in command else command
 
             if cmd_name in self.DANGEROUS_COMMANDS:
                 return {
@@ -81,7 +103,7 @@ class SystemCommand(Tool):
 
             if cmd_name not in self.SAFE_COMMANDS:
                 # Check if command exists
-                if not shutil.which(cmd_name):
+                if not _which(cmd_name):
                     return {"error": f"Command not found: {cmd_name}"}
 
             # Build command
@@ -93,15 +115,14 @@ class SystemCommand(Tool):
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                timeout=min(timeout, 300),
+                timeout=timeout if timeout < MAX_TIMEOUT else MAX_TIMEOUT,
                 cwd=working_dir
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode(result.stdout),
+                "stderr": _decode(result.stderr),
                 "return_code": result.returncode,
                 "command": ' '.join(cmd)
             }
@@ -209,14 +230,13 @@ class PackageManager(Tool):
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=300  # Package operations can take time
             )
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode(result.stdout),
+                "stderr": _decode(result.stderr),
                 "return_code": result.returncode
             }
 
@@ -229,6 +249,20 @@ class PackageManager(Tool):
 class ProcessManager(Tool):
     """Manage processes"""
 
+    def __init__(self):
+        super().__init__()
+        # (time.monotonic() when taken, raw `ps aux` output)
+        self._ps_cache: Optional[Tuple[float, bytes]] = None
+
+    def _ps_snapshot(self) -> bytes:
+        """`ps aux` output, reused for PS_TTL seconds"""
+        cache = self._ps_cache
+        now = time.monotonic()
+        if cache is None or now - cache[0] >= PS_TTL:
+            result = subprocess.run(["ps", "aux"], capture_output=True, timeout=10)
+            cache = self._ps_cache = (now, result.stdout)
+        return cache[1]
+
     def get_name(self) -> str:
         return "process_manager"
 
@@ -256,27 +290,17 @@ class ProcessManager(Tool):
         """Manage processes"""
         try:
             if action == "list":
-                result = subprocess.run(
-                    ["ps", "aux"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
                 return {
                     "success": True,
-                    "processes": result.stdout
+                    "processes": _decode(self._ps_snapshot())
                 }
 
             elif action == "find":
                 if not pattern:
                     return {"error": "Pattern required for find action"}
-                result = subprocess.run(
-                    ["ps", "aux"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                lines = [line for line in result.stdout.split('\n') if pattern in line]
+                # Filter the raw listing and decode only the matching lines
+                needle = pattern.encode()
+                lines = [_decode(line) for line in self._ps_snapshot().split(b'\n') if needle in line]
                 return {
                     "success": True,
                     "matches": lines,
@@ -284,15 +308,9 @@ class ProcessManager(Tool):
                 }
 
             elif action == "info":
-                result = subprocess.run(
-                    ["ps", "aux"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
                 return {
                     "success": True,
-                    "info": result.stdout
+                    "info": _decode(self._ps_snapshot())
                 }
 
             else:
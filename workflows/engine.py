@@ -2,14 +2,87 @@
 Workflow Automation Engine
 Create and execute automated workflows with triggers and actions
 """
+import atexit
+import functools
+import heapq
+import itertools
 import json
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from types import CodeType
+from typing import Deque, Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import threading
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Executions kept in memory per engine; the oldest are dropped first
+EXECUTION_HISTORY_SIZE = 10000
+
+# Source of workflow and execution ids: unique within a process, and seeded
+# from the clock in microseconds so ids don't repeat across restarts
+_ids = itertools.count(int(time.time() * 1_000_000))
+
+# Threads running actions that share a parallel_group
+ACTION_WORKERS = 8
+
+# Threads running workflows fired by the scheduler
+SCHEDULED_WORKERS = 4
+
+# Seconds changes are gathered before workflows.json is rewritten
+FLUSH_INTERVAL = 0.5
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+def _dumps(obj: Any) -> bytes:
+    """Indented JSON bytes, via orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_script(script: str) -> CodeType:
+    """Compile a script action's source once per distinct script"""
+    return compile(script, '<workflow_script>', 'exec')
+
+
+def _next_run(config: Dict[str, Any], after: datetime) -> Optional[datetime]:
+    """
+    Next time a schedule trigger fires after a given time
+
+    'hourly' fires an hour after the previous run (or after scheduling);
+    'daily' and 'weekly' fire at config['time'] (HH:MM or HH:MM:SS),
+    weekly on config['day']. Returns None for an unknown interval.
+
+    Raises:
+        ValueError: If the time or day is malformed
+    """
+    interval = config.get('interval', 'daily')
+    if interval == 'hourly':
+        return after + timedelta(hours=1)
+    if interval not in ('daily', 'weekly'):
+        return None
+
+    hour, minute, second = (int(part) for part in (config.get('time', '09:00') + ':0').split(':')[:3])
+    candidate = after.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    period = timedelta(days=1)
+
+    if interval == 'weekly':
+        weekday = WEEKDAYS.index(config.get('day', 'monday').lower())
+        candidate += timedelta(days=(weekday - candidate.weekday()) % 7)
+        period = timedelta(days=7)
+
+    if candidate <= after:
+        candidate += period
+    return candidate
 
 
 class TriggerType(Enum):
@@ -42,6 +115,8 @@ class WorkflowStatus(Enum):
 class WorkflowTrigger:
     """Workflow trigger definition"""
 
+    __slots__ = ('type', 'config')
+
     def __init__(self, trigger_type: TriggerType, config: Dict[str, Any]):
         self.type = trigger_type
         self.config = config
@@ -63,6 +138,8 @@ class WorkflowTrigger:
 class WorkflowAction:
     """Workflow action definition"""
 
+    __slots__ = ('type', 'config', 'name', 'continue_on_error', 'parallel_group')
+
     def __init__(
         self,
         action_type: ActionType,
@@ -73,6 +150,11 @@ class WorkflowAction:
         self.config = config
         self.name = name or f"{action_type.value}_action"
 
+        # Read from config once, when the action is built; later edits to
+        # these config keys take effect when the workflow is reloaded
+        self.continue_on_error = bool(config.get('continue_on_error', False))
+        self.parallel_group = config.get('parallel_group')
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'type': self.type.value,
@@ -92,6 +174,11 @@ class WorkflowAction:
 class Workflow:
     """Workflow definition"""
 
+    __slots__ = (
+        'id', 'name', 'description', 'triggers', 'actions', 'enabled',
+        'created_at', 'last_run', 'run_count', '_plan', '_static_dict'
+    )
+
     def __init__(
         self,
         name: str,
@@ -100,7 +187,7 @@ class Workflow:
         actions: List[WorkflowAction] = None,
         enabled: bool = True
     ):
-        self.id = datetime.now().strftime("%Y%m%d%H%M%S")
+        self.id = f"{next(_ids):x}"
         self.name = name
         self.description = description
         self.triggers = triggers or []
@@ -110,18 +197,45 @@ class Workflow:
         self.last_run = None
         self.run_count = 0
 
+        # Resolved (handler, action) steps cached by WorkflowEngine._plan
+        self._plan: Optional[tuple] = None
+        # (fields it was built from, dict) reused by to_dict
+        self._static_dict: Optional[tuple] = None
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'triggers': [t.to_dict() for t in self.triggers],
-            'actions': [a.to_dict() for a in self.actions],
-            'enabled': self.enabled,
-            'created_at': self.created_at,
-            'last_run': self.last_run,
-            'run_count': self.run_count
-        }
+        """
+        Serializable form of the workflow
+
+        The part that rarely changes is built once and rebuilt when a
+        field, the trigger/action lists, or an item's type, name or config
+        changes. Configs are compared by identity first, so an unchanged
+        one costs no deep comparison. Nested values are shared with that
+        cache, so callers must not modify them.
+        """
+        key = (
+            self.id, self.name, self.description, self.created_at,
+            tuple((t.type, t.config) for t in self.triggers),
+            tuple((a.type, a.name, a.config) for a in self.actions)
+        )
+        static = self._static_dict
+        if static is None or static[0] != key:
+            static = self._static_dict = (key, {
+                'id': self.id,
+                'name': self.name,
+                'description': self.description,
+                'triggers': [t.to_dict() for t in self.triggers],
+                'actions': [a.to_dict() for a in self.actions],
+                'enabled': None,
+                'created_at': self.created_at,
+                'last_run': None,
+                'run_count': None
+            })
+
+        data = static[1].copy()
+        data['enabled'] = self.enabled
+        data['last_run'] = self.last_run
+        data['run_count'] = self.run_count
+        return data
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Workflow':
@@ -142,8 +256,10 @@ class Workflow:
 class WorkflowExecution:
     """Workflow execution record"""
 
+    __slots__ = ('id', 'workflow_id', 'status', 'started_at', 'completed_at', 'results', 'error')
+
     def __init__(self, workflow_id: str):
-        self.id = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self.id = f"{next(_ids):x}"
         self.workflow_id = workflow_id
         self.status = WorkflowStatus.PENDING
         self.started_at = datetime.now().isoformat()
@@ -179,11 +295,36 @@ class WorkflowEngine:
         self.workflows_dir.mkdir(parents=True, exist_ok=True)
 
         self.workflows: Dict[str, Workflow] = {}
-        self.executions: List[WorkflowExecution] = []
+        self.executions: Deque[WorkflowExecution] = deque(maxlen=EXECUTION_HISTORY_SIZE)
         self.running = False
         self.scheduler_thread = None
 
+        # Scheduler state: next fire time (epoch seconds) per (workflow id,
+        # trigger index), the same entries as a heap, and an event that makes
+        # the scheduler re-plan after workflows change or it is stopped
+        self._next_runs: Dict[Tuple[str, int], float] = {}
+        self._timers: List[Tuple[float, str, int]] = []
+        self._wakeup = threading.Event()
+
+        # Scheduled runs go here so a slow workflow never holds up the
+        # scheduler; kept apart from _action_pool, which these runs wait on
+        self._pool = ThreadPoolExecutor(max_workers=SCHEDULED_WORKERS, thread_name_prefix='wf-exec')
+
         self.action_handlers: Dict[ActionType, Callable] = {}
+        self._action_pool: Optional[ThreadPoolExecutor] = None
+        # Serializes saves from the scheduler, action and caller threads
+        self._save_lock = threading.Lock()
+        # Set when workflows changed since the last save; the flusher thread
+        # writes them out in one save shortly after _dirty_event is set, and
+        # exits once _closing is set (see close())
+        self._dirty = False
+        self._dirty_event = threading.Event()
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name='wf-flush')
+        self._flusher.start()
+        atexit.register(self.flush)
+        # Bumped on handler registration so cached workflow plans are rebuilt
+        self._handler_version = 0
 
         self._load_workflows()
         self._register_default_handlers()
@@ -195,8 +336,8 @@ class WorkflowEngine:
             return
 
         try:
-            with open(workflow_file, 'r') as f:
-                data = json.load(f)
+            with open(workflow_file, 'rb') as f:
+                data = (orjson.loads if orjson is not None else json.loads)(f.read())
 
             for workflow_data in data:
                 workflow = Workflow.from_dict(workflow_data)
@@ -210,14 +351,58 @@ class WorkflowEngine:
         workflow_file = self.workflows_dir / "workflows.json"
 
         try:
-            data = [w.to_dict() for w in self.workflows.values()]
+            with self._save_lock:
+                # list() snapshots the values without running Python code, so
+                # a workflow created meanwhile can't break the iteration
+                data = _dumps([w.to_dict() for w in list(self.workflows.values())])
 
-            with open(workflow_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                # Write aside and swap in, so a crash never leaves a partial file
+                workflow_tmp = workflow_file.with_suffix('.json.tmp')
+                workflow_tmp.write_bytes(data)
+                workflow_tmp.replace(workflow_file)
 
         except Exception as e:
             print(f"Error saving workflows: {e}")
 
+    def _mark_dirty(self):
+        """Schedule a save after workflows changed; save right away once closed"""
+        self._dirty = True
+        if self._closing.is_set():
+            self.flush()
+        else:
+            self._dirty_event.set()
+
+    def _flush_loop(self):
+        """Flusher thread: save at most once per FLUSH_INTERVAL while changes arrive"""
+        while not self._closing.is_set():
+            self._dirty_event.wait()
+            self._closing.wait(FLUSH_INTERVAL)
+            self._dirty_event.clear()
+            self.flush()
+
+    def flush(self):
+        """Save workflows now if any changed since the last save"""
+        if not self._dirty:
+            return
+
+        # Changes are made before they are marked, so anything marked before
+        # this reset is already in the snapshot _save_workflows takes next
+        self._dirty = False
+        self._save_workflows()
+
+    def close(self):
+        """
+        Stop the flusher thread and save pending changes
+
+        Changes made afterwards are saved immediately.
+        """
+        self._closing.set()
+        self._dirty_event.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        atexit.unregister(self.flush)
+
     def _register_default_handlers(self):
         """Register default action handlers"""
         self.register_action_handler(ActionType.COMMAND, self._handle_command)
@@ -234,14 +419,14 @@ class WorkflowEngine:
                 command,
                 shell=True,
                 capture_output=True,
-                text=True,
                 timeout=action.config.get('timeout', 30)
             )
 
+            # Decoded once here; a stray invalid byte doesn't fail the action
             return {
                 'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
+                'stdout': result.stdout.decode(errors='replace'),
+                'stderr': result.stderr.decode(errors='replace'),
                 'returncode': result.returncode
             }
 
@@ -257,7 +442,7 @@ class WorkflowEngine:
             script = action.config.get('script', '')
             # Execute script with context
             exec_globals = {'context': context, 'result': None}
-            exec(script, exec_globals)
+            exec(_compile_script(script), exec_globals)
 
             return {
                 'success': True,
@@ -287,6 +472,21 @@ class WorkflowEngine:
     ):
         """Register custom action handler"""
         self.action_handlers[action_type] = handler
+        self._handler_version += 1
+
+    def _plan(self, workflow: Workflow) -> List[tuple]:
+        """
+        (handler, action) steps for a workflow
+
+        Cached on the workflow and rebuilt when its actions or this engine's
+        handlers change; handler is None for unhandled action types.
+        """
+        actions = tuple(workflow.actions)
+        plan = workflow._plan
+        if plan is None or plan[0] is not self or plan[1] != self._handler_version or plan[2] != actions:
+            steps = [(self.action_handlers.get(action.type), action) for action in actions]
+            plan = workflow._plan = (self, self._handler_version, actions, steps)
+        return plan[3]
 
     def create_workflow(
         self,
@@ -298,7 +498,8 @@ class WorkflowEngine:
         """Create a new workflow"""
         workflow = Workflow(name, description, triggers, actions)
         self.workflows[workflow.id] = workflow
-        self._save_workflows()
+        self._mark_dirty()
+        self._wakeup.set()
 
         print(f"✓ Created workflow: {name} (ID: {workflow.id})")
         return workflow
@@ -307,7 +508,8 @@ class WorkflowEngine:
         """Delete a workflow"""
         if workflow_id in self.workflows:
             del self.workflows[workflow_id]
-            self._save_workflows()
+            self._mark_dirty()
+            self._wakeup.set()
             print(f"✓ Deleted workflow: {workflow_id}")
             return True
 
@@ -317,13 +519,15 @@ class WorkflowEngine:
         """Enable a workflow"""
         if workflow_id in self.workflows:
             self.workflows[workflow_id].enabled = True
-            self._save_workflows()
+            self._mark_dirty()
+            self._wakeup.set()
 
     def disable_workflow(self, workflow_id: str):
         """Disable a workflow"""
         if workflow_id in self.workflows:
             self.workflows[workflow_id].enabled = False
-            self._save_workflows()
+            self._mark_dirty()
+            self._wakeup.set()
 
     def execute_workflow(
         self,
@@ -341,25 +545,32 @@ class WorkflowEngine:
         context = context or {}
 
         try:
-            # Execute actions in sequence
-            for action in workflow.actions:
-                if action.type not in self.action_handlers:
-                    result = {
-                        'success': False,
-                        'error': f"No handler for action type: {action.type.value}"
-                    }
-                else:
-                    handler = self.action_handlers[action.type]
-                    result = handler(action, context)
-
-                execution.results.append({
-                    'action': action.name,
-                    'result': result
-                })
-
-                # Stop on failure if configured
-                if not result.get('success') and not action.config.get('continue_on_error', False):
+            # Execute actions in sequence; consecutive actions sharing a
+            # parallel_group run together and all finish before moving on
+            steps = self._plan(workflow)
+            start = 0
+            while start < len(steps):
+                end = start + 1
+                group = steps[start][1].parallel_group
+                if group is not None:
+                    while end < len(steps) and steps[end][1].parallel_group == group:
+                        end += 1
+
+                batch = steps[start:end]
+                stop = False
+                for (_, action), result in zip(batch, self._run_steps(batch, context)):
+                    execution.results.append({
+                        'action': action.name,
+                        'result': result
+                    })
+
+                    # Stop on failure if configured
+                    if not action.continue_on_error and not result.get('success'):
+                        stop = True
+
+                if stop:
                     break
+                start = end
 
             execution.status = WorkflowStatus.COMPLETED
             workflow.last_run = datetime.now().isoformat()
@@ -371,16 +582,44 @@ class WorkflowEngine:
 
         execution.completed_at = datetime.now().isoformat()
         self.executions.append(execution)
-        self._save_workflows()
+        self._mark_dirty()
 
         return execution
 
+    def _run_steps(self, steps: List[tuple], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run (handler, action) steps, concurrently when there are several
+
+        Concurrent actions share context, so they shouldn't write to it.
+
+        Returns:
+            List[Dict[str, Any]]: Results in step order
+        """
+        def run(handler, action):
+            if handler is None:
+                return {
+                    'success': False,
+                    'error': f"No handler for action type: {action.type.value}"
+                }
+            return handler(action, context)
+
+        if len(steps) == 1:
+            return [run(*steps[0])]
+
+        if self._action_pool is None:
+            self._action_pool = ThreadPoolExecutor(max_workers=ACTION_WORKERS, thread_name_prefix='wf-action')
+
+        futures = [self._action_pool.submit(run, handler, action) for handler, action in steps]
+        wait(futures)
+        return [future.result() for future in futures]
+
     def start_scheduler(self):
         """Start workflow scheduler"""
         if self.running:
             return
 
         self.running = True
+        self._next_runs = {}
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
 
@@ -389,71 +628,125 @@ class WorkflowEngine:
     def stop_scheduler(self):
         """Stop workflow scheduler"""
         self.running = False
+        self._wakeup.set()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        self.close()
 
         print("✓ Workflow scheduler stopped")
 
     def _scheduler_loop(self):
-        """Scheduler main loop"""
-        # Setup scheduled workflows
-        for workflow in self.workflows.values():
+        """
+        Scheduler main loop
+
+        Sleeps until the earliest trigger is due rather than polling, and
+        re-plans whenever _wakeup is set.
+        """
+        while self.running:
+            self._wakeup.clear()
+            self._plan_schedule()
+
+            while self.running and not self._wakeup.is_set():
+                if not self._timers:
+                    self._wakeup.wait()
+                    break
+
+                deadline, workflow_id, index = self._timers[0]
+                delay = deadline - time.time()
+                if delay > 0:
+                    # Woken early by a re-plan, or by a wall clock change
+                    self._wakeup.wait(timeout=min(delay, threading.TIMEOUT_MAX))
+                    continue
+
+                heapq.heappop(self._timers)
+                self._run_scheduled(workflow_id, index)
+
+    def _plan_schedule(self):
+        """Rebuild the timer heap, keeping fire times of triggers already planned"""
+        now = datetime.now()
+        next_runs = {}
+
+        for workflow in list(self.workflows.values()):
             if not workflow.enabled:
                 continue
 
-            for trigger in workflow.triggers:
-                if trigger.type == TriggerType.SCHEDULE:
-                    self._schedule_workflow(workflow, trigger)
+            for index, trigger in enumerate(workflow.triggers):
+                if trigger.type is not TriggerType.SCHEDULE:
+                    continue
+
+                key = (workflow.id, index)
+                deadline = self._next_runs.get(key)
+                if deadline is None:
+                    try:
+                        next_run = _next_run(trigger.config, now)
+                    except ValueError as e:
+                        print(f"Error scheduling workflow {workflow.id}: {e}")
+                        continue
+                    if next_run is None:
+                        continue
+                    deadline = next_run.timestamp()
+                next_runs[key] = deadline
+
+        self._next_runs = next_runs
+        self._timers = [(deadline, workflow_id, index) for (workflow_id, index), deadline in next_runs.items()]
+        heapq.heapify(self._timers)
+
+    def _run_scheduled(self, workflow_id: str, index: int):
+        """Start a due workflow on the worker pool and plan its trigger's next run"""
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None or index >= len(workflow.triggers):
+            self._next_runs.pop((workflow_id, index), None)
+            return
 
-        # Run scheduler
-        while self.running:
-            schedule.run_pending()
-            time.sleep(1)
+        self._pool.submit(self._execute_scheduled, workflow_id)
 
-    def _schedule_workflow(self, workflow: Workflow, trigger: WorkflowTrigger):
-        """Schedule a workflow based on trigger"""
-        interval = trigger.config.get('interval', 'daily')
-        time_str = trigger.config.get('time', '09:00')
+        # The trigger may have been edited since it was planned
+        try:
+            next_run = _next_run(workflow.triggers[index].config, datetime.now())
+        except ValueError as e:
+            print(f"Error scheduling workflow {workflow_id}: {e}")
+            next_run = None
+        if next_run is None:
+            self._next_runs.pop((workflow_id, index), None)
+            return
 
-        if interval == 'daily':
-            schedule.every().day.at(time_str).do(
-                lambda: self.execute_workflow(workflow.id)
-            )
-        elif interval == 'hourly':
-            schedule.every().hour.do(
-                lambda: self.execute_workflow(workflow.id)
-            )
-        elif interval == 'weekly':
-            day = trigger.config.get('day', 'monday')
-            getattr(schedule.every(), day).at(time_str).do(
-                lambda: self.execute_workflow(workflow.id)
-            )
+        deadline = next_run.timestamp()
+        self._next_runs[(workflow_id, index)] = deadline
+        heapq.heappush(self._timers, (deadline, workflow_id, index))
+
+    def _execute_scheduled(self, workflow_id: str):
+        """Execute a workflow on a pool thread, reporting errors"""
+        try:
+            self.execute_workflow(workflow_id)
+        except Exception as e:
+            print(f"Error running scheduled workflow {workflow_id}: {e}")
 
     def get_execution_history(
         self,
         workflow_id: Optional[str] = None,
         limit: int = 10
     ) -> List[WorkflowExecution]:
-        """Get execution history"""
-        executions = self.executions
+        """Get the most recently started executions, newest first"""
+        # Snapshot first: scheduled runs append from pool threads, and a
+        # deque raises if it is mutated while being iterated
+        executions = list(self.executions)
 
         if workflow_id:
-            executions = [e for e in executions if e.workflow_id == workflow_id]
+            executions = (e for e in executions if e.workflow_id == workflow_id)
 
-        return sorted(
-            executions,
-            key=lambda e: e.started_at,
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, executions, key=lambda e: e.started_at)
 
 
 # Global workflow engine instance
 _workflow_engine = None
+_workflow_engine_lock = threading.Lock()
 
 
 def get_workflow_engine() -> WorkflowEngine:
     """Get global workflow engine instance"""
     global _workflow_engine
     if _workflow_engine is None:
-        _workflow_engine = WorkflowEngine()
+        with _workflow_engine_lock:
+            if _workflow_engine is None:
+                _workflow_engine = WorkflowEngine()
     return _workflow_engine